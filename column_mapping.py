@@ -0,0 +1,139 @@
+"""
+Column Mapping
+Resolves a CSV header to canonical fields once, then pulls every row's
+values by column index. Compiled mappings are cached by header
+fingerprint, so a feed whose header doesn't change is only ever resolved
+once per process.
+
+A field spec is an ordered mapping of canonical field -> header aliases;
+the first alias present in the header wins. Matching ignores case and
+surrounding whitespace.
+"""
+
+import csv
+import hashlib
+import threading
+from io import StringIO
+
+
+NBA_FIELDS = {
+    'salary': ('Salary',),
+    'position': ('Position', 'Pos'),
+    'team': ('Team',),
+    'opponent': ('Opp', 'Opponent'),
+    'injury': ('Injury',),
+    'min': ('Minutes', 'Min'),
+    'pts': ('Points', 'Pts'),
+    'reb': ('Rebounds', 'Reb'),
+    'ast': ('Assists', 'Ast'),
+    '3pm': ('3PM', 'Threes'),
+    'to': ('Turnovers', 'TO'),
+    'stl': ('Steals', 'Stl'),
+    'blk': ('Blocks', 'Blk'),
+    'pa': ('P+A', 'PA'),
+    'pr': ('P+R', 'PR'),
+    'pra': ('P+R+A', 'PRA'),
+    'bs': ('B+S', 'BS'),
+    'ra': ('R+A', 'RA'),
+    'fpts': ('FPTS', 'Fantasy Points'),
+}
+
+NFL_FIELDS = {
+    'salary': ('Salary',),
+    'position': ('Position', 'Pos'),
+    'team': ('Team',),
+    'opponent': ('Opp', 'Opponent'),
+    'injury': ('Injury',),
+    'pass_att': ('Pass Att', 'ATT', 'PAATT'),
+    'pass_yds': ('Pass Yds', 'PASS YDS', 'pass_yds', 'PAYDS'),
+    'pass_td': ('Pass TD', 'pass_td', 'PATD'),
+    'int': ('Int',),
+    'rush_att': ('Rush Att', 'rush_att', 'RUATT'),
+    'rush_yds': ('Rush Yds', 'rush_yds', 'RUYDS'),
+    'rush_td': ('Rush TD', 'rush_td', 'RUTD'),
+    'rec': ('Rec',),
+    'rec_yds': ('Rec Yds', 'rec_yds', 'REYDS'),
+    'rec_td': ('Rec TD', 'rec_td', 'RETD'),
+    'fpts': ('FPTS',),
+}
+
+NHL_FIELDS = {
+    'salary': ('Salary',),
+    'position': ('Position', 'Pos'),
+    'team': ('Team',),
+    'opponent': ('Opp', 'Opponent'),
+    'goals': ('Goals', 'G'),
+    'assists': ('Assists', 'A', 'AST'),
+    'points': ('Points', 'Pts'),
+    'sog': ('SOG', 'Shots'),
+    'blocks': ('Blocks', 'Blk'),
+    'pim': ('PIM',),
+    'fpts': ('FPTS',),
+}
+
+PLAYER_ALIASES = ('Player', 'Name', 'PLAYER')
+
+_compiled = {}
+_compiled_lock = threading.Lock()
+
+
+def normalize(name):
+    return name.strip().lower()
+
+
+def header_fingerprint(header):
+    """Stable fingerprint of a header row"""
+    return hashlib.sha1('\x1f'.join(header).encode('utf-8')).hexdigest()
+
+
+def resolve(header, aliases):
+    """Index of the first alias present in the header, or None"""
+    positions = {}
+    for index, name in enumerate(header):
+        positions.setdefault(normalize(name), index)
+    for alias in aliases:
+        index = positions.get(normalize(alias))
+        if index is not None:
+            return index
+    return None
+
+
+def compile_mapping(header, fields, key_aliases=PLAYER_ALIASES):
+    """(key index, ((field, index), ...)) for a header, cached by fingerprint"""
+    cache_key = (header_fingerprint(header), tuple(fields.items()), key_aliases)
+    mapping = _compiled.get(cache_key)
+    if mapping is None:
+        mapping = (
+            resolve(header, key_aliases),
+            tuple((field, resolve(header, aliases)) for field, aliases in fields.items()),
+        )
+        with _compiled_lock:
+            _compiled[cache_key] = mapping
+    return mapping
+
+
+def parse_players(csv_content, fields, key_aliases=PLAYER_ALIASES):
+    """Map a projection CSV to {player: {field: value}} in one pass
+
+    Fields missing from the header come back as ''.
+    """
+    reader = csv.reader(StringIO(csv_content.lstrip('\ufeff')))
+    header = next(reader, None)
+    if not header:
+        return {}
+
+    key_index, columns = compile_mapping(header, fields, key_aliases)
+    if key_index is None:
+        return {}
+
+    players = {}
+    for row in reader:
+        width = len(row)
+        player_name = row[key_index] if key_index < width else ''
+        if not player_name:
+            continue
+        players[player_name] = {
+            field: row[index] if index is not None and index < width else ''
+            for field, index in columns
+        }
+    return players
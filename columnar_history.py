@@ -0,0 +1,250 @@
+"""
+Columnar History
+Parquet copy of every new history snapshot, partitioned as
+source=<source>/sport=<sport>/date=<YYYY-MM-DD>/ with a snapshot_ts column
+and typed numeric columns. Queries open only the partitions in their date
+range and read only the columns they ask for.
+
+    python columnar_history.py --query rotogrinders nhl --columns PLAYER FPTS --days 7
+    python columnar_history.py --compact
+"""
+
+import os
+import csv
+import hashlib
+from io import StringIO
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+
+SNAPSHOT_TS = 'snapshot_ts'
+STAT_TYPE = 'stat_type'
+COMPACTED_NAME = 'compacted.parquet'
+
+
+def split_name(name):
+    """Split a snapshot name like 'stokastic_nfl_passing' into (source, sport, stat_type)"""
+    parts = name.split('_', 2)
+    source = parts[0]
+    sport = parts[1] if len(parts) > 1 else None
+    stat_type = parts[2] if len(parts) > 2 else None
+    return source, sport, stat_type
+
+
+def typed_column(values):
+    """Arrow array for one CSV column: float64 when every value is numeric, else string"""
+    present = values.notna() & (values.str.strip() != '')
+    if not present.any():
+        return pa.nulls(len(values))
+
+    numbers = pd.to_numeric(
+        values.str.strip().str.replace(',', '', regex=False).str.rstrip('%'),
+        errors='coerce'
+    )
+    if numbers[present].notna().all():
+        return pa.array(numbers.where(present, None), type=pa.float64(), from_pandas=True)
+
+    return pa.array(values.where(present, None), type=pa.string(), from_pandas=True)
+
+
+def unique_names(header):
+    """Make repeated column names unique the way pandas does (YDS, YDS.1, ...)"""
+    seen = {}
+    names = []
+    for name in header:
+        name = name.strip()
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        names.append(f"{name}.{count}" if count else name)
+    return names
+
+
+def csv_to_table(csv_content, snapshot_ts, stat_type=None):
+    """Parse a projection CSV into a typed Arrow table with snapshot columns"""
+    rows = [row for row in csv.reader(StringIO(csv_content.lstrip('\ufeff'))) if row]
+    names = unique_names(rows[0]) if rows else []
+    width = len(names)
+
+    # Some exports carry rows with a stray extra field; keep them aligned to the header
+    body = [(row + [''] * width)[:width] for row in rows[1:]]
+    frame = pd.DataFrame(body, columns=names, dtype=str)
+
+    arrays = [typed_column(frame[column]) for column in names]
+
+    arrays.append(pa.array([snapshot_ts] * len(frame), type=pa.timestamp('s')))
+    names.append(SNAPSHOT_TS)
+    arrays.append(pa.array([stat_type] * len(frame), type=pa.string()))
+    names.append(STAT_TYPE)
+
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def read_schema(paths, columns=None):
+    """One read schema for part files whose column types drift between snapshots
+
+    A column that is numeric in one snapshot and text in another (PARTNERID,
+    or TEAM in all-star weeks) is read as string; a column that is blank in
+    every part is read as string too. Only the given columns are considered.
+    """
+    types = {}
+    for path in paths:
+        for field in pq.read_schema(path):
+            if columns is None or field.name in columns:
+                types.setdefault(field.name, set()).add(field.type)
+
+    fields = []
+    for name, kinds in types.items():
+        kinds = {kind for kind in kinds if not pa.types.is_null(kind)}
+        fields.append(pa.field(name, kinds.pop() if len(kinds) == 1 else pa.string()))
+    return pa.schema(fields)
+
+
+class ColumnarHistory:
+    """Partitioned Parquet store fed from HistoryStore.save"""
+
+    def __init__(self, root='data/history_columnar'):
+        self.root = root
+
+    @property
+    def available(self):
+        return pa is not None
+
+    def partition_dir(self, source, sport, date):
+        return os.path.join(self.root, f'source={source}', f'sport={sport}', f'date={date}')
+
+    def append(self, name, csv_content, timestamp):
+        """Write one snapshot as a new part file in its partition; returns the path"""
+        source, sport, stat_type = split_name(name)
+        snapshot_ts = datetime.strptime(timestamp, '%Y-%m-%d_%H-%M')
+        table = csv_to_table(csv_content, snapshot_ts, stat_type)
+
+        directory = self.partition_dir(source, sport, snapshot_ts.strftime('%Y-%m-%d'))
+        os.makedirs(directory, exist_ok=True)
+
+        digest = hashlib.sha256(csv_content.encode('utf-8')).hexdigest()[:8]
+        path = os.path.join(directory, f"part-{timestamp}-{stat_type or 'all'}-{digest}.parquet")
+        pq.write_table(table, path, compression='zstd')
+        return path
+
+    def partition_files(self, source, sport, since=None, until=None):
+        """Parquet files for one source/sport, pruned to dates in [since, until]"""
+        base = os.path.join(self.root, f'source={source}', f'sport={sport}')
+        if not os.path.isdir(base):
+            return []
+
+        since_key = since.strftime('%Y-%m-%d') if since else None
+        until_key = until.strftime('%Y-%m-%d') if until else None
+
+        files = []
+        for partition in sorted(os.listdir(base)):
+            date = partition.split('=', 1)[-1]
+            if (since_key and date < since_key) or (until_key and date > until_key):
+                continue
+            directory = os.path.join(base, partition)
+            files.extend(
+                os.path.join(directory, name)
+                for name in sorted(os.listdir(directory)) if name.endswith('.parquet')
+            )
+        return files
+
+    def query(self, source, sport, columns=None, since=None, until=None, stat_type=None):
+        """Rows for one source/sport as a DataFrame, reading only the needed partitions and columns"""
+        files = self.partition_files(source, sport, since, until)
+        if not files:
+            return pd.DataFrame(columns=(columns or []) + [SNAPSHOT_TS])
+
+        # Snapshots add and drop columns and change their types over time;
+        # build the read schema from every footer, limited to what's asked for
+        needed = set(columns) | {SNAPSHOT_TS, STAT_TYPE} if columns else None
+        schema = read_schema(files, needed)
+        dataset = ds.dataset(files, schema=schema, format='parquet')
+
+        wanted = None
+        if columns:
+            wanted = [c for c in columns if c in schema.names and c != SNAPSHOT_TS] + [SNAPSHOT_TS]
+
+        condition = None
+        for expression in (
+            ds.field(SNAPSHOT_TS) >= pa.scalar(since, pa.timestamp('s')) if since else None,
+            ds.field(SNAPSHOT_TS) <= pa.scalar(until, pa.timestamp('s')) if until else None,
+            ds.field(STAT_TYPE) == stat_type if stat_type else None,
+        ):
+            if expression is not None:
+                condition = expression if condition is None else condition & expression
+
+        return dataset.to_table(columns=wanted, filter=condition).to_pandas()
+
+    def compact(self, before=None):
+        """Merge each closed day's part files into one file
+
+        Returns every path it changed, the compacted files written and the
+        part files removed, so the caller can commit them.
+        """
+        before_key = (before or datetime.now()).strftime('%Y-%m-%d')
+        changed = []
+
+        for directory, _subdirs, names in os.walk(self.root):
+            parts = sorted(name for name in names if name.startswith('part-') and name.endswith('.parquet'))
+            date = os.path.basename(directory).split('=', 1)[-1]
+            if not parts or not os.path.basename(directory).startswith('date=') or date >= before_key:
+                continue
+
+            paths = [os.path.join(directory, name) for name in parts]
+            if COMPACTED_NAME in names:
+                paths.insert(0, os.path.join(directory, COMPACTED_NAME))
+
+            table = ds.dataset(paths, schema=read_schema(paths), format='parquet').to_table()
+
+            compacted_path = os.path.join(directory, COMPACTED_NAME)
+            tmp_path = os.path.join(directory, f'.{COMPACTED_NAME}.tmp')
+            pq.write_table(table, tmp_path, compression='zstd')
+            os.replace(tmp_path, compacted_path)
+            changed.append(compacted_path)
+            for name in parts:
+                os.remove(os.path.join(directory, name))
+                changed.append(os.path.join(directory, name))
+
+        return changed
+
+
+def main():
+    """Command-line entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Query or compact the columnar projection history')
+    parser.add_argument('--root', default='data/history_columnar', help='Store root (default: data/history_columnar)')
+    parser.add_argument('--query', nargs=2, metavar=('SOURCE', 'SPORT'), help='Print rows for a source and sport')
+    parser.add_argument('--columns', nargs='+', help='Columns to read (default: all)')
+    parser.add_argument('--days', type=int, default=7, help='How many days back to query (default: 7)')
+    parser.add_argument('--compact', action='store_true', help='Merge part files of finished days')
+    args = parser.parse_args()
+
+    if pa is None:
+        print("❌ pyarrow is not installed (pip install pyarrow)")
+        return
+
+    store = ColumnarHistory(args.root)
+
+    if args.compact:
+        changed = store.compact()
+        partitions = sum(1 for path in changed if path.endswith(COMPACTED_NAME))
+        print(f"✓ Compacted {partitions} partitions ({len(changed) - partitions} part files merged)")
+
+    if args.query:
+        source, sport = args.query
+        since = datetime.now() - timedelta(days=args.days)
+        frame = store.query(source, sport, columns=args.columns, since=since)
+        print(f"{len(frame)} rows from {frame[SNAPSHOT_TS].nunique() if len(frame) else 0} snapshots")
+        print(frame.tail(20).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Consensus Projections
+Aligns the latest projections from every source for a sport by canonical
+player ID and stat, then computes consensus mean, median, spread, standard
+deviation and each source's deviation from the mean as whole-array NumPy
+operations over a (player-stat x source) matrix.
+
+Each source's aligned column is cached against the snapshots it was built
+from. When one source refreshes, only that source's column is rebuilt and
+the matrix statistics are recomputed; results for a snapshot set that has
+been seen before come straight from the cache.
+
+Only one slate is compared at a time: a feed whose newest snapshot is more
+than SLATE_WINDOW_HOURS older than the newest feed's (or than --as-of) is
+left out rather than averaged in with projections for other games.
+
+    python consensus.py --sport nba --stat pts --top 20
+    python consensus.py --sport nhl --as-of 2025-12-22_18-00
+"""
+
+import warnings
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from columnar_history import split_name
+from history_store import TIMESTAMP_FORMAT, HistoryStore
+from player_identity import PlayerIdentityIndex
+from projection_schema import CanonicalCache
+
+
+# Feeds compared together must have snapshots this close to the newest one
+SLATE_WINDOW_HOURS = 12
+
+
+class ConsensusEngine:
+    """Cross-source consensus with per-source columns cached by snapshot"""
+
+    def __init__(self, history_dir='data/history', identity=None, canonical=None):
+        self.history = HistoryStore(history_dir)
+        self.identity = identity or PlayerIdentityIndex()
+        self.canonical = canonical or CanonicalCache()
+        self.columns = {}   # (sport, source) -> (snapshot key, Series by (player_id, stat))
+        self.results = {}   # (sport, snapshot set key) -> DataFrame
+
+    def latest_feeds(self, sport, as_of=None, window_hours=SLATE_WINDOW_HOURS):
+        """Newest snapshot of each feed for one slate of a sport, grouped by source
+
+        The slate is anchored at as_of (a history timestamp) or at the newest
+        feed's snapshot; feeds with nothing in the window before it are left out.
+        """
+        digests = {(e['name'], e['ts']): e['sha256'] for e in self.history.entries()}
+        newest = {}
+        for name, timestamp, path in self.history.snapshots():
+            if split_name(name)[1] == sport and (as_of is None or timestamp <= as_of):
+                newest[name] = (name, timestamp, path, digests.get((name, timestamp)))
+        if not newest:
+            return {}
+
+        anchor = datetime.strptime(as_of or max(s[1] for s in newest.values()), TIMESTAMP_FORMAT)
+        start = (anchor - timedelta(hours=window_hours)).strftime(TIMESTAMP_FORMAT)
+        stale = sorted(f"{name} ({timestamp})" for name, timestamp, _path, _digest in newest.values()
+                       if timestamp < start)
+        if stale:
+            print(f"  ⚠️ Leaving out feeds from another slate: {', '.join(stale)}")
+
+        feeds = {}
+        for name, snapshot in sorted(newest.items()):
+            if snapshot[1] >= start:
+                feeds.setdefault(split_name(name)[0], []).append(snapshot)
+        return feeds
+
+    def source_column(self, sport, source, snapshots):
+        """One source's values indexed by (player_id, stat); rebuilt only when its snapshots change"""
+        key = tuple((name, timestamp) for name, timestamp, _path, _digest in snapshots)
+        cached = self.columns.get((sport, source))
+        if cached and cached[0] == key:
+            return cached[1]
+
+        frames = [self.canonical.snapshot(name, ts, path, digest) for name, ts, path, digest in snapshots]
+        frame = pd.concat(frames, ignore_index=True)
+        frame['player_id'] = self.identity.resolve_frame(frame)
+
+        column = (
+            frame.dropna(subset=['player_id'])
+            .drop_duplicates(['player_id', 'stat'], keep='last')
+            .set_index(['player_id', 'stat'])['value']
+            .astype('float64')
+        )
+        self.columns[(sport, source)] = (key, column)
+        return column
+
+    def compute(self, sport, feeds=None, as_of=None):
+        """Consensus table for one slate of a sport: one row per (player_id, stat)"""
+        feeds = feeds or self.latest_feeds(sport, as_of)
+        set_key = tuple(sorted(
+            (source, tuple((name, ts) for name, ts, _path, _digest in snapshots))
+            for source, snapshots in feeds.items()
+        ))
+        if (sport, set_key) in self.results:
+            return self.results[(sport, set_key)]
+
+        sources = sorted(feeds)
+        columns = [self.source_column(sport, source, feeds[source]) for source in sources]
+        if not columns:
+            return pd.DataFrame()
+
+        index = columns[0].index
+        for column in columns[1:]:
+            index = index.union(column.index)
+
+        # (pairs x sources) matrix; NaN where a source has no projection
+        values = np.column_stack([column.reindex(index).to_numpy() for column in columns])
+        present = ~np.isnan(values)
+        counts = present.sum(axis=1)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            mean = np.nanmean(values, axis=1)
+            median = np.nanmedian(values, axis=1)
+            spread = np.nanmax(values, axis=1) - np.nanmin(values, axis=1)
+            std = np.nanstd(values, axis=1)
+        deviation = values - mean[:, None]
+
+        result = pd.DataFrame({
+            'mean': mean,
+            'median': median,
+            'spread': spread,
+            'std': std,
+            'n_sources': counts,
+        }, index=index)
+        for position, source in enumerate(sources):
+            result[f'value_{source}'] = values[:, position]
+            result[f'dev_{source}'] = deviation[:, position]
+
+        names = {pid: player['name'] for pid, player in self.identity.players.items()}
+        result.insert(0, 'player', result.index.get_level_values('player_id').map(names))
+
+        self.results[(sport, set_key)] = result
+        return result
+
+
+def main():
+    """Command-line entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Cross-source consensus projections')
+    parser.add_argument('--sport', default='nba', choices=['nba', 'nfl', 'nhl'], help='Sport (default: nba)')
+    parser.add_argument('--stat', default='pts', help='Stat to show (default: pts)')
+    parser.add_argument('--min-sources', type=int, default=2, help='Only players covered by this many sources')
+    parser.add_argument('--top', type=int, default=20, help='Rows to show, widest spread first')
+    parser.add_argument('--as-of', help='Slate as of this history timestamp, e.g. 2025-12-22_18-00 (default: newest)')
+    args = parser.parse_args()
+
+    if args.as_of:
+        try:
+            datetime.strptime(args.as_of, TIMESTAMP_FORMAT)
+        except ValueError:
+            parser.error('--as-of must look like 2025-12-22_18-00')
+
+    engine = ConsensusEngine()
+    result = engine.compute(args.sport, as_of=args.as_of)
+    engine.identity.save()
+
+    if result.empty:
+        print(f"No {args.sport.upper()} snapshots found")
+        return
+
+    rows = result.xs(args.stat, level='stat', drop_level=True) if args.stat in result.index.get_level_values('stat') \
+        else result.iloc[0:0]
+    rows = rows[rows['n_sources'] >= args.min_sources].sort_values('spread', ascending=False)
+    print(f"{len(rows)} players with {args.stat} from {args.min_sources}+ sources")
+    print(rows.head(args.top).round(2).to_string())
+
+
+if __name__ == "__main__":
+    main()
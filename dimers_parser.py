@@ -0,0 +1,108 @@
+"""
+Dimers Parser
+Dimers NFL exports repeat YDS for passing, rushing and receiving and end
+with bare touchdown-probability columns (1+, 2+, 3+, 1st). Names are
+assigned by position: YDS after CMP is passing, YDS after REC is
+receiving, any other YDS is rushing, and the probability columns become
+TD/1+, TD/2+, TD/3+ and TD/1st. NBA headers pass through unchanged.
+
+load_dimers() returns a typed frame in one vectorized pass: numeric and
+percentage columns as floats (percentages stay in percent units), Matchup
+split into team/opp/home, and Last Updated as a UTC timestamp.
+"""
+
+import csv
+from io import StringIO
+
+import pandas as pd
+
+
+TD_PROBABILITY_COLUMNS = ('1+', '2+', '3+', '1st')
+TEXT_COLUMNS = ('First Name', 'Last Name', 'Team', 'Matchup', 'Last Updated')
+
+
+def qualified_names(header):
+    """Positional, unambiguous names for a Dimers header"""
+    names = []
+    group = None
+    passing_yards = False
+
+    for column in (c.strip() for c in header):
+        if column == 'CMP':
+            group = 'Passing'
+            names.append('Passing/CMP')
+        elif column == 'REC':
+            group = 'Receiving'
+            names.append('Receiving/REC')
+        elif column == 'YDS':
+            if group == 'Passing' and not passing_yards:
+                passing_yards = True
+                names.append('Passing/YDS')
+            elif group == 'Receiving':
+                names.append('Receiving/YDS')
+            else:
+                group = 'Rushing'
+                names.append('Rushing/YDS')
+        elif column in TD_PROBABILITY_COLUMNS:
+            names.append(f'TD/{column}')
+        else:
+            names.append(column)
+
+    # A layout we haven't seen could still repeat a name; keep them unique
+    seen = {}
+    unique = []
+    for name in names:
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        unique.append(f"{name}.{count}" if count else name)
+    return unique
+
+
+def read_dimers(csv_content):
+    """(qualified header, text rows) for projection_schema's reader registry"""
+    rows = [row for row in csv.reader(StringIO(csv_content.lstrip('\ufeff'))) if any(row)]
+    if not rows:
+        return [], []
+    header = qualified_names(rows[0])
+    width = len(header)
+    return header, [(row + [''] * width)[:width] for row in rows[1:]]
+
+
+def split_matchup(frame):
+    """Add away/home-aware opp and home columns from 'AWAY vs. HOME' matchups"""
+    sides = frame['Matchup'].fillna('').str.split(r'\s+vs\.?\s+', n=1, expand=True, regex=True)
+    away = sides[0].str.strip()
+    home = sides[1].fillna('').str.strip() if sides.shape[1] > 1 else pd.Series('', index=frame.index)
+
+    frame['home'] = frame['Team'] == home
+    frame['opp'] = home.where(frame['Team'] == away, away).where(home != '', None)
+    return frame
+
+
+def load_dimers(csv_content):
+    """Typed DataFrame of a Dimers export"""
+    header = next(csv.reader(StringIO(csv_content.lstrip('\ufeff'))), [])
+    names = qualified_names(header)
+
+    frame = pd.read_csv(
+        StringIO(csv_content.lstrip('\ufeff')),
+        header=None, skiprows=1, names=names, dtype=str,
+        keep_default_na=False, na_values=[''],
+    )
+
+    for column in names:
+        if column in TEXT_COLUMNS:
+            continue
+        frame[column] = pd.to_numeric(
+            frame[column].str.strip().str.rstrip('%').str.replace(',', '', regex=False),
+            errors='coerce'
+        )
+
+    if 'First Name' in frame and 'Last Name' in frame:
+        frame.insert(0, 'player', (frame['First Name'].fillna('') + ' ' + frame['Last Name'].fillna('')).str.strip())
+    if 'Matchup' in frame and 'Team' in frame:
+        frame = split_matchup(frame)
+    if 'Last Updated' in frame:
+        frame['Last Updated'] = pd.to_datetime(frame['Last Updated'], utc=True, errors='coerce')
+
+    return frame
@@ -7,7 +7,6 @@ import os
 import sys
 import time
 import json
-import subprocess
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -16,21 +15,29 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
 
+from page_readiness import PageReadiness
+from resource_blocking import apply_resource_blocking, blocking_prefs
+from download_watcher import DownloadWatcher, set_download_directory
+from history_store import HistoryStore
+from git_publish import commit_and_push
+
 
 class DimersScraper:
     """Dimers scraper with GitHub integration"""
     
-    def __init__(self, config):
+    def __init__(self, config, data_dir='data'):
         self.config = config
         self.driver = None
-        self.data_dir = 'data'
-        self.history_dir = 'data/history'
+        self.data_dir = data_dir
+        self.history_dir = os.path.join(data_dir, 'history')
         self.download_dir = os.path.abspath(self.data_dir)
         self.scraped_data = {}
+        self.written_files = []
         
         # Create data directories
         os.makedirs(self.data_dir, exist_ok=True)
         os.makedirs(self.history_dir, exist_ok=True)
+        self.history = HistoryStore(self.history_dir)
     
     def setup_driver(self, headless=True):
         """Setup Chrome webdriver"""
@@ -50,10 +57,13 @@ class DimersScraper:
             'download.directory_upgrade': True,
             'safebrowsing.enabled': True,
         }
+        prefs.update(blocking_prefs(self.config))
         chrome_options.add_experimental_option('prefs', prefs)
         
         self.driver = webdriver.Chrome(options=chrome_options)
         self.wait = WebDriverWait(self.driver, 20)
+        self.ready = PageReadiness(self.driver)
+        apply_resource_blocking(self.driver, 'dimers', self.config)
         print(f"✓ Browser initialized (downloads to: {self.download_dir})")
     
     def login(self):
@@ -63,14 +73,12 @@ class DimersScraper:
         try:
             # Go to NBA projections page first
             self.driver.get('https://www.dimers.com/nba/player-projections')
-            time.sleep(4)
+            self.wait_for_projections_table('login')
             
             # Dismiss any popups first
             print("  Dismissing popups...")
             self.dismiss_popups()
-            time.sleep(2)
             self.dismiss_popups()  # Try again for second popup
-            time.sleep(1)
             
             self.driver.save_screenshot('debug_dimers_after_popup.png')
             
@@ -130,11 +138,10 @@ class DimersScraper:
             
             if clicked_login:
                 print(f"  ✓ {clicked_login}")
-                time.sleep(4)
+                self.ready.wait_for('login: auth redirect', lambda d: 'auth' in d.current_url.lower() or 'login' in d.current_url.lower())
             else:
                 print("  Could not find Log In button, navigating directly...")
                 self.driver.get('https://auth.dimers.com/u/login')
-                time.sleep(3)
             
             # Now we should be on the auth page
             current_url = self.driver.current_url
@@ -145,10 +152,10 @@ class DimersScraper:
             if 'auth' not in current_url.lower() and 'login' not in current_url.lower():
                 print("  ⚠️ Not on auth page, trying direct navigation...")
                 self.driver.get('https://auth.dimers.com/u/login')
-                time.sleep(3)
+            
+            self.ready.element_visible(By.CSS_SELECTOR, "input[type='password']", label='login: auth form')
             
             # Find and fill email field
-            email_field = None
             email_selectors = [
                 "input[name='username']",
                 "input[name='email']",
@@ -157,18 +164,10 @@ class DimersScraper:
                 "input#username",
             ]
             
-            for selector in email_selectors:
-                try:
-                    fields = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for field in fields:
-                        if field.is_displayed():
-                            email_field = field
-                            break
-                    if email_field:
-                        break
-                except:
-                    continue
-            
+            email_field = self.ready.any_visible(
+                [(By.CSS_SELECTOR, selector) for selector in email_selectors],
+                label='login: email field', timeout=5
+            )
             if not email_field:
                 print("  ❌ Could not find email field")
                 self.driver.save_screenshot('debug_dimers_no_email.png')
@@ -177,7 +176,6 @@ class DimersScraper:
             email_field.clear()
             email_field.send_keys(self.config.get('dimers_username', ''))
             print("  ✓ Filled email")
-            time.sleep(0.5)
             
             # Find and fill password
             password_field = None
@@ -193,7 +191,6 @@ class DimersScraper:
             password_field.clear()
             password_field.send_keys(self.config.get('dimers_password', ''))
             print("  ✓ Filled password")
-            time.sleep(0.5)
             
             # Click submit button
             clicked = self.driver.execute_script("""
@@ -218,16 +215,15 @@ class DimersScraper:
                 return False
             
             # Wait for redirect
-            time.sleep(6)
+            self.ready.wait_for('login: redirect from auth', lambda d: 'auth.dimers.com' not in d.current_url)
             self.driver.save_screenshot('debug_dimers_after_login.png')
             
             # Navigate to projections page to verify
             self.driver.get('https://www.dimers.com/nba/player-projections')
-            time.sleep(4)
+            self.wait_for_projections_table('login: verify', unlocked=True)
             
             # Dismiss any new popups
             self.dismiss_popups()
-            time.sleep(1)
             
             # Verify login by checking for unlocked data
             is_logged_in = self.driver.execute_script("""
@@ -256,73 +252,51 @@ class DimersScraper:
             traceback.print_exc()
             return False
     
-    def wait_for_download(self, timeout=15):
-        """Wait for a CSV file to download"""
-        downloads_folder = os.path.join(os.path.expanduser('~'), 'Downloads')
+    def wait_for_projections_table(self, label, unlocked=False, timeout=20):
+        """Wait for the projections table to render (and optionally show unlocked numbers)"""
+        self.ready.table_has_rows(min_rows=5, selector='table tbody tr', label=f"{label}: table rows", timeout=timeout)
         
-        folders_to_check = [self.download_dir, downloads_folder]
+        if unlocked:
+            # Same check login() uses - real numbers rather than lock icons
+            return self.ready.js_condition(
+                f"{label}: unlocked data",
+                """
+                    var cells = document.querySelectorAll('td');
+                    var numberCount = 0;
+                    for (var i = 0; i < cells.length; i++) {
+                        if (/^\\d+\\.\\d+$/.test(cells[i].textContent.trim())) numberCount++;
+                    }
+                    return numberCount > 20;
+                """,
+                timeout=5
+            )
         
+        return True
+    
+    def wait_for_download(self, watcher, timeout=15):
+        """Wait for the projections CSV to finish downloading into this job's directory"""
         print(f"  Waiting for download...")
         
-        # Wait a few seconds for download to complete
-        time.sleep(3)
+        start = time.monotonic()
+        csv_path = watcher.wait(accept=lambda name: name.endswith('.csv'), timeout=timeout)
+        self.ready.record('download: projections CSV', time.monotonic() - start, csv_path is not None)
         
-        # Find the most recently modified projections file
-        best_file = None
-        best_mtime = 0
+        if not csv_path:
+            print(f"  ⚠️ No projections file downloaded")
+            return None
         
-        for folder in folders_to_check:
-            if not os.path.exists(folder):
-                continue
-            
-            for f in os.listdir(folder):
-                if not f.endswith('.csv'):
-                    continue
-                if f.endswith('.crdownload'):
-                    continue
-                
-                # Look for projection files (Dimers uses "player_projections")
-                if 'projections' not in f.lower() and 'player' not in f.lower():
-                    continue
-                    
-                full_path = os.path.join(folder, f)
-                
-                try:
-                    mtime = os.path.getmtime(full_path)
-                    age = time.time() - mtime
-                    
-                    # Only consider files from last 30 seconds
-                    if age < 30 and mtime > best_mtime:
-                        best_mtime = mtime
-                        best_file = full_path
-                except:
-                    continue
+        print(f"  ✓ Found: {os.path.basename(csv_path)} ({time.monotonic() - start:.2f}s)")
         
-        if best_file:
-            age = time.time() - best_mtime
-            print(f"  ✓ Found: {os.path.basename(best_file)} ({age:.0f}s ago)")
+        try:
+            with open(csv_path, 'r', encoding='utf-8') as file:
+                content = file.read()
             
-            try:
-                with open(best_file, 'r', encoding='utf-8') as file:
-                    content = file.read()
-                
-                lines = content.strip().split('\n')
-                print(f"    ✓ {len(lines)} rows")
-                
-                # Clean up the temp file (Chrome's auto-named download)
-                try:
-                    os.remove(best_file)
-                    print(f"    ✓ Cleaned up temp file")
-                except:
-                    pass
-                
-                return content
-            except Exception as e:
-                print(f"    ⚠️ Error reading: {e}")
-                return None
-        
-        print(f"  ⚠️ No recent projections file found")
-        return None
+            lines = content.strip().split('\n')
+            print(f"    ✓ {len(lines)} rows")
+            return content
+        except Exception as e:
+            print(f"    ⚠️ Error reading: {e}")
+            return None
     
     def dismiss_popups(self):
         """Dismiss any popups/modals on the page"""
@@ -384,7 +358,6 @@ class DimersScraper:
                 // Press Escape key
                 document.dispatchEvent(new KeyboardEvent('keydown', {key: 'Escape', keyCode: 27, bubbles: true}));
             """)
-            time.sleep(0.5)
         
         # Also try clicking outside modals
         try:
@@ -402,11 +375,16 @@ class DimersScraper:
         
         print(f"\n=== Scraping Dimers {sport.upper()} ===")
         
+        # The CSV downloads into a private directory for this sport only
+        watcher = DownloadWatcher(prefix=f'dimers_{sport_lower}_')
+        
         try:
+            set_download_directory(self.driver, watcher.directory)
+            
             # Navigate to the sport-specific URL
             print(f"  Navigating to {url}...")
             self.driver.get(url)
-            time.sleep(5)
+            self.wait_for_projections_table(sport_lower)
             
             # Verify we're on the correct page
             current_url = self.driver.current_url
@@ -415,11 +393,10 @@ class DimersScraper:
             if sport_lower not in current_url.lower():
                 print(f"  ⚠️ URL doesn't contain '{sport_lower}' - trying again...")
                 self.driver.get(url)
-                time.sleep(3)
+                self.wait_for_projections_table(f"{sport_lower}: retry")
             
             # Dismiss any popups
             self.dismiss_popups()
-            time.sleep(1)
             
             # DON'T click Player Projections tab - we're already on that page via URL
             # The tab click was causing navigation issues
@@ -434,11 +411,11 @@ class DimersScraper:
             if sport_lower == 'nba' and 'NBA' not in self.driver.page_source:
                 print(f"  ⚠️ Page doesn't seem to be NBA - refreshing...")
                 self.driver.get(url)
-                time.sleep(5)
+                self.wait_for_projections_table(f"{sport_lower}: refresh")
             elif sport_lower == 'nfl' and 'NFL' not in self.driver.page_source and 'Football' not in self.driver.page_source:
                 print(f"  ⚠️ Page doesn't seem to be NFL - refreshing...")
                 self.driver.get(url)
-                time.sleep(5)
+                self.wait_for_projections_table(f"{sport_lower}: refresh")
             
             # Click Download CSV button
             clicked = False
@@ -446,13 +423,11 @@ class DimersScraper:
             try:
                 # First scroll to top of page
                 self.driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(1)
                 
                 # Close any open popups
                 self.driver.execute_script("""
                     document.dispatchEvent(new KeyboardEvent('keydown', {key: 'Escape', keyCode: 27, bubbles: true}));
                 """)
-                time.sleep(0.5)
                 
                 # Find the Download CSV button - rightmost element with exact text
                 download_btn = self.driver.execute_script("""
@@ -497,7 +472,6 @@ class DimersScraper:
                 print(f"  Click error: {e}")
             
             if clicked:
-                time.sleep(2)
                 self.driver.save_screenshot(f'debug_dimers_{sport_lower}_after_click.png')
             else:
                 print("  ❌ Could not find Download CSV button")
@@ -518,22 +492,14 @@ class DimersScraper:
                 return None
             
             # Wait for download
-            csv_content = self.wait_for_download()
+            csv_content = self.wait_for_download(watcher)
             
             if csv_content:
-                # Save current file
+                # One atomic write publishes the current CSV and the historical copy
                 csv_file = os.path.join(self.data_dir, f'dimers_{sport_lower}.csv')
-                with open(csv_file, 'w', encoding='utf-8') as f:
-                    f.write(csv_content)
+                self.save_historical(sport_lower, csv_content, csv_file)
                 print(f"  ✓ Saved: dimers_{sport_lower}.csv")
                 
-                # Save historical copy
-                timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
-                hist_file = os.path.join(self.history_dir, f'dimers_{sport_lower}_{timestamp}.csv')
-                with open(hist_file, 'w', encoding='utf-8') as f:
-                    f.write(csv_content)
-                print(f"  ✓ Saved historical: dimers_{sport_lower}_{timestamp}.csv")
-                
                 return {'csv_saved': True, 'bytes': len(csv_content)}
             
             return None
@@ -543,42 +509,45 @@ class DimersScraper:
             import traceback
             traceback.print_exc()
             return None
+        
+        finally:
+            watcher.cleanup()
+    
+    def save_historical(self, sport, csv_content, current_file=None):
+        """Record a snapshot for historical analysis, publishing current_file too; identical payloads are stored once"""
+        filepath, written, files = self.history.save(f"dimers_{sport}", csv_content, current_path=current_file)
+        self.written_files.extend(f for f in files if f not in self.written_files)
+        if written:
+            print(f"  ✓ Saved historical: {os.path.basename(filepath)}")
+        else:
+            print(f"  ✓ Unchanged since {os.path.basename(filepath)}, recorded in manifest")
+        return filepath
     
     def git_commit_and_push(self):
-        """Commit and push data to GitHub"""
-        print("\n=== Pushing to GitHub ===")
+        """Commit the files written this run and push to GitHub"""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return commit_and_push(self.written_files, f'Update Dimers projections - {timestamp}')
+    
+    def scrape_sports(self, sports):
+        """Scrape sports with an already logged-in browser"""
+        results = {}
+        for sport in sports:
+            results[sport] = self.scrape_sport(sport)
+        return results
+    
+    def run_cycle(self, sports=None):
+        """One scrape with a browser that stays open between cycles
         
-        try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            result = subprocess.run(['git', 'status'], capture_output=True, text=True)
-            if result.returncode != 0:
-                print("❌ Not a git repository")
-                return False
-            
-            subprocess.run(['git', 'add', 'data/'], check=True)
-            
-            result = subprocess.run(['git', 'diff', '--staged', '--quiet'], capture_output=True)
-            if result.returncode == 0:
-                print("  No changes to commit")
-                return True
-            
-            subprocess.run(['git', 'commit', '-m', f'Update Dimers projections - {timestamp}'], check=True)
-            print("  ✓ Committed changes")
-            
-            result = subprocess.run(['git', 'push'], capture_output=True, text=True)
-            if result.returncode != 0:
-                print(f"  ⚠️ Push failed: {result.stderr}")
-                return False
-            
-            print("✓ Data pushed to GitHub")
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Git error: {str(e)}")
-            return False
+        login() returns early when the projections are already unlocked, so
+        this only goes through Auth0 again once the session has expired.
+        """
+        if not self.login():
+            print("Cannot continue without successful login")
+            return {}
+        
+        return self.scrape_sports(sports or ['nba', 'nfl'])
     
-    def scrape_all(self, headless=False, sports=None):
+    def scrape_all(self, headless=False, sports=None, push=True):
         """Scrape all sports and push to GitHub"""
         if sports is None:
             sports = ['nba', 'nfl']  # Dimers doesn't offer NHL projections
@@ -592,16 +561,16 @@ class DimersScraper:
                 print("Cannot continue without successful login")
                 return results
             
-            for sport in sports:
-                results[sport] = self.scrape_sport(sport)
+            results = self.scrape_sports(sports)
             
-            if any(results.values()):
+            if push and any(results.values()):
                 self.git_commit_and_push()
             
             return results
             
         finally:
             if self.driver:
+                self.ready.report()
                 self.driver.quit()
                 print("\n✓ Browser closed")
 
@@ -0,0 +1,145 @@
+"""
+Download Watcher
+Gives each browser download a private temp directory and reports the
+moment a finished file appears in it. On Linux this listens for inotify
+close-write/rename events (Chrome renames .crdownload to the final name
+when a download completes); elsewhere it falls back to a short poll of
+the private directory.
+"""
+
+import os
+import time
+import errno
+import select
+import shutil
+import struct
+import tempfile
+import ctypes
+import ctypes.util
+
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct('iIII')
+
+PARTIAL_SUFFIXES = ('.crdownload', '.tmp', '.part')
+
+
+def _load_inotify():
+    """Return libc with inotify functions, or None if unavailable"""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+_libc = _load_inotify()
+
+
+class DownloadWatcher:
+    """Private download directory with a completion watcher"""
+
+    def __init__(self, prefix='download_', poll_interval=0.05):
+        self.directory = tempfile.mkdtemp(prefix=prefix)
+        self.poll_interval = poll_interval
+        self.fd = None
+
+        # Start watching before anything can land in the directory
+        if _libc is not None:
+            fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd >= 0:
+                wd = _libc.inotify_add_watch(fd, self.directory.encode(), IN_CLOSE_WRITE | IN_MOVED_TO)
+                if wd >= 0:
+                    self.fd = fd
+                else:
+                    os.close(fd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.cleanup()
+
+    def is_complete(self, name, accept=None):
+        """A finished, non-partial file that the caller is interested in"""
+        if name.startswith('.') or name.endswith(PARTIAL_SUFFIXES):
+            return False
+        return accept is None or accept(name)
+
+    def completed_files(self, accept=None):
+        """Finished files already in the directory"""
+        return [
+            os.path.join(self.directory, name)
+            for name in sorted(os.listdir(self.directory))
+            if self.is_complete(name, accept)
+        ]
+
+    def read_events(self):
+        """Drain pending inotify events and return the file names they touched"""
+        names = []
+        while True:
+            try:
+                buf = os.read(self.fd, 4096)
+            except OSError as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    return names
+                raise
+
+            offset = 0
+            while offset + EVENT_HEADER.size <= len(buf):
+                _wd, _mask, _cookie, length = EVENT_HEADER.unpack_from(buf, offset)
+                offset += EVENT_HEADER.size
+                name = buf[offset:offset + length].rstrip(b'\0').decode('utf-8', 'replace')
+                offset += length
+                if name:
+                    names.append(name)
+
+    def wait(self, accept=None, timeout=15):
+        """Block until a finished file appears; return its path or None on timeout"""
+        deadline = time.monotonic() + timeout
+
+        while True:
+            done = self.completed_files(accept)
+            if done:
+                return done[0]
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+
+            if self.fd is not None:
+                readable, _, _ = select.select([self.fd], [], [], remaining)
+                if not readable:
+                    return None
+                for name in self.read_events():
+                    if self.is_complete(name, accept) and os.path.exists(os.path.join(self.directory, name)):
+                        return os.path.join(self.directory, name)
+            else:
+                time.sleep(min(self.poll_interval, remaining))
+
+    def cleanup(self):
+        """Stop watching and remove the private directory"""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def set_download_directory(driver, directory):
+    """Point Chrome's downloads at a directory for the current job"""
+    try:
+        driver.execute_cdp_cmd('Browser.setDownloadBehavior', {
+            'behavior': 'allow',
+            'downloadPath': directory,
+        })
+    except Exception:
+        # Older Chrome builds only expose the per-page command
+        driver.execute_cdp_cmd('Page.setDownloadBehavior', {
+            'behavior': 'allow',
+            'downloadPath': directory,
+        })
@@ -0,0 +1,160 @@
+"""
+Git Publish
+Commits exactly the files a run wrote and pushes once, shared by every
+scraper and the orchestrator.
+
+Instead of `git status` / `git add data/` / `git diff --staged`, which all
+stat the whole of data/history, only the given paths are staged with
+`git update-index`. The commit is built with plumbing: `git write-tree`
+reuses the index's cached trees for everything that didn't change,
+`git commit-tree` creates the commit, and `git update-ref` moves the
+branch only if HEAD is still where it was. Cost stays proportional to the
+files written, not to the size of the history.
+
+Scheduled runs can overlap, so a rejected push fetches, rebases the local
+snapshot commits onto the remote (falling back to a merge) and retries
+with bounded backoff. Snapshot files are new per run and the manifest and
+movement log merge line-wise (see .gitattributes), so the only overlapping
+edits are the current data/*.csv files, where this run's copy wins. Any
+commits left behind by an earlier failed push go out with the next one.
+"""
+
+import os
+import time
+import random
+import subprocess
+
+
+PUSH_ATTEMPTS = 5
+PUSH_BACKOFF = 2.0       # seconds, doubled after each failed attempt
+PUSH_BACKOFF_MAX = 30.0
+
+
+def git(*args, check=True):
+    """Run a git command and return its stripped stdout"""
+    result = subprocess.run(['git'] + list(args), capture_output=True, text=True)
+    if check and result.returncode != 0:
+        raise subprocess.CalledProcessError(result.returncode, ['git'] + list(args), result.stdout, result.stderr)
+    return result.stdout.strip()
+
+
+def head_commit():
+    """Current HEAD commit, or None on an unborn branch"""
+    result = subprocess.run(['git', 'rev-parse', '--verify', '-q', 'HEAD'], capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def commit_paths(paths, message):
+    """Commit just these files; returns the new commit, or None if nothing changed"""
+    paths = sorted(set(paths))
+    present = [p for p in paths if os.path.exists(p)]
+    removed = [p for p in paths if not os.path.exists(p)]
+    if present:
+        git('update-index', '--add', '--', *present)
+    if removed:
+        git('update-index', '--force-remove', '--', *removed)
+
+    tree = git('write-tree')
+    parent = head_commit()
+    if parent and git('rev-parse', f'{parent}^{{tree}}') == tree:
+        return None
+
+    parent_args = ['-p', parent] if parent else []
+    commit = git('commit-tree', tree, *parent_args, '-m', message)
+    # Compare-and-swap: fails instead of dropping a commit made meanwhile
+    git('update-ref', '-m', f'commit: {message}', 'HEAD', commit, parent or '0' * 40)
+    return commit
+
+
+def upstream():
+    """Upstream ref of the current branch, or None if there isn't one"""
+    result = subprocess.run(['git', 'rev-parse', '--abbrev-ref', '--symbolic-full-name', '@{upstream}'],
+                            capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def pending_commits(ref):
+    """Local commits not yet on ref"""
+    return int(git('rev-list', '--count', f'{ref}..HEAD') or 0)
+
+
+def sync_with_remote(ref):
+    """Fetch and replay local commits on top of the remote branch; True on success"""
+    remote = ref.split('/', 1)[0]
+    git('fetch', '--quiet', remote)
+
+    # In a rebase "theirs" is the local commit being replayed, so this run's files win
+    result = subprocess.run(['git', 'rebase', '--autostash', '-X', 'theirs', ref], capture_output=True, text=True)
+    if result.returncode == 0:
+        return True
+    subprocess.run(['git', 'rebase', '--abort'], capture_output=True)
+
+    result = subprocess.run(['git', 'merge', '--no-edit', '-X', 'ours', ref], capture_output=True, text=True)
+    if result.returncode == 0:
+        return True
+    subprocess.run(['git', 'merge', '--abort'], capture_output=True)
+    print(f"  ⚠️ Could not combine with {ref}: {result.stdout.strip() or result.stderr.strip()}")
+    return False
+
+
+def push(attempts=PUSH_ATTEMPTS):
+    """Push every pending commit, syncing with the remote and backing off on rejection"""
+    ref = upstream()
+    if ref is None:
+        result = subprocess.run(['git', 'push'], capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"  ⚠️ Push failed: {result.stderr}")
+            print("  You may need to set up remote: git remote add origin <your-repo-url>")
+        return result.returncode == 0
+
+    delay = PUSH_BACKOFF
+    for attempt in range(1, attempts + 1):
+        count = pending_commits(ref)
+        if count == 0:
+            return True
+
+        result = subprocess.run(['git', 'push'], capture_output=True, text=True)
+        if result.returncode == 0:
+            print(f"  ✓ Pushed {count} commit{'s' if count != 1 else ''}")
+            return True
+
+        lines = result.stderr.strip().splitlines()
+        reason = next((line.strip() for line in lines if 'rejected' in line or 'error' in line), lines[-1] if lines else '')
+        print(f"  ⚠️ Push attempt {attempt}/{attempts} failed: {reason}")
+        if attempt == attempts:
+            break
+
+        time.sleep(min(delay, PUSH_BACKOFF_MAX) * random.uniform(0.5, 1.0))
+        delay *= 2
+        try:
+            sync_with_remote(ref)
+        except subprocess.CalledProcessError as e:
+            print(f"  ⚠️ Fetch failed: {e.stderr.strip() if e.stderr else e}")
+
+    print("  ⚠️ Giving up for now; the commits stay local and go out with the next push")
+    return False
+
+
+def commit_and_push(paths, message):
+    """Commit the files written this run and push to GitHub"""
+    print("\n=== Pushing to GitHub ===")
+
+    try:
+        if paths and commit_paths(paths, message):
+            print(f"  ✓ Committed {len(set(paths))} files")
+        else:
+            print("  No changes to commit")
+
+        # Also flushes commits an earlier failed push left behind
+        if not push():
+            return False
+
+        print("✓ Data pushed to GitHub")
+        return True
+
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Git error: {e.stderr.strip() if e.stderr else str(e)}")
+        return False
+    except FileNotFoundError:
+        print("❌ Git not found. Make sure git is installed and in PATH.")
+        return False
@@ -0,0 +1,290 @@
+"""
+History Archive
+Rolls old snapshot files out of data/history (and so out of git) into
+compressed pack files, one per feed per day:
+
+    data/archive/rotogrinders_nhl/rotogrinders_nhl_2025-12-22.tar.xz
+
+Packs are tar.xz, or tar.zst when the zstandard package is installed.
+They live next to the repo but are ignored by git; git tracks only
+data/history/archive.jsonl, which records each archived file's pack,
+size and SHA-256. Gzipped snapshots are packed decompressed so the pack
+compresses across a whole day of near-identical files.
+
+read_snapshot() falls back to the archive for files that are no longer on
+disk, so archived snapshots stay readable. Files that a kept delta still
+chains back to are never archived, so new deltas and their parents stay
+in the repo and resolve on a fresh checkout.
+
+    python history_archive.py --older-than 14 --dry-run
+    python history_archive.py --older-than 14 --commit
+"""
+
+import io
+import os
+import re
+import gzip
+import lzma
+import json
+import tarfile
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from history_delta import DELTA_SUFFIX
+
+
+ARCHIVE_MANIFEST = 'archive.jsonl'
+# Decompressed packs kept in memory; scans walk every feed day by day
+OPEN_PACKS = 16
+PACK_RE = re.compile(r'^(?P<name>.+)_(?P<ts>\d{4}-\d{2}-\d{2}_\d{2}-\d{2})(?:\.csv(?:\.gz)?|\.delta\.json)$')
+
+_archives = {}
+_archives_lock = threading.Lock()
+
+
+def archive_for(history_dir):
+    """Shared HistoryArchive for a history directory"""
+    key = os.path.abspath(history_dir)
+    with _archives_lock:
+        if key not in _archives:
+            _archives[key] = HistoryArchive(history_dir)
+        return _archives[key]
+
+
+def read_archived(path):
+    """Text of an archived history file given its original path, or None"""
+    archive = archive_for(os.path.dirname(path) or '.')
+    return archive.read(os.path.basename(path))
+
+
+def file_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def member_name(filename):
+    """Name inside a pack: gzipped snapshots are stored decompressed"""
+    return filename[:-len('.gz')] if filename.endswith('.gz') else filename
+
+
+class HistoryArchive:
+    """Compressed, date-partitioned packs of history files"""
+
+    def __init__(self, history_dir='data/history', archive_dir=None, compression=None):
+        self.history_dir = history_dir
+        self.manifest_path = os.path.join(history_dir, ARCHIVE_MANIFEST)
+        if archive_dir is None:
+            archive_dir = os.path.join(os.path.dirname(history_dir.rstrip(os.sep)) or '.', 'archive')
+        self.archive_dir = archive_dir
+        self.compression = compression or ('zst' if zstandard else 'xz')
+        self.lock = threading.Lock()
+        self._entries = None
+        self._packs = OrderedDict()     # pack -> {member: bytes}, most recently used last
+
+    def entries(self):
+        """Archived file name -> manifest entry"""
+        if self._entries is None:
+            entries = {}
+            if os.path.exists(self.manifest_path):
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            entry = json.loads(line)
+                            entries[entry['file']] = entry
+            self._entries = entries
+        return self._entries
+
+    def pack_path(self, name, date):
+        return os.path.join(self.archive_dir, name, f"{name}_{date}.tar.{self.compression}")
+
+    def read_pack(self, pack):
+        """{member name: bytes} of a pack"""
+        path = os.path.join(self.archive_dir, pack)
+        if pack.endswith('.zst'):
+            if zstandard is None:
+                raise ImportError(f"zstandard is required to read {pack}")
+            with open(path, 'rb') as f:
+                stream = zstandard.ZstdDecompressor().stream_reader(f)
+                with tarfile.open(fileobj=stream, mode='r|') as tar:
+                    return {m.name: tar.extractfile(m).read() for m in tar if m.isfile()}
+        with tarfile.open(path, mode='r:xz') as tar:
+            return {m.name: tar.extractfile(m).read() for m in tar.getmembers() if m.isfile()}
+
+    def write_pack(self, path, members):
+        """Write {member name: bytes} to a pack atomically"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode='w') as tar:
+            for member, data in sorted(members.items()):
+                info = tarfile.TarInfo(member)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+
+        if path.endswith('.zst'):
+            payload = zstandard.ZstdCompressor(level=19).compress(buffer.getvalue())
+        else:
+            payload = lzma.compress(buffer.getvalue(), preset=9)
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+    def read(self, filename):
+        """Text of an archived file, or None if it isn't archived here"""
+        entry = self.entries().get(filename)
+        if entry is None or not os.path.exists(os.path.join(self.archive_dir, entry['pack'])):
+            return None
+
+        with self.lock:
+            members = self._packs.get(entry['pack'])
+            if members is None:
+                members = self.read_pack(entry['pack'])
+                self._packs[entry['pack']] = members
+                while len(self._packs) > OPEN_PACKS:
+                    self._packs.popitem(last=False)
+            else:
+                self._packs.move_to_end(entry['pack'])
+
+        data = members.get(entry.get('member', filename))
+        if data is None or file_hash(data) != entry['sha256']:
+            raise ValueError(f"{filename} in {entry['pack']} is missing or corrupt")
+        return data.decode('utf-8')
+
+    def delta_parents(self, filenames):
+        """Every file the given delta files chain back to"""
+        needed = set()
+        for filename in filenames:
+            while filename.endswith(DELTA_SUFFIX):
+                path = os.path.join(self.history_dir, filename)
+                if not os.path.exists(path):
+                    break
+                with open(path, 'r', encoding='utf-8') as f:
+                    filename = json.load(f)['parent']
+                if filename in needed:
+                    break
+                needed.add(filename)
+        return needed
+
+    def archive(self, older_than_days=14, dry_run=False):
+        """Pack history files older than the cutoff and remove them from data/history
+
+        Returns (stats, changed paths) where the paths are the removed files
+        and the archive manifest, ready to commit.
+        """
+        cutoff = (datetime.now() - timedelta(days=older_than_days)).strftime('%Y-%m-%d')
+        groups = {}
+        kept = []
+        for filename in sorted(os.listdir(self.history_dir)):
+            match = PACK_RE.match(filename)
+            if not match:
+                continue
+            date = match.group('ts')[:10]
+            if date < cutoff:
+                groups.setdefault((match.group('name'), date), []).append(filename)
+            else:
+                kept.append(filename)
+
+        # Deltas that stay must still reach their base without the archive
+        pinned = self.delta_parents(kept)
+
+        stats = {'files': 0, 'packs': 0, 'bytes_in': 0, 'bytes_out': 0, 'pinned': 0}
+        changed = []
+        new_entries = []
+
+        for (name, date), filenames in sorted(groups.items()):
+            filenames = [f for f in filenames if f not in pinned]
+            stats['pinned'] += len(groups[(name, date)]) - len(filenames)
+            if not filenames:
+                continue
+
+            members = {}
+            for filename in filenames:
+                path = os.path.join(self.history_dir, filename)
+                with open(path, 'rb') as f:
+                    data = f.read()
+                members[member_name(filename)] = gzip.decompress(data) if filename.endswith('.gz') else data
+                stats['bytes_in'] += len(data)
+            stats['files'] += len(members)
+            stats['packs'] += 1
+            if dry_run:
+                continue
+
+            path = self.pack_path(name, date)
+            pack = os.path.relpath(path, self.archive_dir)
+            if os.path.exists(path):
+                members = {**self.read_pack(pack), **members}
+            self.write_pack(path, members)
+            stats['bytes_out'] += os.path.getsize(path)
+
+            # Verify the pack before deleting anything
+            packed = self.read_pack(pack)
+            for filename in filenames:
+                member = member_name(filename)
+                digest = file_hash(members[member])
+                if file_hash(packed.get(member, b'')) != digest:
+                    raise ValueError(f"{filename} did not round-trip through {pack}")
+                new_entries.append({'file': filename, 'member': member, 'pack': pack, 'sha256': digest,
+                                    'bytes': len(members[member])})
+
+        if dry_run or not new_entries:
+            return stats, changed
+
+        with open(self.manifest_path, 'a', encoding='utf-8') as f:
+            for entry in new_entries:
+                f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+        self._entries = None
+        self._packs.clear()
+        changed.append(self.manifest_path)
+
+        for entry in new_entries:
+            path = os.path.join(self.history_dir, entry['file'])
+            os.remove(path)
+            changed.append(path)
+
+        return stats, changed
+
+
+def main():
+    """Command-line entry point"""
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Pack old history into compressed, date-partitioned archives')
+    parser.add_argument('--history-dir', default='data/history', help='History directory (default: data/history)')
+    parser.add_argument('--archive-dir', help='Where packs are written (default: data/archive)')
+    parser.add_argument('--older-than', type=int, default=14, help='Archive snapshots older than this many days')
+    parser.add_argument('--compression', choices=['xz', 'zst'], help='Pack format (default: zst if installed, else xz)')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would be archived without changing anything')
+    parser.add_argument('--commit', action='store_true', help='Commit the removed files and archive manifest and push')
+    args = parser.parse_args()
+
+    if args.compression == 'zst' and zstandard is None:
+        print("❌ zstandard is not installed (pip install zstandard)")
+        return
+
+    archive = HistoryArchive(args.history_dir, args.archive_dir, args.compression)
+    start = time.time()
+    stats, changed = archive.archive(args.older_than, dry_run=args.dry_run)
+
+    verb = 'Would archive' if args.dry_run else 'Archived'
+    print(f"{verb} {stats['files']} files into {stats['packs']} packs ({stats['bytes_in'] / 1e6:.1f} MB)")
+    if not args.dry_run and stats['files']:
+        print(f"✓ Packs total {stats['bytes_out'] / 1e6:.1f} MB in {archive.archive_dir}/ ({time.time() - start:.1f}s)")
+    if stats['pinned']:
+        print(f"  Kept {stats['pinned']} old files that newer deltas still build on")
+
+    if args.commit and changed:
+        from git_publish import commit_and_push
+        commit_and_push(changed, f"Archive history older than {args.older_than} days")
+
+
+if __name__ == "__main__":
+    main()
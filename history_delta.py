@@ -0,0 +1,177 @@
+"""
+History Delta
+Cell-level deltas between consecutive snapshots of the same projection
+feed, keyed on PLAYERID (or RGID). Fields are kept as the raw text between
+commas, quotes included, so a materialized snapshot is byte-for-byte the
+CSV that was scraped.
+
+A delta records the raw header, the changed cells of existing rows, whole
+added rows, removed keys, and the row order when it differs from what the
+other three imply. The header makes "what changed" answerable from the
+delta file alone.
+"""
+
+import re
+
+
+KEY_COLUMNS = ('PLAYERID', 'RGID')
+DELTA_SUFFIX = '.delta.json'
+
+FIELD_RE = re.compile(r'"(?:[^"]|"")*"|[^,]*')
+
+
+def raw_fields(line):
+    """Split a CSV line into raw field text, or None if it isn't a simple single-line record"""
+    fields = []
+    pos = 0
+    while True:
+        match = FIELD_RE.match(line, pos)
+        fields.append(match.group())
+        pos = match.end()
+        if pos >= len(line):
+            break
+        if line[pos] != ',':
+            return None
+        pos += 1
+    return fields
+
+
+def unquote(field):
+    if len(field) >= 2 and field[0] == field[-1] == '"':
+        return field[1:-1].replace('""', '"')
+    return field
+
+
+def parse_table(csv_content):
+    """Keyed view of a CSV payload, or None if it can't be delta-encoded
+
+    Returns a dict with the raw header line, the newline style, whether the
+    payload ends with a newline, the key column, the row order and the raw
+    fields of each row by key. Blank or repeated keys get an occurrence
+    suffix (e.g. '#1', '123#1') so every row stays addressable.
+    """
+    newline = '\r\n' if '\r\n' in csv_content else '\n'
+    trailing = csv_content.endswith(newline)
+    lines = csv_content[:-len(newline)].split(newline) if trailing else csv_content.split(newline)
+    if not lines or not lines[0]:
+        return None
+
+    columns = raw_fields(lines[0])
+    if columns is None:
+        return None
+    names = [unquote(c) for c in columns]
+    key_column = next((c for c in KEY_COLUMNS if c in names), None)
+    if key_column is None:
+        return None
+    key_index = names.index(key_column)
+
+    order = []
+    rows = {}
+    seen = {}
+    for line in lines[1:]:
+        # An odd quote count means a quoted field spans lines
+        if line.count('"') % 2:
+            return None
+        fields = raw_fields(line)
+        if fields is None:
+            return None
+
+        key = unquote(fields[key_index]) if key_index < len(fields) else ''
+        count = seen.get(key, 0)
+        seen[key] = count + 1
+        row_key = f"{key}#{count}" if count or not key else key
+
+        order.append(row_key)
+        rows[row_key] = fields
+
+    return {
+        'header': lines[0],
+        'newline': newline,
+        'trailing': trailing,
+        'key': key_column,
+        'order': order,
+        'rows': rows,
+    }
+
+
+def render(table):
+    """CSV text of a table produced by parse_table or apply_delta"""
+    lines = [table['header']] + [','.join(table['rows'][key]) for key in table['order']]
+    text = table['newline'].join(lines)
+    return text + table['newline'] if table['trailing'] else text
+
+
+def implied_order(parent_order, added, removed):
+    """Row order a delta implies when it doesn't record one"""
+    removed = set(removed)
+    return [key for key in parent_order if key not in removed] + list(added)
+
+
+def make_delta(parent, table):
+    """Delta from parent to table, or None when the two aren't comparable"""
+    if parent is None or table is None or parent['header'] != table['header']:
+        return None
+
+    changed = {}
+    added = {}
+    for key in table['order']:
+        fields = table['rows'][key]
+        before = parent['rows'].get(key)
+        if before is None:
+            added[key] = fields
+        elif before != fields:
+            if len(before) != len(fields):
+                changed[key] = {'*': fields}
+            else:
+                changed[key] = {str(i): new for i, (old, new) in enumerate(zip(before, fields)) if old != new}
+    removed = [key for key in parent['order'] if key not in table['rows']]
+
+    delta = {
+        'key': table['key'],
+        'header': table['header'],
+        'newline': table['newline'],
+        'trailing': table['trailing'],
+        'changed': changed,
+        'added': added,
+        'removed': removed,
+    }
+    if table['order'] != implied_order(parent['order'], added, removed):
+        delta['order'] = table['order']
+    return delta
+
+
+def apply_delta(parent, delta):
+    """Table produced by applying a delta to its parent table"""
+    rows = dict(parent['rows'])
+    for key in delta['removed']:
+        rows.pop(key, None)
+    for key, cells in delta['changed'].items():
+        if '*' in cells:
+            rows[key] = cells['*']
+            continue
+        fields = list(rows[key])
+        for index, value in cells.items():
+            fields[int(index)] = value
+        rows[key] = fields
+    rows.update(delta['added'])
+
+    return {
+        'header': delta['header'],
+        'newline': delta['newline'],
+        'trailing': delta['trailing'],
+        'key': delta['key'],
+        'order': delta.get('order') or implied_order(parent['order'], delta['added'], delta['removed']),
+        'rows': rows,
+    }
+
+
+def describe_delta(delta):
+    """What changed: {'changed': {key: {column: new value}}, 'added': [...], 'removed': [...]}"""
+    names = [unquote(c) for c in raw_fields(delta['header'])]
+    changed = {}
+    for key, cells in delta['changed'].items():
+        if '*' in cells:
+            changed[key] = dict(zip(names, (unquote(v) for v in cells['*'])))
+        else:
+            changed[key] = {names[int(i)]: unquote(v) for i, v in cells.items()}
+    return {'changed': changed, 'added': list(delta['added']), 'removed': list(delta['removed'])}
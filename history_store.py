@@ -0,0 +1,444 @@
+"""
+History Store
+Content-addressed snapshots for data/history. A payload is written once per
+distinct content; repeat scrapes of identical data only add a line to
+manifest.jsonl mapping their timestamp to the stored file's hash.
+
+Full payloads are written gzip-compressed ({name}_{ts}.csv.gz, with a
+zero header mtime so identical content gives identical bytes). Feeds with
+a player key (Rotogrinders) store a new payload as a cell-level delta
+against the previous snapshot when that is meaningfully smaller,
+re-basing to a full CSV every DELTA_REBASE_EVERY links. Use read_snapshot()
+rather than open() to get a snapshot's CSV text back, or open_snapshot() /
+iter_snapshot_rows() to stream it; both handle plain, compressed, delta
+and archived files alike.
+
+Every file is written once to a temp file, fsynced and renamed into place,
+so readers never see a partial write. save(current_path=...) publishes the
+feed's current CSV (data/<source>_<sport>.csv) in the same step: as a hard
+link to the stored snapshot when that is a plain CSV, otherwise by the same
+atomic replace.
+
+New payloads are also appended to the partitioned Parquet store in
+columnar_history.py when pyarrow is installed. That store is a local
+query copy of the history and is kept out of git. Every snapshot that
+differs from its feed's previous one is diffed into the projection
+movement log (line_movement.py).
+
+Run directly to fold an existing history directory into the manifest:
+    python history_store.py --dedupe [--dry-run]
+"""
+
+import io
+import os
+import re
+import csv
+import gzip
+import json
+import hashlib
+import threading
+from datetime import datetime
+
+from columnar_history import ColumnarHistory
+from history_archive import PACK_RE, archive_for, read_archived
+from history_delta import DELTA_SUFFIX, apply_delta, describe_delta, make_delta, parse_table, render
+
+
+MANIFEST_NAME = 'manifest.jsonl'
+TIMESTAMP_FORMAT = '%Y-%m-%d_%H-%M'
+SNAPSHOT_RE = re.compile(r'^(?P<name>.+)_(?P<ts>\d{4}-\d{2}-\d{2}_\d{2}-\d{2})\.csv(?:\.gz)?$')
+COMPRESSED_SUFFIX = '.csv.gz'
+COMPRESS_LEVEL = 9
+
+# A chain is re-based to a full CSV after this many deltas
+DELTA_REBASE_EVERY = 24
+# Deltas larger than this fraction of the full payload aren't worth a link
+DELTA_MAX_RATIO = 0.6
+
+
+def content_hash(csv_content):
+    """SHA-256 of a payload's UTF-8 bytes"""
+    return hashlib.sha256(csv_content.encode('utf-8')).hexdigest()
+
+
+def parse_snapshot_name(filename):
+    """Split 'rotogrinders_nba_2025-12-22_16-25.csv(.gz)' into ('rotogrinders_nba', '2025-12-22_16-25')"""
+    match = SNAPSHOT_RE.match(os.path.basename(filename))
+    if not match:
+        return None, None
+    return match.group('name'), match.group('ts')
+
+
+def atomic_write(path, data):
+    """Write bytes to path via a synced temp file and an atomic rename"""
+    directory = os.path.dirname(path) or '.'
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'xb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    # Make the rename itself durable; not supported everywhere
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    except OSError:
+        pass
+
+
+def publish_file(path, csv_content, snapshot_path=None):
+    """Atomically replace a current CSV, hard-linking a plain-CSV snapshot instead of rewriting it"""
+    if snapshot_path and snapshot_path.endswith('.csv') and os.path.exists(snapshot_path):
+        tmp_path = f"{path}.{os.getpid()}.link"
+        try:
+            os.link(snapshot_path, tmp_path)
+            os.replace(tmp_path, path)
+            return path
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    atomic_write(path, csv_content.encode('utf-8'))
+    return path
+
+
+def compress(csv_content):
+    """Deterministic gzip bytes of a payload"""
+    return gzip.compress(csv_content.encode('utf-8'), compresslevel=COMPRESS_LEVEL, mtime=0)
+
+
+def read_text(path):
+    """Text of a history file, from disk or from the archive once it has been packed"""
+    if os.path.exists(path):
+        if path.endswith('.gz'):
+            with gzip.open(path, 'rb') as f:
+                return f.read().decode('utf-8')
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    text = read_archived(path)
+    if text is None:
+        raise FileNotFoundError(f"{path} is neither in history nor in the archive")
+    return text
+
+
+def read_delta(path):
+    return json.loads(read_text(path))
+
+
+def read_snapshot(path):
+    """CSV text of a stored snapshot, materializing delta chains back to their base"""
+    chain = []
+    while path.endswith(DELTA_SUFFIX):
+        delta = read_delta(path)
+        chain.append(delta)
+        path = os.path.join(os.path.dirname(path), delta['parent'])
+
+    csv_content = read_text(path)
+    if not chain:
+        return csv_content
+
+    table = parse_table(csv_content)
+    for delta in reversed(chain):
+        table = apply_delta(table, delta)
+    return render(table)
+
+
+def open_snapshot(path):
+    """Text stream of a snapshot
+
+    Plain and compressed files are streamed from disk, decompressing as
+    they are read; deltas and archived files are materialized first.
+    """
+    if os.path.exists(path):
+        if path.endswith('.gz'):
+            return gzip.open(path, 'rt', encoding='utf-8', newline='')
+        if not path.endswith(DELTA_SUFFIX):
+            return open(path, 'r', encoding='utf-8', newline='')
+    return io.StringIO(read_snapshot(path))
+
+
+def iter_snapshot_rows(path):
+    """CSV rows of a snapshot, read straight from the (compressed) stream"""
+    with open_snapshot(path) as f:
+        first = True
+        for row in csv.reader(f):
+            if first and row:
+                row[0] = row[0].lstrip('\ufeff')
+            first = False
+            yield row
+
+
+class HistoryStore:
+    """Timestamped snapshot history that stores each distinct payload once"""
+
+    def __init__(self, history_dir='data/history', columnar_dir=None):
+        self.history_dir = history_dir
+        self.manifest_path = os.path.join(history_dir, MANIFEST_NAME)
+        self.lock = threading.Lock()
+        self._index = None
+        self._latest = {}
+        self._previous = None
+        self.movements = None
+
+        if columnar_dir is None:
+            columnar_dir = os.path.join(os.path.dirname(history_dir.rstrip(os.sep)), 'history_columnar')
+        self.columnar = ColumnarHistory(columnar_dir)
+
+        os.makedirs(history_dir, exist_ok=True)
+
+    def entries(self):
+        """All manifest entries, oldest first"""
+        if not os.path.exists(self.manifest_path):
+            return []
+
+        entries = []
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entries.append(json.loads(line))
+        return entries
+
+    def index(self):
+        """(name, sha256) -> stored file, built once from the manifest"""
+        if self._index is None:
+            self._index = {(e['name'], e['sha256']): e['file'] for e in self.entries()}
+        return self._index
+
+    def append_entries(self, entries):
+        """Append entries to the manifest"""
+        with open(self.manifest_path, 'a', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+
+    def save(self, name, csv_content, timestamp=None, current_path=None):
+        """Record a snapshot, and publish it to current_path if given
+
+        Returns (path, written, files): the file holding this content,
+        whether it was newly written, and every file to commit for it.
+        """
+        timestamp = timestamp or datetime.now().strftime(TIMESTAMP_FORMAT)
+        digest = content_hash(csv_content)
+        files = []
+
+        with self.lock:
+            previous = self.previous(name)
+            stored = self.index().get((name, digest))
+            written = not stored or not os.path.exists(os.path.join(self.history_dir, stored))
+
+            if written:
+                stored = self.write_payload(name, csv_content, timestamp)
+                self.index()[(name, digest)] = stored
+                files.append(os.path.join(self.history_dir, stored))
+            else:
+                self._latest[name] = self.chain_link(stored, csv_content)
+
+            self.append_entries([{'ts': timestamp, 'name': name, 'sha256': digest, 'file': stored}])
+            files.append(self.manifest_path)
+            self._previous[name] = (timestamp, os.path.join(self.history_dir, stored), digest)
+
+        if current_path:
+            files.insert(0, publish_file(current_path, csv_content, os.path.join(self.history_dir, stored)))
+
+        if written:
+            self.append_columnar(name, csv_content, timestamp)
+        files.extend(self.record_movement(name, timestamp, csv_content, digest, previous))
+
+        return os.path.join(self.history_dir, stored), written, files
+
+    def chain_link(self, stored, csv_content, table=None):
+        """What a following delta needs to know about a stored payload"""
+        path = os.path.join(self.history_dir, stored)
+        depth = read_delta(path).get('depth', 1) if stored.endswith(DELTA_SUFFIX) else 0
+        return {'file': stored, 'depth': depth, 'table': table or parse_table(csv_content)}
+
+    def latest(self, name):
+        """Chain link for the most recent snapshot of a feed, or None"""
+        if name not in self._latest:
+            last = None
+            for entry in self.entries():
+                if entry['name'] == name:
+                    last = entry
+            path = os.path.join(self.history_dir, last['file']) if last else None
+            if path and os.path.exists(path):
+                self._latest[name] = self.chain_link(last['file'], read_snapshot(path))
+            else:
+                self._latest[name] = None
+        return self._latest[name]
+
+    def write_payload(self, name, csv_content, timestamp):
+        """Write a new payload as a delta on the previous snapshot, or as a full CSV"""
+        table = parse_table(csv_content)
+        parent = self.latest(name)
+        delta = None
+
+        if table is not None and parent and parent['table'] and parent['depth'] < DELTA_REBASE_EVERY:
+            delta = make_delta(parent['table'], table)
+            if delta is not None:
+                delta['parent'] = parent['file']
+                delta['depth'] = parent['depth'] + 1
+                text = json.dumps(delta, separators=(',', ':'))
+                # Only link when it pays off and round-trips to the exact bytes
+                if len(text) > DELTA_MAX_RATIO * len(csv_content) or \
+                        render(apply_delta(parent['table'], delta)) != csv_content:
+                    delta = None
+
+        if delta is not None:
+            stored = f"{name}_{timestamp}{DELTA_SUFFIX}"
+            atomic_write(os.path.join(self.history_dir, stored), text.encode('utf-8'))
+            self._latest[name] = {'file': stored, 'depth': delta['depth'], 'table': table}
+        else:
+            stored = f"{name}_{timestamp}{COMPRESSED_SUFFIX}"
+            atomic_write(os.path.join(self.history_dir, stored), compress(csv_content))
+            self._latest[name] = {'file': stored, 'depth': 0, 'table': table}
+
+        return stored
+
+    def read(self, stored):
+        """CSV text of a stored file (name or path)"""
+        return read_snapshot(os.path.join(self.history_dir, os.path.basename(stored)))
+
+    def changes(self, stored):
+        """Changed cells, added and removed keys for a delta-stored snapshot; None for a full one"""
+        if not stored.endswith(DELTA_SUFFIX):
+            return None
+        return describe_delta(read_delta(os.path.join(self.history_dir, os.path.basename(stored))))
+
+    def append_columnar(self, name, csv_content, timestamp):
+        """Add a new payload to the local Parquet store; never fails the save"""
+        if not self.columnar.available:
+            return
+        try:
+            self.columnar.append(name, csv_content, timestamp)
+        except Exception as e:
+            print(f"  ⚠️ Could not add {name} to columnar history: {e}")
+
+    def previous(self, name):
+        """(timestamp, path, sha256 or None) of a feed's most recent snapshot, or None"""
+        if self._previous is None:
+            digests = {(e['name'], e['ts']): e['sha256'] for e in self.entries()}
+            self._previous = {
+                file_name: (timestamp, path, digests.get((file_name, timestamp)))
+                for file_name, timestamp, path in self.snapshots()
+            }
+        return self._previous.get(name)
+
+    def record_movement(self, name, timestamp, csv_content, digest, previous):
+        """Diff a snapshot against its predecessor into the movement log; never fails the save"""
+        try:
+            if self.movements is None:
+                # Imported here: line_movement builds on this module
+                from line_movement import MovementLog
+                log_path = os.path.join(os.path.dirname(self.history_dir.rstrip(os.sep)), 'movements.jsonl')
+                self.movements = MovementLog(log_path)
+            log_path = self.movements.record(name, timestamp, csv_content, digest, previous)
+            return [log_path] if log_path else []
+        except Exception as e:
+            print(f"  ⚠️ Could not record projection movement for {name}: {e}")
+            return []
+
+    def snapshots(self, name=None):
+        """Every snapshot as (name, timestamp, path), oldest first
+
+        Includes files written before the manifest existed, so readers see
+        the whole history either way.
+        """
+        seen = set()
+        result = []
+
+        for entry in self.entries():
+            if name and entry['name'] != name:
+                continue
+            seen.add(entry['file'])
+            result.append((entry['name'], entry['ts'], os.path.join(self.history_dir, entry['file'])))
+
+        for filename in os.listdir(self.history_dir):
+            if filename in seen:
+                continue
+            file_name, timestamp = parse_snapshot_name(filename)
+            if file_name and (not name or file_name == name):
+                result.append((file_name, timestamp, os.path.join(self.history_dir, filename)))
+
+        # Archived files that predate the manifest
+        for filename in archive_for(self.history_dir).entries():
+            match = PACK_RE.match(filename)
+            if filename in seen or not match or (name and match.group('name') != name):
+                continue
+            seen.add(filename)
+            result.append((match.group('name'), match.group('ts'), os.path.join(self.history_dir, filename)))
+
+        result.sort(key=lambda s: (s[1], s[0]))
+        return result
+
+    def dedupe(self, dry_run=False):
+        """Fold files that aren't in the manifest yet into it, deleting repeat payloads"""
+        known = {e['file'] for e in self.entries()}
+        legacy = []
+        for filename in os.listdir(self.history_dir):
+            name, timestamp = parse_snapshot_name(filename)
+            if name and filename not in known:
+                legacy.append((name, timestamp, filename))
+        legacy.sort(key=lambda s: (s[0], s[1]))
+
+        index = dict(self.index())
+        new_entries = []
+        removed = 0
+        freed = 0
+
+        for name, timestamp, filename in legacy:
+            path = os.path.join(self.history_dir, filename)
+            digest = content_hash(read_text(path))
+
+            stored = index.get((name, digest))
+            if stored and stored != filename:
+                removed += 1
+                freed += os.path.getsize(path)
+                if not dry_run:
+                    os.remove(path)
+            else:
+                stored = filename
+                index[(name, digest)] = filename
+
+            new_entries.append({'ts': timestamp, 'name': name, 'sha256': digest, 'file': stored})
+
+        new_entries.sort(key=lambda e: (e['ts'], e['name']))
+        if not dry_run:
+            self.append_entries(new_entries)
+            self._index = index
+
+        return {'files': len(legacy), 'removed': removed, 'bytes_freed': freed}
+
+
+def main():
+    """Command-line entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Content-addressed projection history')
+    parser.add_argument('--history-dir', default='data/history', help='History directory (default: data/history)')
+    parser.add_argument('--dedupe', action='store_true', help='Fold existing files into the manifest, removing repeats')
+    parser.add_argument('--dry-run', action='store_true', help='Report what --dedupe would remove without changing anything')
+    args = parser.parse_args()
+
+    store = HistoryStore(args.history_dir)
+
+    if args.dedupe:
+        stats = store.dedupe(dry_run=args.dry_run)
+        verb = 'Would remove' if args.dry_run else 'Removed'
+        print(f"Scanned {stats['files']} files")
+        print(f"{verb} {stats['removed']} repeat snapshots ({stats['bytes_freed'] / 1e6:.1f} MB)")
+    else:
+        snapshots = store.snapshots()
+        distinct = len({path for _, _, path in snapshots})
+        print(f"{len(snapshots)} snapshots stored in {distinct} files")
+
+
+if __name__ == "__main__":
+    main()
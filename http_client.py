@@ -0,0 +1,142 @@
+"""
+HTTP Client
+One pooled requests session shared by every projection download, with
+keep-alive, retries with backoff, gzip, and conditional GETs so unchanged
+CSVs come back as 304 and are neither downloaded nor rewritten.
+
+Validators are only sent while the local copy still holds the body they
+were saved with. A run whose commit never got pushed (an ephemeral CI
+runner) leaves the old file in the next checkout, so that run downloads
+the payload again instead of being told 304 and never recording it.
+"""
+
+import os
+import json
+import hashlib
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Returned instead of CSV text when the server answers 304 Not Modified
+NOT_MODIFIED = object()
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Return the process-wide pooled HTTP session"""
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(['GET', 'HEAD']),
+            )
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({
+                'User-Agent': USER_AGENT,
+                'Accept-Encoding': 'gzip, deflate',
+            })
+            _session = session
+
+        return _session
+
+
+def load_cookies(session, cookies):
+    """Copy Selenium-style cookie dicts into the session's cookie jar"""
+    for cookie in cookies:
+        session.cookies.set(
+            cookie['name'], cookie['value'],
+            domain=cookie.get('domain'), path=cookie.get('path', '/')
+        )
+
+
+def file_digest(path):
+    """SHA-256 of a file's bytes, or None if it doesn't exist"""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class ConditionalFetcher:
+    """GETs that send ETag/If-Modified-Since validators saved from earlier runs"""
+
+    def __init__(self, cache_file='.http_validators.json', session=None):
+        self.cache_file = cache_file
+        self.session = session or get_session()
+        self.lock = threading.Lock()
+        self.validators = self.load()
+
+    def load(self):
+        """Load saved validators keyed by URL"""
+        if not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        """Persist validators for the next run"""
+        with self.lock:
+            snapshot = dict(self.validators)
+        try:
+            with open(self.cache_file, 'w') as f:
+                json.dump(snapshot, f, indent=2)
+        except OSError as e:
+            print(f"  ⚠️ Could not save HTTP validators: {e}")
+
+    def get(self, url, timeout=30, current_path=None):
+        """GET a URL conditionally
+
+        current_path is the local file the body is published to; validators
+        are only sent when it still matches the body they came with.
+        Returns (response, text). text is NOT_MODIFIED on a 304, the body on
+        a 200, and None otherwise.
+        """
+        headers = {}
+        with self.lock:
+            saved = self.validators.get(url, {})
+        if current_path is not None and saved.get('sha256') != file_digest(current_path):
+            saved = {}
+        if saved.get('etag'):
+            headers['If-None-Match'] = saved['etag']
+        if saved.get('last_modified'):
+            headers['If-Modified-Since'] = saved['last_modified']
+
+        response = self.session.get(url, headers=headers, timeout=timeout)
+
+        if response.status_code == 304:
+            return response, NOT_MODIFIED
+
+        if response.status_code != 200:
+            return response, None
+
+        # Only remember validators for the URL we actually asked for, not a redirect target
+        validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+        with self.lock:
+            if any(validators.values()) and not response.history:
+                validators['sha256'] = hashlib.sha256(response.text.encode('utf-8')).hexdigest()
+                self.validators[url] = validators
+            else:
+                self.validators.pop(url, None)
+
+        return response, response.text
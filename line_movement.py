@@ -0,0 +1,208 @@
+"""
+Line Movement
+Per-player, per-stat projection moves between consecutive snapshots of
+the same feed, kept in a compact append-only log (data/movements.jsonl).
+
+HistoryStore.save() calls MovementLog.record() whenever a Rotogrinders,
+Stokastic or Dimers snapshot differs from the one before it, so each new
+snapshot is compared only with its predecessor. Both sides come from
+CanonicalCache, so the predecessor is usually already in memory from the
+previous save and nothing else in the history is read.
+
+Players are matched on (player, team), so a traded player shows up as
+dropped from the old team and added to the new one.
+
+Each log line is one snapshot transition:
+
+    {"name": "rotogrinders_nba", "ts": "...", "prev_ts": "...",
+     "moves": [[player, team, stat, old, new], ...]}
+
+old is null for a player/stat that appeared, new is null for one that
+dropped out.
+
+    python line_movement.py --recent 20              # latest moves
+    python line_movement.py --rebuild                # rebuild the log from history
+"""
+
+import os
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+
+from columnar_history import split_name
+from history_store import HistoryStore, content_hash, read_snapshot
+from projection_schema import CanonicalCache
+
+
+MOVEMENT_SOURCES = ('rotogrinders', 'stokastic', 'dimers')
+
+# Moves smaller than this are float noise, not a projection change
+MIN_MOVE = 1e-6
+VALUE_DECIMALS = 4
+
+
+def to_json_value(value):
+    return None if pd.isna(value) else round(float(value), VALUE_DECIMALS)
+
+
+def diff_frames(previous, current):
+    """[player, team, stat, old, new] for every stat that changed between two canonical tables"""
+    # Team is part of the key: two players can share a name (Sebastian Aho, CAR and NYI)
+    keys = ['player', 'team', 'stat']
+    old = previous[keys + ['value']].drop_duplicates(keys, keep='last')
+    new = current[keys + ['value']].drop_duplicates(keys, keep='last')
+    merged = old.merge(new, on=keys, how='outer', suffixes=('_old', '_new'))
+
+    old_values = merged['value_old'].to_numpy(dtype='float64')
+    new_values = merged['value_new'].to_numpy(dtype='float64')
+    missing = np.isnan(old_values) != np.isnan(new_values)
+    with np.errstate(invalid='ignore'):
+        moved = np.abs(new_values - old_values) > MIN_MOVE
+    changed = merged[missing | moved]
+
+    return [
+        [player, team if isinstance(team, str) else None, stat, to_json_value(old), to_json_value(new)]
+        for player, stat, old, team, new in changed[['player', 'stat', 'value_old', 'team', 'value_new']]
+        .itertuples(index=False, name=None)
+    ]
+
+
+class MovementLog:
+    """Append-only log of projection moves between consecutive snapshots"""
+
+    def __init__(self, log_path='data/movements.jsonl', canonical=None):
+        self.log_path = log_path
+        self.canonical = canonical or CanonicalCache()
+        self.lock = threading.Lock()
+
+    def tracks(self, name):
+        source, _sport, _stat_type = split_name(name)
+        return source in MOVEMENT_SOURCES
+
+    def frame(self, name, digest, path=None, csv_content=None):
+        """Canonical table for one side of a transition, read from disk only on a cache miss"""
+        if csv_content is None and digest is None:
+            csv_content = read_snapshot(path)
+        if digest is None:
+            digest = content_hash(csv_content)
+        if csv_content is None:
+            return self.canonical.payload_frame(name, digest, lambda: read_snapshot(path))
+        return self.canonical.payload_frame(name, digest, lambda: csv_content)
+
+    def record(self, name, timestamp, csv_content, digest, previous):
+        """Log moves from previous (ts, path, sha256 or None) to a new snapshot
+
+        Returns the log path when a line was appended, otherwise None.
+        """
+        if previous is None or not self.tracks(name):
+            return None
+        prev_ts, prev_path, prev_digest = previous
+        if prev_digest is not None and prev_digest == digest:
+            return None
+
+        moves = diff_frames(
+            self.frame(name, prev_digest, path=prev_path),
+            self.frame(name, digest, csv_content=csv_content),
+        )
+        if not moves:
+            return None
+
+        line = json.dumps({'name': name, 'ts': timestamp, 'prev_ts': prev_ts, 'moves': moves},
+                          separators=(',', ':'))
+        with self.lock:
+            os.makedirs(os.path.dirname(self.log_path) or '.', exist_ok=True)
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+        return self.log_path
+
+    def entries(self, name=None):
+        """Logged transitions, oldest first"""
+        if not os.path.exists(self.log_path):
+            return []
+
+        entries = []
+        with open(self.log_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entry = json.loads(line)
+                    if not name or entry['name'] == name:
+                        entries.append(entry)
+        return entries
+
+    def rebuild(self, history_dir='data/history'):
+        """Rewrite the log from every consecutive pair of snapshots in history"""
+        store = HistoryStore(history_dir)
+        digests = {(e['name'], e['ts']): e['sha256'] for e in store.entries()}
+
+        tmp_path = f"{self.log_path}.tmp"
+        original, self.log_path = self.log_path, tmp_path
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        transitions = 0
+        try:
+            previous = {}
+            for name, timestamp, path in store.snapshots():
+                if not self.tracks(name):
+                    continue
+                digest = digests.get((name, timestamp))
+                if digest is None:
+                    csv_content = read_snapshot(path)
+                    digest = content_hash(csv_content)
+                else:
+                    csv_content = None
+                if name in previous:
+                    if csv_content is None:
+                        csv_content = read_snapshot(path)
+                    if self.record(name, timestamp, csv_content, digest, previous[name]):
+                        transitions += 1
+                previous[name] = (timestamp, path, digest)
+        finally:
+            self.log_path = original
+
+        if os.path.exists(tmp_path):
+            os.replace(tmp_path, self.log_path)
+        return transitions
+
+
+def main():
+    """Command-line entry point"""
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Projection movement between consecutive snapshots')
+    parser.add_argument('--log', default='data/movements.jsonl', help='Movement log (default: data/movements.jsonl)')
+    parser.add_argument('--history-dir', default='data/history', help='History directory (default: data/history)')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild the log from the whole history')
+    parser.add_argument('--name', help='Only this feed, e.g. rotogrinders_nba')
+    parser.add_argument('--stat', help='Only this canonical stat, e.g. fpts')
+    parser.add_argument('--recent', type=int, default=20, help='Moves to show (default: 20)')
+    args = parser.parse_args()
+
+    log = MovementLog(args.log)
+
+    if args.rebuild:
+        start = time.time()
+        transitions = log.rebuild(args.history_dir)
+        print(f"✓ Logged {transitions} snapshot transitions in {time.time() - start:.1f}s")
+
+    rows = []
+    for entry in log.entries(args.name):
+        for player, team, stat, old, new in entry['moves']:
+            if not args.stat or stat == args.stat:
+                rows.append((entry['ts'], entry['name'], player, team, stat, old, new))
+
+    if not rows:
+        print("No moves logged")
+        return
+
+    for ts, name, player, team, stat, old, new in rows[-args.recent:]:
+        change = f"{old} -> {new}" if old is not None and new is not None else ('added' if old is None else 'dropped')
+        print(f"{ts}  {name:<24} {player} ({team or '-'}) {stat}: {change}")
+
+
+if __name__ == "__main__":
+    main()
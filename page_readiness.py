@@ -0,0 +1,127 @@
+"""
+Page Readiness
+Event-driven waits shared by the Rotogrinders, Stokastic and Dimers scrapers.
+Each wait polls a concrete condition (element visible, network idle, table
+has rows) and records how long it actually took. Downloads are waited on
+with download_watcher.DownloadWatcher and recorded here too.
+"""
+
+import time
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+
+class PageReadiness:
+    """Waits on page conditions with per-step timeouts and records wait times"""
+
+    def __init__(self, driver, default_timeout=20, poll_frequency=0.1):
+        self.driver = driver
+        self.default_timeout = default_timeout
+        self.poll_frequency = poll_frequency
+        self.timings = []
+
+    def wait_for(self, label, condition, timeout=None):
+        """Wait until condition(driver) is truthy; return its value or None on timeout"""
+        timeout = self.default_timeout if timeout is None else timeout
+        start = time.monotonic()
+
+        try:
+            result = WebDriverWait(
+                self.driver, timeout, poll_frequency=self.poll_frequency,
+                ignored_exceptions=(WebDriverException, OSError)
+            ).until(condition)
+            ok = True
+        except TimeoutException:
+            result = None
+            ok = False
+
+        self.record(label, time.monotonic() - start, ok)
+        return result
+
+    def record(self, label, seconds, ok=True):
+        """Record a wait that was timed outside of wait_for"""
+        self.timings.append({'step': label, 'seconds': round(seconds, 3), 'ok': ok})
+
+        if not ok:
+            print(f"  ⚠️ Timed out after {seconds:.1f}s waiting for {label}")
+
+    def document_ready(self, label='document ready', timeout=None):
+        """Wait for document.readyState to be complete"""
+        return self.wait_for(
+            label,
+            lambda d: d.execute_script("return document.readyState") == 'complete',
+            timeout
+        )
+
+    def element_visible(self, by, value, label=None, timeout=None):
+        """Wait for an element to be present and displayed"""
+        return self.wait_for(label or f"visible {value}", EC.visibility_of_element_located((by, value)), timeout)
+
+    def element_clickable(self, by, value, label=None, timeout=None):
+        """Wait for an element to be visible and enabled"""
+        return self.wait_for(label or f"clickable {value}", EC.element_to_be_clickable((by, value)), timeout)
+
+    def any_visible(self, locators, label='any element', timeout=None):
+        """Wait for the first displayed element matching any (by, value) locator"""
+        def find_any(driver):
+            for by, value in locators:
+                for el in driver.find_elements(by, value):
+                    if el.is_displayed():
+                        return el
+            return False
+
+        return self.wait_for(label, find_any, timeout)
+
+    def text_present(self, text, label=None, timeout=None):
+        """Wait for text to appear anywhere in the page source"""
+        return self.wait_for(label or f"text '{text}'", lambda d: text in d.page_source, timeout)
+
+    def url_excludes(self, fragment, label=None, timeout=None):
+        """Wait for the current URL to no longer contain a fragment (e.g. after a login redirect)"""
+        return self.wait_for(
+            label or f"URL without '{fragment}'",
+            lambda d: fragment not in d.current_url.lower(),
+            timeout
+        )
+
+    def js_condition(self, label, script, timeout=None):
+        """Wait for a JavaScript expression/function body to return a truthy value"""
+        return self.wait_for(label, lambda d: d.execute_script(script), timeout)
+
+    def table_has_rows(self, min_rows=1, selector='table tbody tr', label=None, timeout=None):
+        """Wait for a table to render at least min_rows rows"""
+        script = f"return document.querySelectorAll({selector!r}).length >= {int(min_rows)};"
+        return self.js_condition(label or f"{min_rows}+ rows in {selector}", script, timeout)
+
+    def network_idle(self, idle_time=0.5, label='network idle', timeout=None):
+        """Wait until no new resources have been fetched for idle_time seconds"""
+        state = {'count': -1, 'since': time.monotonic()}
+
+        def idle(driver):
+            count = driver.execute_script(
+                "return performance.getEntriesByType('resource').length;"
+            )
+            now = time.monotonic()
+            if count != state['count']:
+                state['count'] = count
+                state['since'] = now
+                return False
+            return now - state['since'] >= idle_time
+
+        return self.wait_for(label, idle, timeout)
+
+    def total_seconds(self):
+        """Total time spent waiting"""
+        return sum(t['seconds'] for t in self.timings)
+
+    def report(self):
+        """Print how long each wait actually took"""
+        if not self.timings:
+            return
+
+        print("\n=== Wait timings ===")
+        for t in self.timings:
+            status = '✓' if t['ok'] else '✗'
+            print(f"  {status} {t['seconds']:6.2f}s  {t['step']}")
+        print(f"  Total waiting: {self.total_seconds():.1f}s")
@@ -0,0 +1,229 @@
+"""
+Player Identity
+Persistent index mapping each source's player names to one canonical
+player ID per sport, so Rotogrinders, Stokastic, Dimers and Rotowire rows
+for the same player can be joined.
+
+Names are reduced to a normalized key (accents, punctuation and suffixes
+like Jr./III dropped). Unknown names are compared only against players in
+the same block (sport + team, narrowed by position when known), never
+against the whole index. An exact name on a different team is not taken
+as the same player, and a fuzzy match is refused when the same
+source already uses a different name for that player (Jalen and Jaylin
+Williams are both on OKC). Every resolution is memoized per
+(source, sport, name, team) and saved with the index, so a repeat
+snapshot resolves each row with a single dict lookup.
+
+    python player_identity.py            # index the latest snapshot of every feed
+"""
+
+import os
+import re
+import json
+import threading
+import unicodedata
+from difflib import SequenceMatcher
+
+
+SUFFIX_RE = re.compile(r'\b(jr|sr|ii|iii|iv|v)\b')
+NON_ALNUM_RE = re.compile(r'[^a-z0-9 ]+')
+
+# Minimum similarity for a fuzzy match inside a block
+MATCH_THRESHOLD = 0.88
+
+# Per-sport team abbreviations that differ between sources
+TEAM_ALIASES = {
+    'nba': {'GS': 'GSW', 'NO': 'NOP', 'NY': 'NYK', 'SA': 'SAS', 'PHO': 'PHX', 'UTAH': 'UTA', 'WSH': 'WAS'},
+    'nfl': {'JAC': 'JAX', 'WSH': 'WAS', 'LA': 'LAR', 'KCC': 'KC', 'GBP': 'GB', 'NEP': 'NE', 'NOS': 'NO',
+            'SFO': 'SF', 'TBB': 'TB', 'LVR': 'LV'},
+    'nhl': {'LA': 'LAK', 'TB': 'TBL', 'NJ': 'NJD', 'SJ': 'SJS', 'MON': 'MTL', 'WAS': 'WSH', 'CLB': 'CBJ',
+            'UTAH': 'UTA'},
+}
+
+
+def normalize_name(name):
+    """'A.J. Brown Jr.' -> 'aj brown'"""
+    text = unicodedata.normalize('NFKD', str(name)).encode('ascii', 'ignore').decode('ascii').lower()
+    text = text.replace('.', '').replace("'", '').replace('-', ' ')
+    text = NON_ALNUM_RE.sub(' ', text)
+    text = SUFFIX_RE.sub(' ', text)
+    return ' '.join(text.split())
+
+
+def normalize_team(sport, team):
+    # Missing teams arrive as None or NaN depending on the reader
+    if not isinstance(team, str) or not team.strip():
+        return None
+    team = team.strip().upper()
+    return TEAM_ALIASES.get(sport, {}).get(team, team)
+
+
+def similarity(a, b):
+    return SequenceMatcher(None, a, b).ratio()
+
+
+class PlayerIdentityIndex:
+    """Canonical player IDs with blocked fuzzy matching and memoized resolutions"""
+
+    def __init__(self, index_file='data/player_identity.json'):
+        self.index_file = index_file
+        self.lock = threading.Lock()
+        self.players = {}       # id -> {'name', 'key', 'sport', 'team', 'position'}
+        self.resolved = {}      # 'source|sport|name|team' -> id
+        self.source_ids = {}    # 'source|sport|source id' -> id
+        self.dirty = False
+        self.load()
+
+        # Derived lookups, rebuilt from the saved index on load
+        self.by_key = {}
+        self.blocks = {}
+        self.claimed = {}       # (source, id) -> normalized names that source uses for the player
+        for player_id, player in self.players.items():
+            self.add_to_lookups(player_id, player)
+        for memo_key, player_id in self.resolved.items():
+            source, _sport, name, _team = memo_key.split('|', 3)
+            self.claimed.setdefault((source, player_id), set()).add(normalize_name(name))
+
+    def load(self):
+        if not os.path.exists(self.index_file):
+            return
+        with open(self.index_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.players = data.get('players', {})
+        self.resolved = data.get('resolved', {})
+        self.source_ids = data.get('source_ids', {})
+
+    def save(self):
+        """Write the index if anything changed"""
+        with self.lock:
+            if not self.dirty:
+                return False
+            data = {'players': self.players, 'resolved': self.resolved, 'source_ids': self.source_ids}
+            self.dirty = False
+
+        os.makedirs(os.path.dirname(self.index_file) or '.', exist_ok=True)
+        tmp_file = f"{self.index_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        os.replace(tmp_file, self.index_file)
+        return True
+
+    def add_to_lookups(self, player_id, player):
+        self.by_key.setdefault((player['sport'], player['key']), []).append(player_id)
+        self.blocks.setdefault((player['sport'], player['team']), []).append(player_id)
+
+    def new_player(self, sport, name, key, team, position):
+        base = f"{sport}:{key.replace(' ', '-')}"
+        player_id = base
+        suffix = 2
+        while player_id in self.players:
+            player_id = f"{base}-{suffix}"
+            suffix += 1
+
+        player = {'name': name, 'key': key, 'sport': sport, 'team': team, 'position': position}
+        self.players[player_id] = player
+        self.add_to_lookups(player_id, player)
+        return player_id
+
+    def match(self, source, sport, key, team, position):
+        """Existing player for a normalized key, searching only its block"""
+        # Exact key on the same team; a team on either side that isn't known can't contradict it
+        exact = self.by_key.get((sport, key), [])
+        for player_id in exact:
+            if self.players[player_id]['team'] == team:
+                return player_id
+
+        if team is None:
+            return exact[0] if exact else None
+        unknown_team = [player_id for player_id in exact if self.players[player_id]['team'] is None]
+        if len(unknown_team) == 1:
+            return unknown_team[0]
+
+        # Fuzzy: same sport and team, and same position when both sides know it
+        best_id, best_score = None, MATCH_THRESHOLD
+        for player_id in self.blocks.get((sport, team), []):
+            player = self.players[player_id]
+            if position and player['position'] and player['position'] != position:
+                continue
+            # The source already names this player differently, so this is someone else
+            if self.claimed.get((source, player_id), {key}) - {key}:
+                continue
+            # Cheap prefilter: last names must start alike
+            if player['key'].split(' ')[-1][:2] != key.split(' ')[-1][:2]:
+                continue
+            score = similarity(key, player['key'])
+            if score > best_score:
+                best_id, best_score = player_id, score
+        return best_id
+
+    def resolve(self, source, sport, name, team=None, position=None, source_id=None):
+        """Canonical ID for a source's player, creating one if the player is new"""
+        if not name:
+            return None
+        team = normalize_team(sport, team)
+        memo_key = f"{source}|{sport}|{name}|{team or ''}"
+
+        player_id = self.resolved.get(memo_key)
+        if player_id is not None:
+            return player_id
+
+        with self.lock:
+            id_key = f"{source}|{sport}|{source_id}" if source_id else None
+            player_id = self.source_ids.get(id_key) if id_key else None
+
+            key = normalize_name(name)
+            if player_id is None:
+                player_id = self.match(source, sport, key, team, position)
+            if player_id is None:
+                player_id = self.new_player(sport, name, key, team, position)
+
+            self.resolved[memo_key] = player_id
+            self.claimed.setdefault((source, player_id), set()).add(key)
+            if id_key:
+                self.source_ids[id_key] = player_id
+            self.dirty = True
+            return player_id
+
+    def resolve_frame(self, frame):
+        """player_id for every row of a canonical projection table
+
+        Each distinct (source, sport, player, team) is resolved once and
+        mapped back onto the rows.
+        """
+        keys = frame[['source', 'sport', 'player', 'team']].drop_duplicates()
+        ids = {
+            (source, sport, player, team): self.resolve(source, sport, player, team)
+            for source, sport, player, team in keys.itertuples(index=False, name=None)
+        }
+        return [
+            ids[key] for key in frame[['source', 'sport', 'player', 'team']].itertuples(index=False, name=None)
+        ]
+
+
+def main():
+    """Command-line entry point"""
+    import argparse
+    import time
+    from projection_schema import CanonicalCache
+
+    parser = argparse.ArgumentParser(description='Build or update the cross-source player identity index')
+    parser.add_argument('--index-file', default='data/player_identity.json', help='Index path')
+    parser.add_argument('--history-dir', default='data/history', help='History directory (default: data/history)')
+    args = parser.parse_args()
+
+    frame = CanonicalCache().latest(args.history_dir)
+    index = PlayerIdentityIndex(args.index_file)
+
+    start = time.time()
+    frame['player_id'] = index.resolve_frame(frame)
+    print(f"✓ Resolved {len(frame)} rows to {frame['player_id'].nunique()} players in {time.time() - start:.2f}s")
+
+    shared = frame.groupby('player_id')['source'].nunique()
+    print(f"  {int((shared > 1).sum())} players matched across two or more sources")
+
+    if index.save():
+        print(f"✓ Saved {args.index_file}")
+
+
+if __name__ == "__main__":
+    main()
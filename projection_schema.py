@@ -0,0 +1,284 @@
+"""
+Projection Schema
+One canonical, long-format table for every source and sport:
+
+    player, team, opp, sport, stat, value, source, snapshot_ts
+
+Each source's header is mapped to canonical identity fields and stat names
+through column_mapping, so "pts" means the same thing whether it came from
+Rotogrinders, Stokastic, Dimers or Rotowire. Tables are built once per
+snapshot payload and cached in memory and on disk (keyed by content hash),
+so cross-source work never re-parses or re-maps a file it has seen.
+The disk cache key also covers SCHEMA_VERSION and the alias tables, so
+changing a mapping rebuilds the tables instead of serving old ones.
+"""
+
+import os
+import csv
+import json
+import hashlib
+import threading
+from io import StringIO
+from collections import OrderedDict
+
+import pandas as pd
+
+from column_mapping import compile_mapping
+from columnar_history import split_name, unique_names
+from history_store import HistoryStore, content_hash, read_snapshot
+from rotowire_parser import read_rotowire
+from dimers_parser import read_dimers
+
+
+CANONICAL_COLUMNS = ['player', 'team', 'opp', 'sport', 'stat', 'value', 'source', 'snapshot_ts']
+
+IDENTITY_FIELDS = {
+    'player': ('PLAYER', 'Player', 'Player Name', 'NAME', 'Name'),
+    'first_name': ('First Name',),
+    'last_name': ('Last Name',),
+    'team': ('TEAM', 'Team'),
+    'opp': ('OPP', 'Opp', 'Opponent', 'Game/OPP'),
+    'matchup': ('Matchup',),
+}
+
+# Canonical stat -> header aliases across all sources, per sport
+STAT_FIELDS = {
+    'nba': {
+        'fpts': ('FPTS', 'DFS', 'Fantasy Points'),
+        'min': ('MINUTES', 'MIN', 'Proj Min'),
+        'pts': ('PTS', 'Exp Pts', 'Popular Stats/PTS'),
+        'reb': ('REB', 'Exp Reb', 'Popular Stats/REB'),
+        'ast': ('AST', 'Exp Ast', 'Popular Stats/AST'),
+        '3pm': ('3PM', 'Exp 3P', 'Three Pointers/3PM'),
+        'stl': ('STL', 'Exp Stl', 'Popular Stats/STL'),
+        'blk': ('BLK', 'Exp Blk', 'Popular Stats/BLK'),
+        'to': ('TO', 'Exp TO', 'Popular Stats/TO'),
+        'pra': ('PRA', 'Exp PRA'),
+        'pr': ('PR',),
+        'pa': ('PA',),
+        'floor': ('FLOOR',),
+        'ceil': ('CEIL',),
+        'own': ('POWN',),
+        'salary': ('SALARY',),
+    },
+    'nfl': {
+        'fpts': ('FPTS', 'PPR', 'Fantasy/Points'),
+        'fpts_half_ppr': ('HPPR',),
+        'pass_att': ('PAATT', 'Att', 'Passing/ATT'),
+        'pass_cmp': ('CMP', 'Comp', 'Passing/COMP', 'Passing/CMP'),
+        'pass_yds': ('PAYDS', 'Pass Yds', 'Passing/YDS'),
+        'pass_td': ('PATD', 'Passing/TD'),
+        'int': ('INT', 'Passing/INT'),
+        'rush_att': ('RUATT', 'Rushing/ATT'),
+        'rush_yds': ('RUYDS', 'Rushing/YDS'),
+        'rush_td': ('RUTD', 'Rushing/TD'),
+        'targets': ('TAR', 'Receiving/TAR'),
+        'rec': ('REC', 'Receiving/REC'),
+        'rec_yds': ('REYDS', 'Receiving/YDS'),
+        'rec_td': ('RETD', 'Receiving/TD'),
+        'td_1plus_pct': ('TD/1+',),
+        'td_2plus_pct': ('TD/2+',),
+        'td_3plus_pct': ('TD/3+',),
+        'first_td_pct': ('TD/1st',),
+        'floor': ('FLOOR',),
+        'ceil': ('CEIL',),
+        'own': ('POWN',),
+        'salary': ('SALARY',),
+    },
+    'nhl': {
+        'fpts': ('FPTS',),
+        'min': ('TOI', 'Min'),
+        'goals': ('G', 'Goals', 'Overall/G'),
+        'assists': ('AST', 'A', 'Assists', 'Overall/A'),
+        'points': ('PTS', 'Pts', 'Overall/Pts'),
+        'sog': ('SOG', 'Shots', 'Overall/SOG'),
+        'blocks': ('BLK', 'Blocks', 'Defense/BS'),
+        'hits': ('HITS', 'Hits', 'Defense/Hits'),
+        'pim': ('PIM', 'Overall/PIM'),
+        'pp_goals': ('PP/G',),
+        'pp_assists': ('PP/A',),
+        'ppp': ('PPPTS',),
+        'floor': ('FLOOR',),
+        'ceil': ('CEIL',),
+        'own': ('POWN',),
+        'salary': ('SALARY',),
+    },
+}
+
+# Feeds whose bare headers mean something narrower than the sport-wide aliases
+FEED_STAT_FIELDS = {
+    'stokastic_nfl_passing': {
+        'pass_att': ('Att',),
+        'pass_cmp': ('Comp',),
+        'pass_yds': ('Pass Yds',),
+        'pass_td': ('TD',),
+        'int': ('INT',),
+        'fumbles': ('Fum',),
+    },
+}
+
+
+# Bump when build_canonical's output changes for the same payload; cached
+# tables are keyed by this and the alias tables, so stale pickles are never read
+SCHEMA_VERSION = 1
+SCHEMA_KEY = hashlib.sha256(json.dumps(
+    [SCHEMA_VERSION, CANONICAL_COLUMNS, IDENTITY_FIELDS, STAT_FIELDS, FEED_STAT_FIELDS], sort_keys=True
+).encode('utf-8')).hexdigest()[:8]
+
+
+def read_rows(csv_content):
+    """Header and rows of a projection CSV, padded to the header width"""
+    rows = [row for row in csv.reader(StringIO(csv_content.lstrip('\ufeff'))) if any(row)]
+    if not rows:
+        return [], []
+
+    header = unique_names(rows[0])
+    width = len(header)
+    return header, [(row + [''] * width)[:width] for row in rows[1:]]
+
+
+# Source -> reader returning (header, rows); sources not listed use read_rows
+READERS = {
+    'rotowire': read_rotowire,
+    'dimers': read_dimers,
+}
+
+
+def stat_fields(name):
+    """Canonical stat spec for a feed name like 'stokastic_nfl_passing'"""
+    _source, sport, _stat_type = split_name(name)
+    return FEED_STAT_FIELDS.get(name, STAT_FIELDS.get(sport, {}))
+
+
+def to_numeric(values):
+    """Series of text to floats, tolerating thousands separators and percent signs"""
+    cleaned = values.astype(str).str.strip().str.replace(',', '', regex=False).str.rstrip('%')
+    return pd.to_numeric(cleaned, errors='coerce')
+
+
+def split_matchup(matchup, team):
+    """Opponent from matchups like 'IND@BOS' or 'MEM vs. OKC' given each row's team"""
+    sides = matchup.fillna('').str.split(r'\s*(?:@|\bvs\.?)\s*', n=1, expand=True, regex=True)
+    if sides.shape[1] < 2:
+        return pd.Series([None] * len(matchup), index=matchup.index)
+    away, home = sides[0].str.strip(), sides[1].fillna('').str.strip()
+    return away.where(team != away, home).where(home != '', None)
+
+
+def empty_frame():
+    return pd.DataFrame({column: pd.Series(dtype='object') for column in CANONICAL_COLUMNS})
+
+
+def build_canonical(name, csv_content, snapshot_ts=None):
+    """Canonical long-format table for one snapshot payload"""
+    source, sport, _stat_type = split_name(name)
+    header, rows = READERS.get(source, read_rows)(csv_content)
+    if not header or not rows:
+        return empty_frame()
+
+    frame = pd.DataFrame(rows, columns=header)
+    _, identity = compile_mapping(header, IDENTITY_FIELDS, ())
+    _, stats = compile_mapping(header, stat_fields(name), ())
+    identity = dict(identity)
+
+    def column(field):
+        index = identity.get(field)
+        if index is None:
+            return pd.Series([None] * len(frame), index=frame.index, dtype='object')
+        return frame.iloc[:, index].astype(str).str.strip().replace('', None)
+
+    player = column('player')
+    if identity.get('player') is None and identity.get('first_name') is not None:
+        player = (column('first_name').fillna('') + ' ' + column('last_name').fillna('')).str.strip().replace('', None)
+
+    team = column('team')
+    opp = column('opp')
+    if identity.get('opp') is None and identity.get('matchup') is not None:
+        opp = split_matchup(column('matchup'), team)
+
+    wide = pd.DataFrame({'player': player, 'team': team, 'opp': opp})
+    for stat, index in stats:
+        if index is not None:
+            wide[stat] = to_numeric(frame.iloc[:, index])
+
+    wide = wide[wide['player'].notna()]
+    long = wide.melt(id_vars=['player', 'team', 'opp'], var_name='stat', value_name='value')
+    long = long[long['value'].notna()].reset_index(drop=True)
+    long['sport'] = sport
+    long['source'] = source
+    long['snapshot_ts'] = pd.Timestamp(snapshot_ts) if snapshot_ts is not None else pd.NaT
+    return long[CANONICAL_COLUMNS]
+
+
+class CanonicalCache:
+    """Canonical tables per snapshot, cached by (feed, content hash)"""
+
+    def __init__(self, cache_dir='.canonical_cache', max_items=256):
+        self.cache_dir = cache_dir
+        self.max_items = max_items
+        self.memory = OrderedDict()
+        self.lock = threading.Lock()
+
+    def cache_path(self, name, digest):
+        return os.path.join(self.cache_dir, f"{name}-{digest[:16]}-{SCHEMA_KEY}.pkl")
+
+    def payload_frame(self, name, digest, load):
+        """Canonical table for a payload, without snapshot_ts
+
+        load() returns the CSV text and is only called on a cache miss.
+        """
+        key = (name, digest)
+
+        with self.lock:
+            frame = self.memory.get(key)
+            if frame is not None:
+                self.memory.move_to_end(key)
+                return frame
+
+        path = self.cache_path(name, digest)
+        if os.path.exists(path):
+            frame = pd.read_pickle(path)
+        else:
+            frame = build_canonical(name, load())
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            frame.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+
+        with self.lock:
+            self.memory[key] = frame
+            while len(self.memory) > self.max_items:
+                self.memory.popitem(last=False)
+        return frame
+
+    def snapshot(self, name, timestamp, path, digest=None):
+        """Canonical table for one stored snapshot"""
+        if digest is None:
+            csv_content = read_snapshot(path)
+            digest = content_hash(csv_content)
+            frame = self.payload_frame(name, digest, lambda: csv_content)
+        else:
+            frame = self.payload_frame(name, digest, lambda: read_snapshot(path))
+
+        frame = frame.copy()
+        frame['snapshot_ts'] = pd.to_datetime(timestamp, format='%Y-%m-%d_%H-%M')
+        return frame
+
+    def latest(self, history_dir='data/history', sports=None):
+        """Canonical table of the most recent snapshot of every feed"""
+        store = HistoryStore(history_dir)
+        digests = {(e['name'], e['ts']): e['sha256'] for e in store.entries()}
+
+        newest = {}
+        for name, timestamp, path in store.snapshots():
+            newest[name] = (timestamp, path)
+
+        frames = []
+        for name, (timestamp, path) in sorted(newest.items()):
+            _source, sport, _stat_type = split_name(name)
+            if sports and sport not in sports:
+                continue
+            frames.append(self.snapshot(name, timestamp, path, digests.get((name, timestamp))))
+
+        frames = [frame for frame in frames if len(frame)]
+        return pd.concat(frames, ignore_index=True) if frames else empty_frame()
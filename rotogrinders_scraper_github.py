@@ -7,7 +7,7 @@ import os
 import sys
 import time
 import json
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -17,20 +17,41 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import pandas as pd
 
+from page_readiness import PageReadiness
+from resource_blocking import apply_resource_blocking, blocking_prefs
+from http_client import NOT_MODIFIED, ConditionalFetcher, get_session, load_cookies
+from history_store import HistoryStore
+from git_publish import commit_and_push
+from column_mapping import NBA_FIELDS, NFL_FIELDS, NHL_FIELDS, parse_players
+
 
 class RotogrindersScraperGitHub:
     """Rotogrinders scraper with GitHub integration"""
     
-    def __init__(self, config):
+    PROJECTION_URLS = {
+        'nba': 'https://rotogrinders.com/projected-stats/nba',
+        'nfl': 'https://rotogrinders.com/projected-stats/nfl',
+        'nhl': 'https://rotogrinders.com/projected-stats/nhl',
+    }
+    
+    def __init__(self, config, data_dir='data'):
         self.config = config
         self.driver = None
-        self.data_dir = 'data'
-        self.history_dir = 'data/history'
+        self.data_dir = data_dir
+        self.history_dir = os.path.join(data_dir, 'history')
+        self.session_file = config.get('rg_session_file', '.rg_session.json')
         self.scraped_data = {}
+        self.written_files = []
+        self.csv_urls = {}
+        
+        # Pooled HTTP session and ETag/Last-Modified validators shared by every download
+        self.http = get_session()
+        self.fetcher = ConditionalFetcher(config.get('rg_validators_file', '.http_validators.json'), self.http)
         
         # Create data directories
         os.makedirs(self.data_dir, exist_ok=True)
         os.makedirs(self.history_dir, exist_ok=True)
+        self.history = HistoryStore(self.history_dir)
     
     def setup_driver(self, headless=True):
         """Setup Chrome webdriver with network logging"""
@@ -45,8 +66,13 @@ class RotogrindersScraperGitHub:
         # Enable network logging to capture API calls
         chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
         
+        # Don't load images or other resource types we never look at
+        chrome_options.add_experimental_option('prefs', blocking_prefs(self.config))
+        
         self.driver = webdriver.Chrome(options=chrome_options)
         self.wait = WebDriverWait(self.driver, 20)
+        self.ready = PageReadiness(self.driver)
+        apply_resource_blocking(self.driver, 'rotogrinders', self.config)
         print("✓ Browser initialized (with network logging)")
     
     def capture_api_calls(self, keyword=''):
@@ -81,6 +107,23 @@ class RotogrindersScraperGitHub:
             print(f"  Could not capture network logs: {e}")
             return []
     
+    def wait_for_download_button(self, sport, timeout=20):
+        """Wait until the Download CSV button carries a usable URL"""
+        return self.ready.js_condition(
+            f"{sport}: Download CSV button",
+            """
+                var links = document.querySelectorAll('a, button');
+                for (var i = 0; i < links.length; i++) {
+                    if (links[i].textContent.indexOf('Download') === -1) continue;
+                    if (links[i].getAttribute('href') || links[i].getAttribute('data-pointer')) {
+                        return true;
+                    }
+                }
+                return false;
+            """,
+            timeout
+        )
+    
     def close_popups(self):
         """Close any popup ads or overlays that might block elements"""
         try:
@@ -120,123 +163,20 @@ class RotogrindersScraperGitHub:
     
     def parse_nba_csv(self, csv_content):
         """Parse NBA CSV content into player dictionary"""
-        import csv
-        from io import StringIO
-        
-        players = {}
-        
-        try:
-            reader = csv.DictReader(StringIO(csv_content))
-            
-            for row in reader:
-                # Get player name - try various column names
-                player_name = row.get('Player', row.get('player', row.get('Name', row.get('name', ''))))
-                
-                if not player_name:
-                    continue
-                
-                # Map CSV columns to our format
-                players[player_name] = {
-                    'salary': row.get('Salary', row.get('salary', '')),
-                    'position': row.get('Position', row.get('Pos', row.get('pos', ''))),
-                    'team': row.get('Team', row.get('team', '')),
-                    'opponent': row.get('Opp', row.get('Opponent', row.get('opponent', ''))),
-                    'injury': row.get('Injury', row.get('injury', '')),
-                    'min': row.get('Minutes', row.get('Min', row.get('min', row.get('MINUTES', '')))),
-                    'pts': row.get('Points', row.get('Pts', row.get('pts', row.get('PTS', '')))),
-                    'reb': row.get('Rebounds', row.get('Reb', row.get('reb', row.get('REB', '')))),
-                    'ast': row.get('Assists', row.get('Ast', row.get('ast', row.get('AST', '')))),
-                    '3pm': row.get('3PM', row.get('3pm', row.get('Threes', ''))),
-                    'to': row.get('Turnovers', row.get('TO', row.get('to', ''))),
-                    'stl': row.get('Steals', row.get('Stl', row.get('stl', row.get('STL', '')))),
-                    'blk': row.get('Blocks', row.get('Blk', row.get('blk', row.get('BLK', '')))),
-                    'pa': row.get('P+A', row.get('PA', row.get('pa', ''))),
-                    'pr': row.get('P+R', row.get('PR', row.get('pr', ''))),
-                    'pra': row.get('P+R+A', row.get('PRA', row.get('pra', ''))),
-                    'bs': row.get('B+S', row.get('BS', row.get('bs', ''))),
-                    'ra': row.get('R+A', row.get('RA', row.get('ra', ''))),
-                    'fpts': row.get('FPTS', row.get('Fpts', row.get('fpts', row.get('Fantasy Points', '')))),
-                }
-            
-            print(f"  Parsed {len(players)} players from CSV")
-            return players
-            
-        except Exception as e:
-            print(f"  Error parsing CSV: {e}")
-            return {}
+        return self.parse_projection_csv(csv_content, NBA_FIELDS)
     
     def parse_nfl_csv(self, csv_content):
         """Parse NFL CSV content into player dictionary"""
-        import csv
-        from io import StringIO
-        
-        players = {}
-        
-        try:
-            reader = csv.DictReader(StringIO(csv_content))
-            
-            for row in reader:
-                player_name = row.get('Player', row.get('player', row.get('Name', row.get('name', ''))))
-                
-                if not player_name:
-                    continue
-                
-                players[player_name] = {
-                    'salary': row.get('Salary', row.get('salary', '')),
-                    'position': row.get('Position', row.get('Pos', row.get('pos', ''))),
-                    'team': row.get('Team', row.get('team', '')),
-                    'opponent': row.get('Opp', row.get('Opponent', row.get('opponent', ''))),
-                    'injury': row.get('Injury', row.get('injury', '')),
-                    'pass_att': row.get('Pass Att', row.get('ATT', row.get('att', ''))),
-                    'pass_yds': row.get('Pass Yds', row.get('PASS YDS', row.get('pass_yds', ''))),
-                    'pass_td': row.get('Pass TD', row.get('PASS TD', row.get('pass_td', ''))),
-                    'int': row.get('Int', row.get('INT', row.get('int', ''))),
-                    'rush_att': row.get('Rush Att', row.get('RUSH ATT', row.get('rush_att', ''))),
-                    'rush_yds': row.get('Rush Yds', row.get('RUSH YDS', row.get('rush_yds', ''))),
-                    'rush_td': row.get('Rush TD', row.get('RUSH TD', row.get('rush_td', ''))),
-                    'rec': row.get('Rec', row.get('REC', row.get('rec', ''))),
-                    'rec_yds': row.get('Rec Yds', row.get('REC YDS', row.get('rec_yds', ''))),
-                    'rec_td': row.get('Rec TD', row.get('REC TD', row.get('rec_td', ''))),
-                    'fpts': row.get('FPTS', row.get('Fpts', row.get('fpts', ''))),
-                }
-            
-            print(f"  Parsed {len(players)} players from CSV")
-            return players
-            
-        except Exception as e:
-            print(f"  Error parsing CSV: {e}")
-            return {}
+        return self.parse_projection_csv(csv_content, NFL_FIELDS)
     
     def parse_nhl_csv(self, csv_content):
         """Parse NHL CSV content into player dictionary"""
-        import csv
-        from io import StringIO
-        
-        players = {}
-        
+        return self.parse_projection_csv(csv_content, NHL_FIELDS)
+    
+    def parse_projection_csv(self, csv_content, fields):
+        """Parse a projection CSV with a header mapping compiled once per file"""
         try:
-            reader = csv.DictReader(StringIO(csv_content))
-            
-            for row in reader:
-                player_name = row.get('Player', row.get('player', row.get('Name', row.get('name', ''))))
-                
-                if not player_name:
-                    continue
-                
-                players[player_name] = {
-                    'salary': row.get('Salary', row.get('salary', '')),
-                    'position': row.get('Position', row.get('Pos', row.get('pos', ''))),
-                    'team': row.get('Team', row.get('team', '')),
-                    'opponent': row.get('Opp', row.get('Opponent', row.get('opponent', ''))),
-                    'goals': row.get('Goals', row.get('G', row.get('goals', ''))),
-                    'assists': row.get('Assists', row.get('A', row.get('assists', ''))),
-                    'points': row.get('Points', row.get('Pts', row.get('points', ''))),
-                    'sog': row.get('SOG', row.get('Shots', row.get('sog', ''))),
-                    'blocks': row.get('Blocks', row.get('Blk', row.get('blocks', ''))),
-                    'pim': row.get('PIM', row.get('pim', '')),
-                    'fpts': row.get('FPTS', row.get('Fpts', row.get('fpts', ''))),
-                }
-            
+            players = parse_players(csv_content, fields)
             print(f"  Parsed {len(players)} players from CSV")
             return players
             
@@ -250,47 +190,49 @@ class RotogrindersScraperGitHub:
         
         try:
             self.driver.get('https://rotogrinders.com/sign-in')
-            print("  Waiting for login page to load...")
-            time.sleep(5)
             
             # Wait for username field (it's "username" not "email")
-            print("  Looking for username field...")
-            email_field = self.wait.until(
-                EC.presence_of_element_located((By.NAME, "username"))
+            print("  Waiting for username field...")
+            email_field = self.ready.wait_for(
+                'login: username field',
+                lambda d: 'sign-in' not in d.current_url.lower() or EC.element_to_be_clickable((By.NAME, "username"))(d)
             )
+            if email_field is True:
+                # A browser that is still signed in gets sent away from the sign-in page
+                print("✓ Already logged in")
+                return True
+            if not email_field:
+                print("❌ Login page did not load")
+                return False
             print("  ✓ Found username field")
             
-            time.sleep(1)
             email_field.clear()
-            time.sleep(0.5)
             email_field.send_keys(self.config['rg_username'])
             print(f"  ✓ Filled username")
-            time.sleep(1)
             
             # Wait for password field
-            print("  Looking for password field...")
-            password_field = self.wait.until(
-                EC.presence_of_element_located((By.NAME, "password"))
-            )
+            password_field = self.ready.element_clickable(By.NAME, "password", label='login: password field')
+            if not password_field:
+                print("❌ Could not find password field")
+                return False
             print("  ✓ Found password field")
             
-            time.sleep(1)
             password_field.clear()
-            time.sleep(0.5)
             password_field.send_keys(self.config['rg_password'])
             print("  ✓ Filled password")
-            time.sleep(1)
             
             # Wait for submit button to be clickable
-            print("  Looking for submit button...")
-            login_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "input[type='submit']"))
-            )
+            login_button = self.ready.element_clickable(By.CSS_SELECTOR, "input[type='submit']", label='login: submit button')
+            if not login_button:
+                print("❌ Could not find submit button")
+                return False
             print("  ✓ Found submit button, clicking...")
             login_button.click()
             print("  ✓ Clicked! Waiting for login to complete...")
             
-            time.sleep(8)  # Give more time for redirect
+            # Wait for the redirect away from the sign-in page
+            self.ready.url_excludes('sign-in', label='login: redirect')
+            self.ready.document_ready(label='login: landing page')
             
             # Save a screenshot to verify login status
             self.driver.save_screenshot('debug_after_login.png')
@@ -322,12 +264,12 @@ class RotogrindersScraperGitHub:
         print("\n=== Scraping NBA Projections ===")
         
         try:
-            self.driver.get('https://rotogrinders.com/projected-stats/nba')
+            self.driver.get(self.PROJECTION_URLS['nba'])
             print("Loading page...")
             
-            # Wait for page to load
+            # Wait for the download button to render
             print("Waiting for data to load...")
-            time.sleep(8)
+            self.wait_for_download_button('nba')
             
             # Close any popups or ads that might be blocking
             self.close_popups()
@@ -376,32 +318,16 @@ class RotogrindersScraperGitHub:
             
             if csv_url:
                 print(f"  CSV URL: {csv_url}")
+                self.csv_urls['nba'] = csv_url
                 
-                # Download the CSV directly using requests with session cookies
-                import requests
-                
-                # Get cookies from selenium
-                cookies = {c['name']: c['value'] for c in self.driver.get_cookies()}
+                # Download the CSV over the shared HTTP session with the browser's cookies
+                load_cookies(self.http, self.driver.get_cookies())
+                csv_content = self.fetch_csv('nba', csv_url)
                 
-                print("  Downloading CSV...")
-                response = requests.get(csv_url, cookies=cookies)
-                
-                if response.status_code == 200:
-                    csv_content = response.text
-                    
-                    # Save raw CSV (current)
-                    csv_file = os.path.join(self.data_dir, 'rotogrinders_nba.csv')
-                    with open(csv_file, 'w', encoding='utf-8') as f:
-                        f.write(csv_content)
-                    print(f"  ✓ Saved CSV: {csv_file}")
-                    
-                    # Save historical copy
-                    self.save_historical('nba', csv_content)
-                    
-                    self.scraped_data['nba'] = {'csv_saved': True, 'bytes': len(csv_content)}
-                    return self.scraped_data['nba']
-                else:
-                    print(f"  ❌ Failed to download CSV: {response.status_code}")
+                if csv_content is NOT_MODIFIED:
+                    return self.mark_unchanged('nba')
+                if csv_content:
+                    return self.save_projection_csv('nba', csv_content)
             else:
                 print("  ❌ Could not determine CSV URL")
             
@@ -420,7 +346,7 @@ class RotogrindersScraperGitHub:
         try:
             self.driver.get(url)
             print("Loading page...")
-            time.sleep(8)
+            self.wait_for_download_button(sport)
             
             # Close any popups
             self.close_popups()
@@ -468,16 +394,9 @@ class RotogrindersScraperGitHub:
             
             if csv_url:
                 print(f"  CSV URL: {csv_url}")
-                import requests
-                cookies = {c['name']: c['value'] for c in self.driver.get_cookies()}
-                
-                print("  Downloading CSV...")
-                response = requests.get(csv_url, cookies=cookies)
-                
-                if response.status_code == 200:
-                    return response.text
-                else:
-                    print(f"  ❌ Failed to download CSV: {response.status_code}")
+                self.csv_urls[sport] = csv_url
+                load_cookies(self.http, self.driver.get_cookies())
+                return self.fetch_csv(sport, csv_url)
             else:
                 print(f"  ❌ Could not determine CSV URL for {sport}")
             
@@ -489,98 +408,306 @@ class RotogrindersScraperGitHub:
     
     def scrape_nfl_projections(self):
         """Scrape NFL projections using CSV download"""
-        csv_content = self.download_csv_for_sport('nfl', 'https://rotogrinders.com/projected-stats/nfl')
+        csv_content = self.download_csv_for_sport('nfl', self.PROJECTION_URLS['nfl'])
         
+        if csv_content is NOT_MODIFIED:
+            return self.mark_unchanged('nfl')
         if csv_content:
-            # Save raw CSV
-            csv_file = os.path.join(self.data_dir, 'rotogrinders_nfl.csv')
-            with open(csv_file, 'w', encoding='utf-8') as f:
-                f.write(csv_content)
-            print(f"  ✓ Saved CSV: {csv_file}")
-            
-            # Save historical copy
-            self.save_historical('nfl', csv_content)
-            
-            self.scraped_data['nfl'] = {'csv_saved': True, 'bytes': len(csv_content)}
-            return self.scraped_data['nfl']
+            return self.save_projection_csv('nfl', csv_content)
         
         return None
     
     def scrape_nhl_projections(self):
         """Scrape NHL projections using CSV download"""
-        csv_content = self.download_csv_for_sport('nhl', 'https://rotogrinders.com/projected-stats/nhl')
+        csv_content = self.download_csv_for_sport('nhl', self.PROJECTION_URLS['nhl'])
         
+        if csv_content is NOT_MODIFIED:
+            return self.mark_unchanged('nhl')
         if csv_content:
-            # Save raw CSV
-            csv_file = os.path.join(self.data_dir, 'rotogrinders_nhl.csv')
-            with open(csv_file, 'w', encoding='utf-8') as f:
-                f.write(csv_content)
-            print(f"  ✓ Saved CSV: {csv_file}")
-            
-            # Save historical copy
-            self.save_historical('nhl', csv_content)
-            
-            self.scraped_data['nhl'] = {'csv_saved': True, 'bytes': len(csv_content)}
-            return self.scraped_data['nhl']
+            return self.save_projection_csv('nhl', csv_content)
         
         return None
     
-    def save_historical(self, sport, csv_content):
-        """Save a timestamped copy of the projection data for historical analysis"""
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
-        filename = f"rotogrinders_{sport}_{timestamp}.csv"
-        filepath = os.path.join(self.history_dir, filename)
+    def fetch_csv(self, sport, csv_url):
+        """Download a CSV with a conditional GET; returns text, NOT_MODIFIED or None"""
+        print("  Downloading CSV...")
+        response, csv_content = self.fetcher.get(csv_url, current_path=self.current_file(sport))
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
+        if csv_content is NOT_MODIFIED:
+            print(f"  ✓ {sport.upper()} unchanged since last download (304)")
+        elif csv_content is None:
+            print(f"  ❌ Failed to download CSV: {response.status_code}")
         
-        print(f"  ✓ Saved historical: {filepath}")
-        return filepath
+        return csv_content
     
-    def git_commit_and_push(self):
-        """Commit and push data to GitHub"""
-        print("\n=== Pushing to GitHub ===")
+    def mark_unchanged(self, sport):
+        """Record a sport whose CSV hasn't changed, without rewriting any files"""
+        self.scraped_data[sport] = {'csv_saved': False, 'unchanged': True}
+        return self.scraped_data[sport]
+    
+    def current_file(self, sport):
+        """Path of a sport's current CSV"""
+        return os.path.join(self.data_dir, f'rotogrinders_{sport}.csv')
+    
+    def save_projection_csv(self, sport, csv_content):
+        """Save the current CSV plus a historical copy for a sport"""
+        # One atomic write publishes the current CSV and the historical copy
+        csv_file = self.current_file(sport)
+        self.save_historical(sport, csv_content, csv_file)
+        print(f"  ✓ Saved CSV: {csv_file}")
+        
+        self.scraped_data[sport] = {'csv_saved': True, 'bytes': len(csv_content)}
+        return self.scraped_data[sport]
+    
+    def load_session(self):
+        """Load the persisted cookie jar and CSV URLs from a previous run"""
+        if not os.path.exists(self.session_file):
+            return None
         
         try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Check if we're in a git repo
-            result = subprocess.run(['git', 'status'], capture_output=True, text=True)
-            if result.returncode != 0:
-                print("❌ Not a git repository. Run 'git init' first.")
-                return False
-            
-            # Add all data files
-            subprocess.run(['git', 'add', 'data/'], check=True)
-            
-            # Check if there are changes to commit
-            result = subprocess.run(['git', 'diff', '--staged', '--quiet'], capture_output=True)
-            if result.returncode == 0:
-                print("  No changes to commit")
-                return True
-            
-            # Commit
-            subprocess.run(['git', 'commit', '-m', f'Update projections - {timestamp}'], check=True)
-            print("  ✓ Committed changes")
-            
-            # Push
-            result = subprocess.run(['git', 'push'], capture_output=True, text=True)
-            if result.returncode != 0:
-                print(f"  ⚠️ Push failed: {result.stderr}")
-                print("  You may need to set up remote: git remote add origin <your-repo-url>")
-                return False
-            
-            print("✓ Data pushed to GitHub successfully")
+            with open(self.session_file, 'r') as f:
+                session = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"  ⚠️ Could not read session file: {e}")
+            return None
+        
+        if not session.get('cookies') or not session.get('csv_urls'):
+            return None
+        
+        # Drop the session early if every cookie with an expiry has lapsed
+        now = time.time()
+        expiries = [c['expiry'] for c in session['cookies'] if c.get('expiry')]
+        if expiries and max(expiries) < now:
+            print("  Saved session has expired")
+            return None
+        
+        return session
+    
+    def save_session(self):
+        """Persist the authenticated cookie jar and resolved CSV URLs"""
+        if not self.driver or not self.csv_urls:
+            return False
+        
+        # Keep URLs from earlier runs for sports that weren't resolved this time
+        previous = self.load_session() or {}
+        csv_urls = dict(previous.get('csv_urls', {}))
+        csv_urls.update(self.csv_urls)
+        
+        session = {
+            'saved_at': datetime.now().isoformat(timespec='seconds'),
+            'cookies': self.driver.get_cookies(),
+            'csv_urls': csv_urls,
+        }
+        
+        try:
+            with open(self.session_file, 'w') as f:
+                json.dump(session, f, indent=2)
+            # Cookies are credentials - keep them private
+            os.chmod(self.session_file, 0o600)
+            print(f"  ✓ Saved session for {', '.join(sorted(csv_urls))} to {self.session_file}")
             return True
-            
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Git error: {str(e)}")
+        except OSError as e:
+            print(f"  ⚠️ Could not save session: {e}")
             return False
-        except FileNotFoundError:
-            print("❌ Git not found. Make sure git is installed and in PATH.")
+    
+    def is_projection_csv(self, content):
+        """Check that a response body is a projections CSV and not a sign-in page"""
+        if not content:
             return False
+        
+        header = content.lstrip('\ufeff').split('\n', 1)[0].upper()
+        if header.lstrip().startswith('<'):
+            return False
+        return 'PLAYER' in header and ',' in header
+    
+    def fetch_csv_direct(self, sport, csv_url):
+        """Fetch a CSV over plain HTTP using the saved session cookies"""
+        try:
+            response, csv_content = self.fetcher.get(csv_url, current_path=self.current_file(sport))
+        except Exception as e:
+            print(f"  ⚠️ {sport.upper()}: request failed: {e}")
+            return None
+        
+        if csv_content is NOT_MODIFIED:
+            return NOT_MODIFIED
+        
+        if csv_content is None:
+            print(f"  ⚠️ {sport.upper()}: HTTP {response.status_code}")
+            return None
+        
+        if 'sign-in' in response.url or not self.is_projection_csv(csv_content):
+            print(f"  ⚠️ {sport.upper()}: session expired or URL no longer resolves")
+            return None
+        
+        return csv_content
+    
+    def scrape_with_session(self, sports):
+        """Fast path: download CSVs over HTTP using a persisted session, no browser"""
+        print("\n=== Trying saved session (no browser) ===")
+        
+        session = self.load_session()
+        if not session:
+            print("  No usable saved session")
+            return {}
+        
+        return self.fetch_saved_urls(sports, session['cookies'], session['csv_urls'])
+    
+    def fetch_saved_urls(self, sports, cookies, csv_urls):
+        """Download CSVs over HTTP for sports with a known URL"""
+        load_cookies(self.http, cookies)
+        
+        results = {}
+        for sport in sports:
+            csv_url = csv_urls.get(sport)
+            if not csv_url:
+                print(f"  {sport.upper()}: no saved CSV URL")
+                continue
+            
+            csv_content = self.fetch_csv_direct(sport, csv_url)
+            if csv_content is NOT_MODIFIED:
+                print(f"  ✓ {sport.upper()}: unchanged since last download (304)")
+                self.csv_urls[sport] = csv_url
+                results[sport] = self.mark_unchanged(sport)
+            elif csv_content:
+                print(f"  ✓ {sport.upper()}: downloaded {len(csv_content)} bytes over HTTP")
+                self.csv_urls[sport] = csv_url
+                results[sport] = self.save_projection_csv(sport, csv_content)
+        
+        return results
     
-    def scrape_all(self, headless=False):
+    def save_historical(self, sport, csv_content, current_file=None):
+        """Record a snapshot for historical analysis, publishing current_file too; identical payloads are stored once"""
+        filepath, written, files = self.history.save(f"rotogrinders_{sport}", csv_content, current_path=current_file)
+        self.written_files.extend(f for f in files if f not in self.written_files)
+        if written:
+            print(f"  ✓ Saved historical: {filepath}")
+        else:
+            print(f"  ✓ Unchanged since {os.path.basename(filepath)}, recorded in manifest")
+        return filepath
+    
+    def git_commit_and_push(self):
+        """Commit the files written this run and push to GitHub"""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return commit_and_push(self.written_files, f'Update projections - {timestamp}')
+    
+    def scrape_sport(self, sport):
+        """Scrape one sport with the logged-in browser"""
+        scrapers = {
+            'nba': self.scrape_nba_projections,
+            'nfl': self.scrape_nfl_projections,
+            'nhl': self.scrape_nhl_projections,
+        }
+        return scrapers[sport]()
+    
+    def run_cycle(self, sports=None):
+        """One scrape with a browser that stays open between cycles
+        
+        Downloads over HTTP with the browser's current cookies first and only
+        logs in again (and visits the projection pages) for sports that fail.
+        """
+        sports = sports or list(self.PROJECTION_URLS)
+        results = {}
+        
+        if self.csv_urls:
+            results = self.fetch_saved_urls(sports, self.driver.get_cookies(), self.csv_urls)
+        
+        remaining = [sport for sport in sports if not results.get(sport)]
+        if remaining:
+            if not self.login():
+                print("Cannot continue without successful login")
+            else:
+                for sport in remaining:
+                    results[sport] = self.scrape_sport(sport)
+                self.save_session()
+        
+        self.fetcher.save()
+        return results
+    
+    def start_worker(self, headless=True):
+        """Start an extra browser for parallel sport scraping"""
+        worker = RotogrindersScraperGitHub(self.config, data_dir=self.data_dir)
+        worker.fetcher = self.fetcher
+        
+        try:
+            worker.setup_driver(headless=headless)
+            
+            # Cookies can only be set for the domain currently loaded
+            worker.driver.get('https://rotogrinders.com/robots.txt')
+        except Exception:
+            # The caller never gets this worker, so nothing else would close its browser
+            if worker.driver:
+                worker.driver.quit()
+            raise
+        return worker
+    
+    def share_cookies(self, worker, cookies):
+        """Copy the logged-in session cookies into a worker browser"""
+        for cookie in cookies:
+            try:
+                worker.driver.add_cookie(cookie)
+            except Exception:
+                continue  # Cookies for other domains can't be set here
+    
+    def scrape_parallel(self, sports, headless=False):
+        """Log in once, then load and download each sport in its own browser concurrently"""
+        print(f"\n=== Scraping {', '.join(s.upper() for s in sports)} in parallel ===")
+        
+        results = {}
+        workers = []
+        
+        with ThreadPoolExecutor(max_workers=len(sports)) as pool:
+            # Start the extra browsers while this one logs in
+            pending = [pool.submit(self.start_worker, headless) for _ in sports[1:]]
+            
+            try:
+                logged_in = self.login()
+                
+                for future in pending:
+                    try:
+                        workers.append(future.result())
+                    except Exception as e:
+                        print(f"  ⚠️ Could not start worker browser: {e}")
+                
+                if not logged_in:
+                    print("Cannot continue without successful login")
+                    return results
+                
+                cookies = self.driver.get_cookies()
+                for worker in workers:
+                    self.share_cookies(worker, cookies)
+                
+                # This browser takes the first sport, each worker takes one more
+                scrapers = [self] + workers
+                jobs = {
+                    sport: pool.submit(scraper.download_csv_for_sport, sport, self.PROJECTION_URLS[sport])
+                    for scraper, sport in zip(scrapers, sports)
+                }
+                
+                for sport, job in jobs.items():
+                    results[sport] = job.result()
+                
+                # Sports left without a worker (one failed to start) reuse this browser
+                for sport in sports[len(scrapers):]:
+                    results[sport] = self.download_csv_for_sport(sport, self.PROJECTION_URLS[sport])
+                
+            finally:
+                for worker in workers:
+                    self.csv_urls.update(worker.csv_urls)
+                    self.ready.timings.extend(worker.ready.timings)
+                    worker.driver.quit()
+        
+        # Write files from this thread once every download has finished
+        saved = {}
+        for sport, csv_content in results.items():
+            if csv_content is NOT_MODIFIED:
+                saved[sport] = self.mark_unchanged(sport)
+            elif csv_content:
+                saved[sport] = self.save_projection_csv(sport, csv_content)
+            else:
+                saved[sport] = None
+        return saved
+    
+    def scrape_all(self, headless=False, use_session=True, parallel=False, push=True):
         """Scrape all sports and push to GitHub"""
         results = {
             'nba': None,
@@ -589,25 +716,39 @@ class RotogrindersScraperGitHub:
         }
         
         try:
-            self.setup_driver(headless=headless)
+            # Fetch whatever we can over HTTP with the saved session first
+            if use_session:
+                results.update(self.scrape_with_session(list(results)))
             
-            if not self.login():
-                print("Cannot continue without successful login")
-                return results
+            # Only fall back to the browser for sports the fast path couldn't get
+            remaining = [sport for sport in results if not results[sport]]
+            
+            if remaining:
+                print(f"\nUsing browser for: {', '.join(s.upper() for s in remaining)}")
+                self.setup_driver(headless=headless)
+                
+                if parallel and len(remaining) > 1:
+                    results.update(self.scrape_parallel(remaining, headless=headless))
+                    self.save_session()
+                elif not self.login():
+                    print("Cannot continue without successful login")
+                else:
+                    for sport in remaining:
+                        results[sport] = self.scrape_sport(sport)
+                    
+                    self.save_session()
             
-            # Scrape each sport
-            results['nba'] = self.scrape_nba_projections()
-            results['nfl'] = self.scrape_nfl_projections()
-            results['nhl'] = self.scrape_nhl_projections()
+            self.fetcher.save()
             
             # Push to GitHub if any data was scraped
-            if any(results.values()):
+            if push and any(results.values()):
                 self.git_commit_and_push()
             
             return results
             
         finally:
             if self.driver:
+                self.ready.report()
                 self.driver.quit()
                 print("\n✓ Browser closed")
 
@@ -621,6 +762,10 @@ def main():
                         help='Run browser in headless mode (no visible window)')
     parser.add_argument('--sport', choices=['nba', 'nfl', 'nhl', 'all'], default='all',
                         help='Which sport to scrape (default: all)')
+    parser.add_argument('--no-session', action='store_true',
+                        help='Ignore the saved session and always log in with the browser')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Load each sport in its own browser at the same time after a single login')
     args = parser.parse_args()
     
     print("=" * 60)
@@ -657,7 +802,8 @@ def main():
     
     # Create scraper and run
     scraper = RotogrindersScraperGitHub(config)
-    results = scraper.scrape_all(headless=args.headless)
+    results = scraper.scrape_all(headless=args.headless, use_session=not args.no_session,
+                                 parallel=args.parallel)
     
     print("\n" + "=" * 60)
     print("Scraping Complete!")
@@ -0,0 +1,109 @@
+"""
+Rotowire Parser
+Rotowire exports start with a UTF-8 BOM and a row of group labels
+("Popular Stats", "Passing", "PP", "SH", ...) spanning the real column
+names below them. The two rows are merged into qualified names such as
+"Passing/YDS" and "Rushing/YDS"; columns outside any group keep their bare
+name. Weekly labels like "Week 16 Game" are normalized to "Game" so names
+stay stable from week to week.
+
+Rows are streamed from any iterable of lines and typed as they are read:
+numeric cells become floats, blanks become None.
+"""
+
+import re
+import csv
+from io import StringIO
+
+import pandas as pd
+
+
+GROUP_SEPARATOR = '/'
+WEEK_LABEL_RE = re.compile(r'^Week\s+\d+\s+', re.IGNORECASE)
+
+
+def is_group_row(first, second):
+    """A label row sits above the real header: mostly blank where the header is full"""
+    blanks = sum(1 for value in first if not value.strip())
+    return bool(second) and blanks > len(first) // 2 and all(value.strip() for value in second)
+
+
+def normalize_group(label):
+    return WEEK_LABEL_RE.sub('', label.strip())
+
+
+def qualified_names(group_row, column_row):
+    """Merge a group-label row and a column row into unique qualified names"""
+    names = []
+    group = ''
+    for index, column in enumerate(column_row):
+        label = group_row[index] if index < len(group_row) else ''
+        if label.strip():
+            group = normalize_group(label)
+        column = column.strip()
+        names.append(f"{group}{GROUP_SEPARATOR}{column}" if group else column)
+
+    # Guard against a group repeating a column name (never seen, but keep names unique)
+    seen = {}
+    unique = []
+    for name in names:
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        unique.append(f"{name}.{count}" if count else name)
+    return unique
+
+
+def to_value(text):
+    """Float for numeric text, None for blanks, the stripped text otherwise"""
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        return float(text.replace(',', '').rstrip('%'))
+    except ValueError:
+        return text
+
+
+class RotowireReader:
+    """Streaming reader over the lines of a Rotowire export"""
+
+    def __init__(self, lines):
+        self.reader = csv.reader(lines)
+        first = next(self.reader, [])
+        if first:
+            first[0] = first[0].lstrip('\ufeff')
+
+        second = next(self.reader, None)
+        if second is not None and is_group_row(first, second):
+            self.columns = qualified_names(first, second)
+            self.pending = None
+        else:
+            self.columns = [column.strip() for column in first]
+            self.pending = second
+
+    def raw_rows(self):
+        """Rows as text, padded or trimmed to the header width"""
+        width = len(self.columns)
+        if self.pending is not None:
+            yield (self.pending + [''] * width)[:width]
+        for row in self.reader:
+            if any(row):
+                yield (row + [''] * width)[:width]
+
+    def __iter__(self):
+        for row in self.raw_rows():
+            yield [to_value(value) for value in row]
+
+
+def read_rotowire(csv_content):
+    """(qualified header, text rows) for projection_schema's reader registry"""
+    reader = RotowireReader(StringIO(csv_content))
+    return reader.columns, list(reader.raw_rows())
+
+
+def load_rotowire(path):
+    """Typed DataFrame of a Rotowire export"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = RotowireReader(f)
+        frame = pd.DataFrame(list(reader), columns=reader.columns)
+    return frame.infer_objects()
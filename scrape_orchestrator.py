@@ -0,0 +1,226 @@
+"""
+Scrape Orchestrator
+Runs the Rotogrinders, Stokastic and Dimers scrapers in parallel worker
+processes, then writes every CSV and commits them in a single batch
+"""
+
+import os
+import sys
+import time
+import json
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from git_publish import commit_and_push
+from history_store import HistoryStore, parse_snapshot_name, publish_file, read_text
+
+
+# source -> (module, class, config key that must be set)
+SOURCES = {
+    'rotogrinders': ('rotogrinders_scraper_github', 'RotogrindersScraperGitHub', 'rg_username'),
+    'stokastic': ('stokastic_scraper', 'StokasticScraper', 'stokastic_username'),
+    'dimers': ('dimers_scraper', 'DimersScraper', 'dimers_username'),
+}
+
+
+def run_source(source, config, headless=True, options=None):
+    """Run one scraper in a private data directory and return its CSV payloads
+
+    Executed inside a worker process. The scraper writes into a temp
+    directory and never commits; the parent process does that once for all
+    sources.
+    """
+    import importlib
+
+    module_name, class_name, _ = SOURCES[source]
+    scraper_class = getattr(importlib.import_module(module_name), class_name)
+
+    start = time.time()
+    work_dir = tempfile.mkdtemp(prefix=f'{source}_')
+    payloads = {}
+
+    try:
+        scraper = scraper_class(config, data_dir=work_dir)
+        results = scraper.scrape_all(headless=headless, push=False, **(options or {}))
+
+        # Key payloads by path relative to the data directory, e.g. history/x.csv.
+        # Only the CSVs travel back; the manifest and Parquet parts are rebuilt
+        # by the parent's history store.
+        for path in scraper.written_files:
+            if not path.endswith(('.csv', '.csv.gz')):
+                continue
+            payloads[os.path.relpath(path, work_dir)] = read_text(path)
+
+        return {
+            'source': source,
+            'results': results,
+            'payloads': payloads,
+            'seconds': round(time.time() - start, 1),
+            'error': None,
+        }
+
+    except Exception as e:
+        return {
+            'source': source,
+            'results': {},
+            'payloads': payloads,
+            'seconds': round(time.time() - start, 1),
+            'error': str(e),
+        }
+
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+class ScrapeOrchestrator:
+    """Runs all scrapers concurrently and commits their output once"""
+
+    def __init__(self, config, data_dir='data'):
+        self.config = config
+        self.data_dir = data_dir
+
+    def configured_sources(self, sources):
+        """Drop sources whose credentials are missing from the config"""
+        ready = []
+        for source in sources:
+            username_key = SOURCES[source][2]
+            if self.config.get(username_key):
+                ready.append(source)
+            else:
+                print(f"  ⚠️ Skipping {source}: no {username_key} in config")
+        return ready
+
+    def run(self, sources=None, headless=True, source_options=None, push=True):
+        """Scrape every source in parallel, write all payloads, then commit once"""
+        sources = self.configured_sources(sources or list(SOURCES))
+        source_options = source_options or {}
+
+        if not sources:
+            print("❌ No configured sources to scrape")
+            return {}
+
+        print(f"\n=== Scraping {', '.join(sources)} in parallel ===")
+        start = time.time()
+        reports = {}
+
+        with ProcessPoolExecutor(max_workers=len(sources)) as pool:
+            futures = {
+                pool.submit(run_source, source, self.config, headless, source_options.get(source)): source
+                for source in sources
+            }
+
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    report = future.result()
+                except Exception as e:
+                    report = {'source': source, 'results': {}, 'payloads': {}, 'seconds': 0, 'error': str(e)}
+
+                reports[source] = report
+                if report['error']:
+                    print(f"❌ {source}: {report['error']}")
+                else:
+                    print(f"✓ {source}: {len(report['payloads'])} files in {report['seconds']}s")
+
+        print(f"\n✓ All sources finished in {time.time() - start:.1f}s")
+
+        written = []
+        for source in sources:
+            written.extend(self.write_payloads(reports[source]['payloads']))
+
+        if push and written:
+            self.git_commit_and_push(written)
+
+        return reports
+
+    def write_payloads(self, payloads):
+        """Write collected CSV payloads into the data directory
+
+        Worker history starts from an empty temp directory, so snapshots are
+        replayed through the real history store rather than copied. Each
+        current CSV is published by the save of the snapshot with the same
+        content, so the two are written together.
+        """
+        history = HistoryStore(os.path.join(self.data_dir, 'history'))
+        current = {
+            csv_content: rel_path for rel_path, csv_content in sorted(payloads.items())
+            if os.path.dirname(rel_path) != 'history'
+        }
+        written = []
+
+        for rel_path, csv_content in sorted(payloads.items()):
+            if os.path.dirname(rel_path) != 'history':
+                continue
+            name, timestamp = parse_snapshot_name(rel_path)
+            if not name:
+                continue
+            current_rel = current.pop(csv_content, None)
+            current_path = os.path.join(self.data_dir, current_rel) if current_rel else None
+            _path, _stored, files = history.save(name, csv_content, timestamp, current_path=current_path)
+            written.extend(f for f in files if f not in written)
+
+        # Current CSVs without a snapshot of the same content
+        for csv_content, rel_path in sorted(current.items(), key=lambda item: item[1]):
+            path = os.path.join(self.data_dir, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            written.append(publish_file(path, csv_content))
+
+        if written:
+            print(f"  ✓ Wrote {len(written)} files to {self.data_dir}/")
+        return written
+
+    def git_commit_and_push(self, paths):
+        """Commit exactly the files written this run and push once"""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return commit_and_push(paths, f'Update projections (all sources) - {timestamp}')
+
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Scrape all projection sources in parallel')
+    parser.add_argument('--headless', action='store_true', help='Run browsers in headless mode')
+    parser.add_argument('--sources', nargs='+', choices=list(SOURCES), default=list(SOURCES),
+                        help='Sources to scrape (default: all)')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Also scrape Rotogrinders sports in parallel browsers')
+    parser.add_argument('--no-push', action='store_true', help='Write files but do not commit or push')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Projection Scrape Orchestrator")
+    print("=" * 60)
+
+    if not os.path.exists('scraper_config.json'):
+        print("\n❌ No config file found!")
+        print("Please create scraper_config.json with credentials for each source")
+        return
+
+    with open('scraper_config.json', 'r') as f:
+        config = json.load(f)
+    print("✓ Loaded scraper_config.json")
+
+    orchestrator = ScrapeOrchestrator(config)
+    reports = orchestrator.run(
+        sources=args.sources,
+        headless=args.headless,
+        source_options={'rotogrinders': {'parallel': args.parallel}},
+        push=not args.no_push,
+    )
+
+    print("\n" + "=" * 60)
+    print("Scraping Complete!")
+    print("=" * 60)
+    for source, report in reports.items():
+        status = '✗' if report['error'] or not report['payloads'] else '✓'
+        print(f"{source}: {status} ({report['seconds']}s)")
+
+    failed = [s for s, r in reports.items() if r['error']]
+    sys.exit(1 if failed and len(failed) == len(reports) else 0)
+
+
+if __name__ == "__main__":
+    main()
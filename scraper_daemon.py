@@ -0,0 +1,262 @@
+"""
+Scraper Daemon
+Long-running alternative to the scheduled workflow for our own box. Keeps
+one logged-in browser per source, runs scrape cycles from an internal
+scheduler, re-logs in only when a session expires, and commits each
+cycle's files in one batch. Progress is written to a status file that a
+health check can read.
+"""
+
+import os
+import argparse
+import sys
+import time
+import json
+import signal
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from scrape_orchestrator import SOURCES, ScrapeOrchestrator
+
+
+class ScraperDaemon:
+    """Keeps warm browsers per source and scrapes on a fixed interval"""
+
+    def __init__(self, config, sources, interval_minutes=15, active_hours=None,
+                 headless=True, push=True, status_file='daemon_status.json'):
+        self.config = config
+        self.sources = sources
+        self.interval = timedelta(minutes=interval_minutes)
+        self.active_hours = active_hours
+        self.headless = headless
+        self.push = push
+        self.status_file = status_file
+        self.scrapers = {}
+        self.running = True
+        self.status = {
+            'pid': os.getpid(),
+            'started_at': datetime.now().isoformat(timespec='seconds'),
+            'state': 'starting',
+            'cycles': 0,
+            'next_run': None,
+            'last_cycle': None,
+            'sources': {
+                source: {'browser_starts': 0, 'last_success': None, 'consecutive_failures': 0, 'last_error': None}
+                for source in sources
+            },
+        }
+
+    def write_status(self):
+        """Atomically replace the health/status file"""
+        tmp_file = f"{self.status_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(self.status, f, indent=2)
+        os.replace(tmp_file, self.status_file)
+
+    def start_browser(self, source):
+        """Start (or restart) the browser for one source"""
+        old = self.scrapers.get(source)
+        if old and old.driver:
+            try:
+                old.driver.quit()
+            except Exception:
+                pass
+
+        module_name, class_name, _ = SOURCES[source]
+        scraper = getattr(importlib.import_module(module_name), class_name)(self.config)
+        scraper.setup_driver(headless=self.headless)
+
+        self.scrapers[source] = scraper
+        self.status['sources'][source]['browser_starts'] += 1
+        return scraper
+
+    def browser_alive(self, scraper):
+        """A cheap round trip to check Chrome is still responding"""
+        try:
+            scraper.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def run_source(self, source):
+        """Run one cycle for one source, restarting its browser if it died"""
+        scraper = self.scrapers.get(source)
+        if scraper is None or not self.browser_alive(scraper):
+            print(f"  Starting browser for {source}...")
+            scraper = self.start_browser(source)
+
+        # Per-cycle bookkeeping so a long-lived scraper doesn't accumulate it
+        scraper.written_files = []
+        scraper.ready.timings = []
+
+        results = scraper.run_cycle()
+        return results, list(scraper.written_files), scraper.ready.total_seconds()
+
+    def in_active_hours(self, when):
+        """Whether a time falls inside the configured active hours"""
+        if not self.active_hours:
+            return True
+        start, end = self.active_hours
+        if start <= end:
+            return start <= when.hour <= end
+        # Overnight range such as 22-2
+        return when.hour >= start or when.hour <= end
+
+    def next_run_after(self, when):
+        """Next scheduled time after a cycle, skipping inactive hours"""
+        candidate = when + self.interval
+        # Every hour of the day is checked at most once
+        for _ in range(24):
+            if self.in_active_hours(candidate):
+                break
+            candidate = (candidate + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
+        return candidate
+
+    def run_cycle(self):
+        """Scrape every source in parallel with its warm browser, then commit once"""
+        started = datetime.now()
+        print(f"\n=== Cycle {self.status['cycles'] + 1} at {started:%Y-%m-%d %H:%M:%S} ===")
+        self.status['state'] = 'scraping'
+        self.write_status()
+
+        written = []
+        summary = {}
+
+        with ThreadPoolExecutor(max_workers=len(self.sources)) as pool:
+            futures = {source: pool.submit(self.run_source, source) for source in self.sources}
+
+            for source, future in futures.items():
+                source_status = self.status['sources'][source]
+                try:
+                    results, files, wait_seconds = future.result()
+                    written.extend(files)
+                    ok = any(results.values())
+                    summary[source] = {'ok': ok, 'files': len(files), 'wait_seconds': round(wait_seconds, 1)}
+                    source_status['last_error'] = None
+                except Exception as e:
+                    ok = False
+                    summary[source] = {'ok': False, 'files': 0}
+                    source_status['last_error'] = str(e)
+                    print(f"❌ {source}: {e}")
+
+                if ok:
+                    source_status['last_success'] = datetime.now().isoformat(timespec='seconds')
+                    source_status['consecutive_failures'] = 0
+                else:
+                    source_status['consecutive_failures'] += 1
+
+        if self.push and written:
+            ScrapeOrchestrator(self.config).git_commit_and_push(written)
+
+        finished = datetime.now()
+        self.status['cycles'] += 1
+        self.status['last_cycle'] = {
+            'started_at': started.isoformat(timespec='seconds'),
+            'seconds': round((finished - started).total_seconds(), 1),
+            'files': len(written),
+            'sources': summary,
+        }
+        return finished
+
+    def stop(self, *_args):
+        """Finish the current cycle and exit"""
+        print("\nStopping after the current cycle...")
+        self.running = False
+
+    def run_forever(self):
+        """Scheduler loop"""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        next_run = datetime.now()
+        if not self.in_active_hours(next_run):
+            next_run = self.next_run_after(next_run)
+
+        try:
+            while self.running:
+                now = datetime.now()
+                if now >= next_run:
+                    finished = self.run_cycle()
+                    next_run = self.next_run_after(max(next_run, finished - self.interval))
+
+                self.status['state'] = 'idle'
+                self.status['next_run'] = next_run.isoformat(timespec='seconds')
+                self.write_status()
+
+                # Sleep in short steps so a stop signal is honoured promptly
+                time.sleep(max(0, min(5, (next_run - datetime.now()).total_seconds())))
+
+        finally:
+            for scraper in self.scrapers.values():
+                if scraper.driver:
+                    try:
+                        scraper.driver.quit()
+                    except Exception:
+                        pass
+            self.status['state'] = 'stopped'
+            self.status['next_run'] = None
+            self.write_status()
+            print("✓ Browsers closed")
+
+
+def parse_hours(value):
+    """Parse an active-hours range like '13-23', or '22-2' to run overnight"""
+    try:
+        start, end = (int(part) for part in value.split('-'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected START-END hours, got '{value}'")
+    if not (0 <= start <= 23 and 0 <= end <= 23):
+        raise argparse.ArgumentTypeError(f"hours must be between 0 and 23, got '{value}'")
+    return start, end
+
+
+def main():
+    """Main execution function"""
+
+    parser = argparse.ArgumentParser(description='Run the scrapers as a long-lived daemon')
+    parser.add_argument('--headless', action='store_true', help='Run browsers in headless mode')
+    parser.add_argument('--sources', nargs='+', choices=list(SOURCES), default=list(SOURCES),
+                        help='Sources to scrape (default: all configured)')
+    parser.add_argument('--interval', type=int, default=15, help='Minutes between cycles (default: 15)')
+    parser.add_argument('--hours', type=parse_hours, default=None,
+                        help="Only scrape during these local hours, e.g. '13-23'")
+    parser.add_argument('--status-file', default='daemon_status.json', help='Where to write health/status')
+    parser.add_argument('--no-push', action='store_true', help='Write files but do not commit or push')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Projection Scraper Daemon")
+    print("=" * 60)
+
+    if not os.path.exists('scraper_config.json'):
+        print("\n❌ No config file found!")
+        print("Please create scraper_config.json with credentials for each source")
+        return
+
+    with open('scraper_config.json', 'r') as f:
+        config = json.load(f)
+    print("✓ Loaded scraper_config.json")
+
+    sources = ScrapeOrchestrator(config).configured_sources(args.sources)
+    if not sources:
+        print("❌ No configured sources to scrape")
+        sys.exit(1)
+
+    print(f"Sources: {', '.join(sources)}")
+    print(f"Interval: every {args.interval} minutes")
+    print(f"Status file: {args.status_file}")
+
+    daemon = ScraperDaemon(
+        config, sources,
+        interval_minutes=args.interval,
+        active_hours=args.hours,
+        headless=args.headless,
+        push=not args.no_push,
+        status_file=args.status_file,
+    )
+    daemon.run_forever()
+
+
+if __name__ == "__main__":
+    main()
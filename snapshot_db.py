@@ -0,0 +1,313 @@
+"""
+Snapshot Database
+One-shot, resumable backfill of data/history into an indexed SQLite
+database. Snapshot filenames are parsed into (source, sport, stat_type,
+timestamp). A process pool hashes every file first and then parses only
+one file per distinct payload, so repeats cost a hash and nothing more.
+
+Every ingested file is recorded with its size and mtime, which doubles as
+the checkpoint: an interrupted run picks up where it stopped, and a rerun
+over an unchanged tree does nothing. Row values are stored as a JSON array
+aligned with the payload's column list.
+
+Files that history_archive.py has packed are ingested from the archive,
+once; their size and hash come from archive.jsonl.
+
+    python snapshot_db.py [--db data/snapshots.db] [--workers 8]
+"""
+
+import os
+import csv
+import json
+import time
+import sqlite3
+import hashlib
+from io import StringIO
+from concurrent.futures import ProcessPoolExecutor
+
+from history_archive import PACK_RE, archive_for
+from history_delta import DELTA_SUFFIX
+from history_store import HistoryStore, iter_snapshot_rows, open_snapshot
+from columnar_history import split_name, unique_names
+from dimers_parser import qualified_names as dimers_names
+from rotowire_parser import is_group_row, qualified_names
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS payloads (
+    sha256      TEXT PRIMARY KEY,
+    columns     TEXT NOT NULL,
+    row_count   INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rows (
+    sha256      TEXT NOT NULL,
+    row_num     INTEGER NOT NULL,
+    player_id   TEXT,
+    player      TEXT,
+    team        TEXT,
+    fpts        REAL,
+    data        TEXT NOT NULL,
+    PRIMARY KEY (sha256, row_num)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS snapshots (
+    source      TEXT NOT NULL,
+    sport       TEXT NOT NULL,
+    stat_type   TEXT NOT NULL DEFAULT '',
+    snapshot_ts TEXT NOT NULL,
+    sha256      TEXT NOT NULL,
+    file        TEXT NOT NULL,
+    PRIMARY KEY (source, sport, stat_type, snapshot_ts)
+);
+CREATE TABLE IF NOT EXISTS ingested_files (
+    file        TEXT PRIMARY KEY,
+    size        INTEGER NOT NULL,
+    mtime       REAL NOT NULL,
+    sha256      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_sha ON snapshots (sha256);
+CREATE INDEX IF NOT EXISTS idx_snapshots_time ON snapshots (source, sport, snapshot_ts);
+CREATE INDEX IF NOT EXISTS idx_rows_player ON rows (player);
+CREATE INDEX IF NOT EXISTS idx_rows_player_id ON rows (player_id);
+"""
+
+PLAYER_ID_COLUMNS = ('PLAYERID', 'RGID')
+PLAYER_COLUMNS = ('PLAYER', 'Player', 'Player Name', 'NAME', 'Name')
+TEAM_COLUMNS = ('TEAM', 'Team')
+FPTS_COLUMNS = ('FPTS', 'DFS', 'Fantasy/Points', 'PPR')
+
+
+def to_number(value):
+    """Float for numeric text, otherwise None"""
+    try:
+        return float(value.replace(',', '').rstrip('%'))
+    except (AttributeError, ValueError):
+        return None
+
+
+def first_present(row, columns):
+    for column in columns:
+        if row.get(column):
+            return row[column]
+    return None
+
+
+def parse_payload(csv_content, source=None):
+    """Header and typed rows of a projection CSV"""
+    return parse_rows(csv.reader(StringIO(csv_content.lstrip('\ufeff'))), source)
+
+
+def parse_rows(reader, source=None):
+    """Header and typed rows from an iterable of CSV rows
+
+    Rotowire exports open with a row of group labels ("Passing", "Rushing")
+    above the real header; the two rows are merged into qualified names.
+    Dimers columns get dimers_parser's positional names, so both match
+    the names the canonical tables use.
+    """
+    rows = [row for row in reader if any(row)]
+    if len(rows) > 1 and is_group_row(rows[0], rows[1]):
+        rows = [qualified_names(rows[0], rows[1])] + rows[2:]
+    if not rows:
+        return [], []
+
+    header = dimers_names(rows[0]) if source == 'dimers' else unique_names(rows[0])
+    width = len(header)
+    parsed = []
+
+    for row_num, values in enumerate(rows[1:]):
+        record = dict(zip(header, (values + [''] * width)[:width]))
+        if 'First Name' in record and 'Last Name' in record:
+            record.setdefault('Player', f"{record['First Name']} {record['Last Name']}".strip())
+
+        typed = []
+        for column in header:
+            number = to_number(record[column])
+            typed.append(number if number is not None else (record[column] or None))
+
+        parsed.append((
+            row_num,
+            first_present(record, PLAYER_ID_COLUMNS),
+            first_present(record, PLAYER_COLUMNS),
+            first_present(record, TEAM_COLUMNS),
+            to_number(first_present(record, FPTS_COLUMNS)),
+            json.dumps(typed, separators=(',', ':')),
+        ))
+
+    return header, parsed
+
+
+def archive_entry(path):
+    """archive.jsonl entry for a history file that is no longer on disk, or None"""
+    if os.path.exists(path):
+        return None
+    return archive_for(os.path.dirname(path) or '.').entries().get(os.path.basename(path))
+
+
+def hash_snapshot_file(path):
+    """Worker: (path, size, mtime, sha256) of one history file"""
+    entry = archive_entry(path)
+    if entry is not None and not path.endswith(DELTA_SUFFIX):
+        # Archived CSVs are packed as their plain text, so the entry's hash is the payload's
+        return path, entry['bytes'], 0.0, entry['sha256']
+
+    if entry is not None:
+        # An archived delta's entry hashes the delta itself; hash the CSV it materializes
+        size, mtime = entry['bytes'], 0.0
+    else:
+        stat = os.stat(path)
+        size, mtime = stat.st_size, stat.st_mtime
+
+    digest = hashlib.sha256()
+    with open_snapshot(path) as f:
+        for chunk in iter(lambda: f.read(1 << 20), ''):
+            digest.update(chunk.encode('utf-8'))
+    return path, size, mtime, digest.hexdigest()
+
+
+def parse_snapshot_file(path):
+    """Worker: header and typed rows of one history file, streamed from disk"""
+    match = PACK_RE.match(os.path.basename(path))
+    source = split_name(match.group('name'))[0] if match else None
+    return parse_rows(iter_snapshot_rows(path), source)
+
+
+class SnapshotDB:
+    """Indexed SQLite copy of the projection history"""
+
+    def __init__(self, db_path='data/snapshots.db'):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def pending_files(self, paths):
+        """Paths not yet ingested, or changed since they were"""
+        done = {
+            file: (size, mtime)
+            for file, size, mtime in self.conn.execute('SELECT file, size, mtime FROM ingested_files')
+        }
+        pending = []
+        for path in paths:
+            # Archived files never change once packed; ingest each one once
+            if not os.path.exists(path):
+                if os.path.basename(path) not in done:
+                    pending.append(path)
+                continue
+            stat = os.stat(path)
+            if done.get(os.path.basename(path)) != (stat.st_size, stat.st_mtime):
+                pending.append(path)
+        return pending
+
+    def store_payload(self, sha256, header, rows):
+        """Insert one distinct payload and its rows"""
+        self.conn.execute(
+            'INSERT OR IGNORE INTO payloads (sha256, columns, row_count) VALUES (?, ?, ?)',
+            (sha256, json.dumps(header), len(rows))
+        )
+        self.conn.executemany(
+            'INSERT OR IGNORE INTO rows (sha256, row_num, player_id, player, team, fpts, data) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [(sha256,) + row for row in rows]
+        )
+
+    def checkpoint(self, hashed):
+        """Mark (path, size, mtime, sha256) files as ingested; commit with their payloads"""
+        self.conn.executemany(
+            'INSERT OR REPLACE INTO ingested_files (file, size, mtime, sha256) VALUES (?, ?, ?, ?)',
+            [(os.path.basename(path), size, mtime, sha) for path, size, mtime, sha in hashed]
+        )
+
+    def record_snapshots(self, snapshots):
+        """Map every (name, timestamp) to the payload its file holds"""
+        hashes = dict(self.conn.execute('SELECT file, sha256 FROM ingested_files'))
+        records = []
+        for name, timestamp, path in snapshots:
+            file = os.path.basename(path)
+            if file not in hashes:
+                continue
+            source, sport, stat_type = split_name(name)
+            records.append((source, sport, stat_type or '', timestamp, hashes[file], file))
+
+        self.conn.executemany(
+            'INSERT OR REPLACE INTO snapshots (source, sport, stat_type, snapshot_ts, sha256, file) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            records
+        )
+        self.conn.commit()
+        return len(records)
+
+    def backfill(self, history_dir='data/history', workers=None, batch_size=64):
+        """Ingest every snapshot in history_dir; returns counts"""
+        snapshots = HistoryStore(history_dir).snapshots()
+        archived = archive_for(history_dir).entries()
+        paths = sorted({
+            path for _, _, path in snapshots
+            if os.path.exists(path) or os.path.basename(path) in archived
+        })
+        pending = self.pending_files(paths)
+        print(f"{len(paths)} history files, {len(pending)} to ingest")
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            hashed = list(pool.map(hash_snapshot_file, pending, chunksize=32))
+
+            # One file per payload the database hasn't seen
+            known = {sha for (sha,) in self.conn.execute('SELECT sha256 FROM payloads')}
+            unique = {}
+            for path, _size, _mtime, sha in hashed:
+                if sha not in known:
+                    unique.setdefault(sha, path)
+            print(f"  {len(unique)} new payloads")
+
+            files_by_sha = {}
+            for item in hashed:
+                files_by_sha.setdefault(item[3], []).append(item)
+
+            # Files whose payload is already stored need no parsing
+            self.checkpoint(item for sha, items in files_by_sha.items() if sha not in unique for item in items)
+            self.conn.commit()
+
+            shas = list(unique)
+            parsed = pool.map(parse_snapshot_file, [unique[sha] for sha in shas], chunksize=8)
+            batch = []
+            for count, (sha, (header, rows)) in enumerate(zip(shas, parsed), 1):
+                self.store_payload(sha, header, rows)
+                batch.append(sha)
+                # Each commit stores a batch of payloads together with the files
+                # that hold them, so an interrupted run resumes after the last one
+                if count % batch_size == 0 or count == len(shas):
+                    self.checkpoint(item for batch_sha in batch for item in files_by_sha[batch_sha])
+                    self.conn.commit()
+                    batch = []
+                    print(f"  {count}/{len(shas)} payloads")
+
+        recorded = self.record_snapshots(snapshots)
+        return {'files': len(pending), 'new_payloads': len(unique), 'snapshots': recorded}
+
+
+def main():
+    """Command-line entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Backfill data/history into an indexed snapshot database')
+    parser.add_argument('--history-dir', default='data/history', help='History directory (default: data/history)')
+    parser.add_argument('--db', default='data/snapshots.db', help='Database path (default: data/snapshots.db)')
+    parser.add_argument('--workers', type=int, default=None, help='Parser processes (default: CPU count)')
+    args = parser.parse_args()
+
+    start = time.time()
+    db = SnapshotDB(args.db)
+    try:
+        stats = db.backfill(args.history_dir, workers=args.workers)
+    finally:
+        db.close()
+
+    print(f"✓ Ingested {stats['files']} files ({stats['new_payloads']} new payloads), "
+          f"{stats['snapshots']} snapshots indexed in {time.time() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
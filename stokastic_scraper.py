@@ -7,7 +7,6 @@ import os
 import sys
 import time
 import json
-import subprocess
 import base64
 from datetime import datetime
 from selenium import webdriver
@@ -18,21 +17,119 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import requests
 
+from page_readiness import PageReadiness
+from resource_blocking import apply_resource_blocking, blocking_prefs
+from download_watcher import DownloadWatcher, set_download_directory
+from history_store import HistoryStore
+from git_publish import commit_and_push
+
+
+# Injected into every page via CDP before any site script runs. Remembers the
+# Blob behind each object URL and, while armed, intercepts the download
+# anchor click so the EXPORT payload is handed back in memory instead of
+# being written to disk. A download anchor it can't intercept is let through
+# and flagged, so the caller stops polling and waits on the download folder.
+EXPORT_CAPTURE_JS = """
+(function () {
+    if (window.__exportCapture) return;
+
+    var blobs = {};
+    var state = {armed: false, token: 0, result: null, passed: false};
+
+    var createObjectURL = URL.createObjectURL;
+    URL.createObjectURL = function (obj) {
+        var url = createObjectURL.apply(this, arguments);
+        if (obj instanceof Blob) blobs[url] = obj;
+        return url;
+    };
+
+    function deliver(token, text) {
+        // Ignore a late blob read from an earlier export
+        if (token !== state.token) return;
+        state.armed = false;
+        state.result = text;
+    }
+
+    function intercept(anchor) {
+        if (!state.armed || !anchor || !anchor.href) return false;
+        var href = anchor.href;
+        var token = state.token;
+
+        if (href.indexOf('blob:') === 0 && blobs[href]) {
+            blobs[href].text().then(function (text) { deliver(token, text); });
+            return true;
+        }
+        if (href.indexOf('data:') === 0) {
+            var comma = href.indexOf(',');
+            var body = href.substring(comma + 1);
+            if (href.substring(0, comma).indexOf(';base64') !== -1) {
+                deliver(token, decodeURIComponent(escape(atob(body))));
+            } else {
+                deliver(token, decodeURIComponent(body));
+            }
+            return true;
+        }
+        if (anchor.hasAttribute('download')) {
+            // A real file download; the browser writes it to disk
+            state.armed = false;
+            state.passed = true;
+        }
+        return false;
+    }
+
+    var click = HTMLAnchorElement.prototype.click;
+    HTMLAnchorElement.prototype.click = function () {
+        if (intercept(this)) return;
+        return click.apply(this, arguments);
+    };
+
+    var dispatchEvent = EventTarget.prototype.dispatchEvent;
+    EventTarget.prototype.dispatchEvent = function (event) {
+        if (event && event.type === 'click' && this instanceof HTMLAnchorElement && intercept(this)) {
+            return false;
+        }
+        return dispatchEvent.apply(this, arguments);
+    };
+
+    document.addEventListener('click', function (event) {
+        var anchor = event.target && event.target.closest ? event.target.closest('a') : null;
+        if (anchor && intercept(anchor)) event.preventDefault();
+    }, true);
+
+    window.__exportCapture = {
+        arm: function () {
+            state.token += 1;
+            state.armed = true;
+            state.result = null;
+            state.passed = false;
+        },
+        disarm: function () {
+            state.armed = false;
+        },
+        poll: function () {
+            return {content: state.result, passed: state.passed};
+        }
+    };
+})();
+"""
+
 
 class StokasticScraper:
     """Stokastic scraper with GitHub integration"""
     
-    def __init__(self, config):
+    def __init__(self, config, data_dir='data'):
         self.config = config
         self.driver = None
-        self.data_dir = 'data'
-        self.history_dir = 'data/history'
+        self.data_dir = data_dir
+        self.history_dir = os.path.join(data_dir, 'history')
         self.download_dir = os.path.abspath(self.data_dir)
         self.scraped_data = {}
+        self.written_files = []
         
         # Create data directories
         os.makedirs(self.data_dir, exist_ok=True)
         os.makedirs(self.history_dir, exist_ok=True)
+        self.history = HistoryStore(self.history_dir)
     
     def setup_driver(self, headless=True):
         """Setup Chrome webdriver"""
@@ -56,12 +153,92 @@ class StokasticScraper:
             'download.directory_upgrade': True,
             'safebrowsing.enabled': True,
         }
+        prefs.update(blocking_prefs(self.config))
         chrome_options.add_experimental_option('prefs', prefs)
         
         self.driver = webdriver.Chrome(options=chrome_options)
         self.wait = WebDriverWait(self.driver, 20)
+        self.ready = PageReadiness(self.driver)
+        apply_resource_blocking(self.driver, 'stokastic', self.config)
+        self.install_export_capture()
         print(f"✓ Browser initialized (downloads to: {self.download_dir})")
     
+    def install_export_capture(self):
+        """Register the in-memory EXPORT capture hook for every page via CDP"""
+        try:
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': EXPORT_CAPTURE_JS})
+            self.export_capture = True
+        except Exception as e:
+            print(f"  ⚠️ CDP export capture unavailable, using download folder: {e}")
+            self.export_capture = False
+    
+    def click_and_capture_export(self, watcher, timeout=10):
+        """Click EXPORT and return (clicked, content, source) from whichever path delivers first
+        
+        The in-page capture and the download folder are raced: content is
+        the intercepted blob/data payload or the CSV the browser wrote to
+        watcher.directory. Polling the page stops as soon as it lets a real
+        download through. source is 'memory' or the downloaded file's name;
+        content and source are None if neither arrives in time.
+        """
+        start = time.monotonic()
+        clicked = self.driver.execute_script("""
+            var capture = window.__exportCapture;
+            if (capture) capture.arm();
+            
+            var elements = document.querySelectorAll('button, a, div, span');
+            for (var i = 0; i < elements.length; i++) {
+                var text = elements[i].textContent.trim().toUpperCase();
+                if (text === 'EXPORT' || text.includes('EXPORT')) {
+                    // Make sure it's clickable and visible
+                    if (elements[i].offsetParent !== null) {
+                        elements[i].click();
+                        return true;
+                    }
+                }
+            }
+            return false;
+        """)
+        if not clicked:
+            return False, None, None
+        
+        deadline = start + timeout
+        polling = self.export_capture
+        content, source = None, None
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            if polling:
+                state = self.driver.execute_script(
+                    "return window.__exportCapture ? window.__exportCapture.poll() : null;"
+                )
+                if state and state.get('content') is not None:
+                    content, source = state['content'], 'memory'
+                    break
+                # The page let a real download through (or lost the hook); only the folder can deliver now
+                polling = bool(state) and not state.get('passed')
+            
+            csv_path = watcher.wait(accept=lambda name: name.endswith('.csv'),
+                                    timeout=min(0.1, remaining) if polling else remaining)
+            if csv_path:
+                with open(csv_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                source = os.path.basename(csv_path)
+                break
+        
+        if content is None and self.export_capture:
+            # Don't let a stale arm intercept a later, unrelated click
+            try:
+                self.driver.execute_script("if (window.__exportCapture) window.__exportCapture.disarm();")
+            except Exception:
+                pass
+        
+        self.ready.record('export: in-memory capture' if source == 'memory' else 'export: CSV download',
+                          time.monotonic() - start, content is not None)
+        return True, content, source
+    
     def login(self):
         """Login to Stokastic via Auth0"""
         print("\nLogging in to Stokastic...")
@@ -69,7 +246,10 @@ class StokasticScraper:
         try:
             # Go to the main site first
             self.driver.get('https://tools.stokastic.com/datahub/NBA')
-            time.sleep(4)
+            self.ready.wait_for(
+                'login: datahub or login prompt',
+                lambda d: any(t in d.page_source for t in ('You must be logged in', 'LOG IN', 'EXPORT'))
+            )
             
             # Check if we see "You must be logged in" page
             page_source = self.driver.page_source
@@ -139,7 +319,7 @@ class StokasticScraper:
                     self.driver.save_screenshot('debug_stokastic_no_login_btn.png')
                     return False
                 
-                time.sleep(4)
+                self.ready.wait_for('login: Auth0 redirect', lambda d: 'datahub' not in d.current_url)
             
             # Now we should be on Auth0 login page
             current_url = self.driver.current_url
@@ -154,10 +334,9 @@ class StokasticScraper:
                     return True
             
             # Wait for the Auth0 form to appear
-            time.sleep(2)
+            self.ready.element_visible(By.CSS_SELECTOR, "input[type='password']", label='login: Auth0 form')
             
             # Find and fill email field
-            email_field = None
             email_selectors = [
                 "input[name='username']",
                 "input[name='email']", 
@@ -167,20 +346,13 @@ class StokasticScraper:
                 "input[placeholder*='Email']",
             ]
             
-            for selector in email_selectors:
-                try:
-                    fields = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for field in fields:
-                        if field.is_displayed():
-                            email_field = field
-                            print(f"  ✓ Found email field")
-                            break
-                    if email_field:
-                        break
-                except:
-                    continue
-            
-            if not email_field:
+            email_field = self.ready.any_visible(
+                [(By.CSS_SELECTOR, selector) for selector in email_selectors],
+                label='login: email field', timeout=5
+            )
+            if email_field:
+                print(f"  ✓ Found email field")
+            else:
                 print("  ❌ Could not find email field")
                 self.driver.save_screenshot('debug_stokastic_no_email.png')
                 return False
@@ -188,7 +360,6 @@ class StokasticScraper:
             email_field.clear()
             email_field.send_keys(self.config.get('stokastic_username', ''))
             print("  ✓ Filled email")
-            time.sleep(0.5)
             
             # Find and fill password field
             password_field = None
@@ -204,7 +375,6 @@ class StokasticScraper:
             password_field.clear()
             password_field.send_keys(self.config.get('stokastic_password', ''))
             print("  ✓ Filled password")
-            time.sleep(0.5)
             
             # Find and click Continue/Submit button
             clicked = False
@@ -243,8 +413,9 @@ class StokasticScraper:
                 print("  ❌ Could not click submit button")
                 return False
             
-            # Wait for redirect
-            time.sleep(6)
+            # Wait for redirect back to the datahub
+            self.ready.wait_for('login: redirect to datahub', lambda d: 'datahub' in d.current_url)
+            self.ready.document_ready(label='login: datahub loaded')
             
             # Verify login
             current_url = self.driver.current_url
@@ -266,77 +437,66 @@ class StokasticScraper:
             self.driver.save_screenshot('debug_stokastic_login_error.png')
             return False
     
-    def click_export_button(self):
-        """Find and click the EXPORT button, return the CSV content"""
-        try:
-            # Get list of existing CSV files before clicking
-            existing_files = set()
-            downloads_folder = os.path.join(os.path.expanduser('~'), 'Downloads')
-            for folder in [self.download_dir, downloads_folder]:
-                if os.path.exists(folder):
-                    existing_files.update([os.path.join(folder, f) for f in os.listdir(folder) if f.endswith('.csv')])
-            
-            # Method 1: Use JavaScript to find EXPORT button
-            clicked = self.driver.execute_script("""
-                var elements = document.querySelectorAll('button, a, div, span');
+    def wait_for_datahub(self, sport):
+        """Wait until a datahub page has rendered its EXPORT control"""
+        return self.ready.js_condition(
+            f"{sport}: datahub rendered",
+            """
+                var elements = document.querySelectorAll('button, a');
                 for (var i = 0; i < elements.length; i++) {
-                    var text = elements[i].textContent.trim().toUpperCase();
-                    if (text === 'EXPORT' || text.includes('EXPORT')) {
-                        // Make sure it's clickable and visible
-                        if (elements[i].offsetParent !== null) {
-                            elements[i].click();
-                            return true;
-                        }
+                    if (elements[i].offsetParent !== null &&
+                        elements[i].textContent.trim().toUpperCase().indexOf('EXPORT') !== -1) {
+                        return true;
                     }
                 }
                 return false;
-            """)
+            """
+        )
+    
+    def wait_for_grid(self, label):
+        """Wait for the projections grid to settle after a tab or stat type change"""
+        self.ready.network_idle(label=f"{label}: network idle", timeout=10)
+        return self.ready.table_has_rows(
+            selector='table tbody tr, [role="row"]',
+            label=f"{label}: grid rows",
+            timeout=10
+        )
+    
+    def wait_for_option(self, text, timeout=5):
+        """Wait for a dropdown option with the given text to render"""
+        return self.ready.js_condition(
+            f"option '{text}'",
+            f"""
+                var options = document.querySelectorAll('li, [role="option"], [role="menuitem"]');
+                for (var i = 0; i < options.length; i++) {{
+                    if (options[i].textContent.trim() === {text!r}) return true;
+                }}
+                return false;
+            """,
+            timeout
+        )
+    
+    def click_export_button(self):
+        """Find and click the EXPORT button, return the CSV content"""
+        # Any real download goes to a private directory for this export only
+        watcher = DownloadWatcher(prefix='stokastic_export_')
+        
+        try:
+            set_download_directory(self.driver, watcher.directory)
+            
+            # Click EXPORT and take the CSV from memory or the download folder, whichever comes first
+            clicked, content, source = self.click_and_capture_export(watcher)
             
             if clicked:
-                print(f"  ✓ Found EXPORT button")
                 print(f"  ✓ Clicked EXPORT")
-                
-                # Wait for download - check multiple times
-                csv_path = None
-                downloads_folder = os.path.join(os.path.expanduser('~'), 'Downloads')
-                for attempt in range(10):
-                    time.sleep(1)
-                    
-                    # Check both data folder and Downloads folder
-                    for folder in [self.download_dir, downloads_folder]:
-                        if not os.path.exists(folder):
-                            continue
-                        
-                        for f in os.listdir(folder):
-                            if f.endswith('.csv') and not f.endswith('.crdownload'):
-                                full_path = os.path.join(folder, f)
-                                if full_path not in existing_files:
-                                    # Found new file
-                                    csv_path = full_path
-                                    print(f"  ✓ Found downloaded file: {f}")
-                                    break
-                        
-                        if csv_path:
-                            break
-                    
-                    if csv_path:
-                        break
-                
-                if csv_path:
-                    with open(csv_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Clean up the downloaded file
-                    try:
-                        os.remove(csv_path)
-                        print(f"  ✓ Cleaned up: {os.path.basename(csv_path)}")
-                    except:
-                        pass
-                    
+                if content and source == 'memory':
+                    print(f"  ✓ Captured export in memory ({len(content)} bytes)")
                     return content
-                else:
-                    print("  ⚠️ No CSV file found after export (waited 10 seconds)")
-                    print(f"  Checked folders: {self.download_dir}, {downloads_folder}")
+                if content:
+                    print(f"  ✓ Found downloaded file: {source}")
+                    return content
+                print("  ⚠️ No CSV captured or downloaded after export (waited 10 seconds)")
+                print(f"  Checked folder: {watcher.directory}")
             else:
                 print("  ❌ Could not find EXPORT button")
                 
@@ -360,11 +520,14 @@ class StokasticScraper:
             import traceback
             traceback.print_exc()
             return None
+        
+        finally:
+            watcher.cleanup()
     
     def select_stat_type(self, stat_type):
         """Select stat type from dropdown (for NFL/NHL)"""
         try:
-            time.sleep(2)
+            self.ready.document_ready(label=f"{stat_type}: page ready")
             self.driver.save_screenshot(f'debug_before_select_{stat_type.lower()}.png')
             
             # First, click the STATS tab to make sure we're on the right tab
@@ -381,7 +544,7 @@ class StokasticScraper:
                 """)
                 if stats_tab:
                     print(f"  ✓ Clicked STATS tab")
-                    time.sleep(2)
+                    self.ready.text_present('Stat Type', label=f"{stat_type}: STATS tab", timeout=10)
             except:
                 pass
             
@@ -424,7 +587,7 @@ class StokasticScraper:
             
             if dropdown_opened:
                 print(f"  ✓ Opened dropdown via: {dropdown_opened}")
-                time.sleep(1)
+                self.wait_for_option(stat_type)
                 self.driver.save_screenshot(f'debug_dropdown_open_{stat_type.lower()}.png')
                 
                 # Now click the desired option
@@ -453,7 +616,7 @@ class StokasticScraper:
                 
                 if option_clicked:
                     print(f"  ✓ Selected {stat_type}")
-                    time.sleep(2)
+                    self.wait_for_grid(stat_type)
                     return True
             else:
                 print(f"  Could not find dropdown to open")
@@ -476,16 +639,15 @@ class StokasticScraper:
             print(f"  ⚠️ Error selecting {stat_type}: {str(e)}")
             return False
     
-    def save_historical(self, sport, stat_type, csv_content):
-        """Save a timestamped copy for historical analysis"""
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
-        filename = f"stokastic_{sport}_{stat_type}_{timestamp}.csv" if stat_type else f"stokastic_{sport}_{timestamp}.csv"
-        filepath = os.path.join(self.history_dir, filename)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-        
-        print(f"  ✓ Saved historical: {filename}")
+    def save_historical(self, sport, stat_type, csv_content, current_file=None):
+        """Record a snapshot for historical analysis, publishing current_file too; identical payloads are stored once"""
+        name = f"stokastic_{sport}_{stat_type}" if stat_type else f"stokastic_{sport}"
+        filepath, written, files = self.history.save(name, csv_content, current_path=current_file)
+        self.written_files.extend(f for f in files if f not in self.written_files)
+        if written:
+            print(f"  ✓ Saved historical: {os.path.basename(filepath)}")
+        else:
+            print(f"  ✓ Unchanged since {os.path.basename(filepath)}, recorded in manifest")
         return filepath
     
     def scrape_nba(self):
@@ -495,13 +657,13 @@ class StokasticScraper:
         try:
             self.driver.get('https://tools.stokastic.com/datahub/NBA')
             print("  Loading page...")
-            time.sleep(5)
+            self.wait_for_datahub('nba')
             
             # Make sure we're on STATS tab
             try:
                 stats_tab = self.driver.find_element(By.XPATH, "//button[contains(text(), 'STATS')] | //a[contains(text(), 'STATS')]")
                 stats_tab.click()
-                time.sleep(2)
+                self.wait_for_grid('nba')
             except:
                 pass
             
@@ -511,15 +673,11 @@ class StokasticScraper:
             csv_content = self.click_export_button()
             
             if csv_content:
-                # Save current file
+                # Save historical and publish the current file in one atomic write
                 csv_file = os.path.join(self.data_dir, 'stokastic_nba.csv')
-                with open(csv_file, 'w', encoding='utf-8') as f:
-                    f.write(csv_content)
+                self.save_historical('nba', None, csv_content, csv_file)
                 print(f"  ✓ Saved: {csv_file}")
                 
-                # Save historical
-                self.save_historical('nba', None, csv_content)
-                
                 self.scraped_data['nba'] = {'csv_saved': True, 'bytes': len(csv_content)}
                 return self.scraped_data['nba']
             
@@ -536,13 +694,13 @@ class StokasticScraper:
         try:
             self.driver.get('https://tools.stokastic.com/datahub/NHL')
             print("  Loading page...")
-            time.sleep(5)
+            self.wait_for_datahub('nhl')
             
             # Make sure we're on STATS tab
             try:
                 stats_tab = self.driver.find_element(By.XPATH, "//button[contains(text(), 'STATS')] | //a[contains(text(), 'STATS')]")
                 stats_tab.click()
-                time.sleep(2)
+                self.wait_for_grid('nhl')
             except:
                 pass
             
@@ -556,12 +714,9 @@ class StokasticScraper:
             
             if csv_content:
                 csv_file = os.path.join(self.data_dir, 'stokastic_nhl.csv')
-                with open(csv_file, 'w', encoding='utf-8') as f:
-                    f.write(csv_content)
+                self.save_historical('nhl', 'skater', csv_content, csv_file)
                 print(f"  ✓ Saved: {csv_file}")
                 
-                self.save_historical('nhl', 'skater', csv_content)
-                
                 self.scraped_data['nhl'] = {'csv_saved': True, 'bytes': len(csv_content)}
                 return self.scraped_data['nhl']
             
@@ -581,7 +736,7 @@ class StokasticScraper:
         try:
             self.driver.get('https://tools.stokastic.com/datahub/NFL')
             print("  Loading page...")
-            time.sleep(5)
+            self.wait_for_datahub('nfl')
             
             self.driver.save_screenshot('debug_nfl_before_stats.png')
             
@@ -686,11 +841,10 @@ class StokasticScraper:
                 """)
                 print(f"  Tab elements found: {tab_info}")
             
-            time.sleep(4)
+            has_stat_type = self.ready.text_present('Stat Type', label='nfl: STATS tab', timeout=10)
             self.driver.save_screenshot('debug_nfl_after_stats_click.png')
             
             # Verify we're on STATS tab
-            has_stat_type = 'Stat Type' in self.driver.page_source
             if has_stat_type:
                 print("  ✓ Confirmed: On STATS tab")
             else:
@@ -714,7 +868,7 @@ class StokasticScraper:
                 
                 if dropdown_opened:
                     print(f"  ✓ Opened dropdown (was: {dropdown_opened})")
-                    time.sleep(1)
+                    self.wait_for_option(stat_type)
                     
                     selected = self.driver.execute_script(f"""
                         var options = document.querySelectorAll('li, [role="option"], [role="menuitem"]');
@@ -729,7 +883,7 @@ class StokasticScraper:
                     
                     if selected:
                         print(f"  ✓ Selected {stat_type}")
-                    time.sleep(2)
+                        self.wait_for_grid(f"nfl {stat_type}")
                 else:
                     print(f"  ⚠️ Could not find stat type dropdown")
                 
@@ -740,11 +894,8 @@ class StokasticScraper:
                 if csv_content:
                     filename = f'stokastic_nfl_{stat_type.lower()}.csv'
                     csv_file = os.path.join(self.data_dir, filename)
-                    with open(csv_file, 'w', encoding='utf-8') as f:
-                        f.write(csv_content)
+                    self.save_historical('nfl', stat_type.lower(), csv_content, csv_file)
                     print(f"  ✓ Saved: {filename}")
-                    
-                    self.save_historical('nfl', stat_type.lower(), csv_content)
                     results[stat_type.lower()] = {'csv_saved': True, 'bytes': len(csv_content)}
             
             if results:
@@ -760,40 +911,38 @@ class StokasticScraper:
             return None
     
     def git_commit_and_push(self):
-        """Commit and push data to GitHub"""
-        print("\n=== Pushing to GitHub ===")
+        """Commit the files written this run and push to GitHub"""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return commit_and_push(self.written_files, f'Update Stokastic projections - {timestamp}')
+    
+    def scrape_sports(self, sports):
+        """Scrape sports with an already logged-in browser"""
+        results = {}
         
-        try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            result = subprocess.run(['git', 'status'], capture_output=True, text=True)
-            if result.returncode != 0:
-                print("❌ Not a git repository")
-                return False
-            
-            subprocess.run(['git', 'add', 'data/'], check=True)
-            
-            result = subprocess.run(['git', 'diff', '--staged', '--quiet'], capture_output=True)
-            if result.returncode == 0:
-                print("  No changes to commit")
-                return True
-            
-            subprocess.run(['git', 'commit', '-m', f'Update Stokastic projections - {timestamp}'], check=True)
-            print("  ✓ Committed changes")
-            
-            result = subprocess.run(['git', 'push'], capture_output=True, text=True)
-            if result.returncode != 0:
-                print(f"  ⚠️ Push failed: {result.stderr}")
-                return False
-            
-            print("✓ Data pushed to GitHub")
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Git error: {str(e)}")
-            return False
+        if 'nba' in sports:
+            results['nba'] = self.scrape_nba()
+        
+        if 'nhl' in sports:
+            results['nhl'] = self.scrape_nhl()
+        
+        if 'nfl' in sports:
+            results['nfl'] = self.scrape_nfl()
+        
+        return results
     
-    def scrape_all(self, headless=False, sports=None):
+    def run_cycle(self, sports=None):
+        """One scrape with a browser that stays open between cycles
+        
+        login() returns early when the datahub is already unlocked, so this
+        only goes through Auth0 again once the session has expired.
+        """
+        if not self.login():
+            print("Cannot continue without successful login")
+            return {}
+        
+        return self.scrape_sports(sports or ['nba', 'nhl', 'nfl'])
+    
+    def scrape_all(self, headless=False, sports=None, push=True):
         """Scrape all sports and push to GitHub"""
         if sports is None:
             sports = ['nba', 'nhl', 'nfl']
@@ -807,22 +956,16 @@ class StokasticScraper:
                 print("Cannot continue without successful login")
                 return results
             
-            if 'nba' in sports:
-                results['nba'] = self.scrape_nba()
-            
-            if 'nhl' in sports:
-                results['nhl'] = self.scrape_nhl()
-            
-            if 'nfl' in sports:
-                results['nfl'] = self.scrape_nfl()
+            results = self.scrape_sports(sports)
             
-            if any(results.values()):
+            if push and any(results.values()):
                 self.git_commit_and_push()
             
             return results
             
         finally:
             if self.driver:
+                self.ready.report()
                 self.driver.quit()
                 print("\n✓ Browser closed")
 
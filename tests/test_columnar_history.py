@@ -0,0 +1,55 @@
+from datetime import datetime
+
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+import pyarrow.parquet as pq
+
+from columnar_history import COMPACTED_NAME, ColumnarHistory
+from history_store import HistoryStore
+
+
+HEADER = 'PLAYERID,PLAYER,TEAM,FPTS,PARTNERID\n'
+
+
+def test_query_reads_a_column_that_is_blank_in_one_part_and_text_in_another(tmp_path):
+    store = ColumnarHistory(str(tmp_path))
+    store.append('rotogrinders_nba', HEADER + '1,Cade Cunningham,,29.9,\n', '2026-02-14_10-00')
+    store.append('rotogrinders_nba', HEADER + '1,Cade Cunningham,STA,30.5,dk-1\n', '2026-02-14_11-00')
+    store.append('rotogrinders_nba', HEADER + '1,Cade Cunningham,4,31.0,7\n', '2026-02-14_12-00')
+
+    files = store.partition_files('rotogrinders', 'nba')
+    types = {str(pq.read_schema(path).field('PARTNERID').type) for path in files}
+    assert types == {'null', 'string', 'double'}
+
+    frame = store.query('rotogrinders', 'nba', columns=['PLAYER', 'TEAM', 'PARTNERID', 'FPTS'])
+    assert list(frame['FPTS']) == [29.9, 30.5, 31.0]
+    assert list(frame['TEAM'].fillna('')) == ['', 'STA', '4']
+    assert list(frame['PARTNERID'].fillna('')) == ['', 'dk-1', '7']
+
+    assert len(store.query('rotogrinders', 'nba')) == 3
+
+
+def test_compact_merges_drifting_parts_and_returns_changed_paths(tmp_path):
+    store = ColumnarHistory(str(tmp_path))
+    parts = [
+        store.append('rotogrinders_nhl', HEADER + '1,Sidney Crosby,PIT,20.1,\n', '2026-02-14_10-00'),
+        store.append('rotogrinders_nhl', HEADER + '1,Sidney Crosby,4,20.4,x\n', '2026-02-14_11-00'),
+    ]
+
+    changed = store.compact(before=datetime(2026, 2, 15))
+
+    compacted = [path for path in changed if path.endswith(COMPACTED_NAME)]
+    assert len(compacted) == 1
+    assert sorted(path for path in changed if path not in compacted) == sorted(parts)
+    assert store.query('rotogrinders', 'nhl', columns=['TEAM'])['TEAM'].tolist() == ['PIT', '4']
+
+
+def test_history_save_appends_columnar_parts_but_does_not_commit_them(tmp_path):
+    columnar_dir = tmp_path / 'history_columnar'
+    store = HistoryStore(str(tmp_path / 'history'), columnar_dir=str(columnar_dir))
+    _path, written, files = store.save('rotogrinders_nba', 'PLAYER,FPTS\nJayson Tatum,51.2\n', '2026-01-01_10-00')
+
+    assert written
+    assert ColumnarHistory(str(columnar_dir)).partition_files('rotogrinders', 'nba')
+    assert not [f for f in files if f.startswith(str(columnar_dir))]
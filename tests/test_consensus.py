@@ -0,0 +1,30 @@
+from consensus import ConsensusEngine
+from history_store import HistoryStore
+from player_identity import PlayerIdentityIndex
+from projection_schema import CanonicalCache
+
+
+def engine(tmp_path):
+    history_dir = str(tmp_path / 'history')
+    store = HistoryStore(history_dir, columnar_dir=str(tmp_path / 'columnar'))
+    store.save('dimers_nba', 'First Name,Last Name,Team,Matchup,Exp Pts\nJayson,Tatum,BOS,BOS vs. NYK,26.0\n',
+               '2025-12-22_16-25')
+    store.save('rotogrinders_nba', 'PLAYER,TEAM,OPP,PTS\nJayson Tatum,BOS,NYK,28.0\n', '2025-12-22_16-40')
+    store.save('rotogrinders_nba', 'PLAYER,TEAM,OPP,PTS\nJayson Tatum,BOS,MIA,31.0\n', '2026-02-16_17-38')
+    return ConsensusEngine(history_dir, identity=PlayerIdentityIndex(str(tmp_path / 'identity.json')),
+                           canonical=CanonicalCache(str(tmp_path / 'cache')))
+
+
+def test_feeds_from_another_slate_are_left_out(tmp_path):
+    result = engine(tmp_path).compute('nba')
+    row = result.loc[('nba:jayson-tatum', 'pts')]
+    assert row['n_sources'] == 1
+    assert row['mean'] == 31.0
+    assert 'value_dimers' not in result
+
+
+def test_as_of_selects_an_earlier_slate(tmp_path):
+    row = engine(tmp_path).compute('nba', as_of='2025-12-22_18-00').loc[('nba:jayson-tatum', 'pts')]
+    assert row['n_sources'] == 2
+    assert (row['mean'], row['spread']) == (27.0, 2.0)
+    assert (row['value_dimers'], row['value_rotogrinders']) == (26.0, 28.0)
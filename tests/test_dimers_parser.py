@@ -0,0 +1,60 @@
+import pandas as pd
+
+from dimers_parser import load_dimers, qualified_names, read_dimers
+from projection_schema import build_canonical
+
+
+NFL = (
+    '"First Name","Last Name","Team","Matchup","PPR","HPPR","CMP","YDS","YDS","REC","YDS",'
+    '"1+","2+","3+","1st","Last Updated"\n'
+    '"Jahmyr","Gibbs","DET","PIT vs. DET","24.69","22.16","0.00","0.00","77.41","5.07","43.13",'
+    '"66.84%","30.24%","10.04%","17.36%","2025-12-21T20:43:40Z"\n'
+    '"Jared","Goff","DET","PIT vs. DET","18.10","18.10","22.40","1,012.5","5.10","","",'
+    '"4.10%","","","","2025-12-21T20:43:40Z"\n'
+)
+
+
+def test_repeated_yards_are_named_by_position():
+    header, rows = read_dimers(NFL)
+    assert header[6:11] == ['Passing/CMP', 'Passing/YDS', 'Rushing/YDS', 'Receiving/REC', 'Receiving/YDS']
+    assert header[11:15] == ['TD/1+', 'TD/2+', 'TD/3+', 'TD/1st']
+    assert len(rows) == 2 and all(len(row) == len(header) for row in rows)
+
+
+def test_yards_without_completions_are_rushing():
+    assert qualified_names(['Player', 'YDS', 'REC', 'YDS']) == ['Player', 'Rushing/YDS', 'Receiving/REC',
+                                                               'Receiving/YDS']
+
+
+def test_unseen_repeats_stay_unique():
+    assert qualified_names(['Team', 'PTS', 'PTS']) == ['Team', 'PTS', 'PTS.1']
+
+
+def test_nba_header_passes_through():
+    header, _rows = read_dimers('\ufeffFirst Name,Last Name,Team,Matchup,Exp Pts\nJayson,Tatum,BOS,BOS vs. NYK,27.5\n')
+    assert header == ['First Name', 'Last Name', 'Team', 'Matchup', 'Exp Pts']
+
+
+def test_load_dimers_types_and_splits_matchups():
+    frame = load_dimers(NFL)
+    assert frame['player'].tolist() == ['Jahmyr Gibbs', 'Jared Goff']
+    assert frame['Passing/YDS'].tolist() == [0.0, 1012.5]
+    # Percentages stay in percent units
+    assert frame['TD/1+'].tolist() == [66.84, 4.10]
+    assert pd.isna(frame.loc[1, 'TD/2+'])
+    assert frame['opp'].tolist() == ['PIT', 'PIT']
+    assert frame['home'].tolist() == [True, True]
+    assert str(frame['Last Updated'].dt.tz) == 'UTC'
+
+
+def test_away_team_gets_the_home_team_as_opponent():
+    frame = load_dimers('First Name,Last Name,Team,Matchup\nT.J.,Watt,PIT,PIT vs. DET\n')
+    assert (frame.loc[0, 'opp'], frame.loc[0, 'home']) == ('DET', False)
+
+
+def test_canonical_table_maps_positional_names():
+    frame = build_canonical('dimers_nfl', NFL)
+    gibbs = frame[frame['player'] == 'Jahmyr Gibbs']
+    gibbs = dict(zip(gibbs['stat'], gibbs['value']))
+    assert (gibbs['rush_yds'], gibbs['rec_yds'], gibbs['td_1plus_pct']) == (77.41, 43.13, 66.84)
+    assert frame['opp'].unique().tolist() == ['PIT']
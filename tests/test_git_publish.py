@@ -0,0 +1,120 @@
+import os
+import subprocess
+
+import pytest
+
+import git_publish
+from git_publish import commit_paths, push
+
+
+GITATTRIBUTES = 'data/history/manifest.jsonl merge=union\n'
+
+
+def run(cwd, *args):
+    return subprocess.run(['git'] + list(args), cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def write(root, path, text):
+    path = os.path.join(root, path)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def read(root, path):
+    with open(os.path.join(root, path), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.fixture
+def remote(tmp_path, monkeypatch):
+    """Bare remote seeded with one commit; returns a function that clones it"""
+    for name in ('AUTHOR', 'COMMITTER'):
+        monkeypatch.setenv(f'GIT_{name}_NAME', 'scraper')
+        monkeypatch.setenv(f'GIT_{name}_EMAIL', 'scraper@example.com')
+    monkeypatch.setattr(git_publish, 'PUSH_BACKOFF', 0.01)
+
+    bare = str(tmp_path / 'remote.git')
+    subprocess.run(['git', 'init', '-q', '--bare', '-b', 'main', bare], check=True)
+    seed = str(tmp_path / 'seed')
+    run(str(tmp_path), 'clone', '-q', bare, seed)
+    write(seed, '.gitattributes', GITATTRIBUTES)
+    write(seed, 'data/history/manifest.jsonl', '{"ts":"0"}\n')
+    write(seed, 'data/projections.csv', 'PLAYER,FPTS\nA,1\n')
+    run(seed, 'add', '.')
+    run(seed, 'commit', '-q', '-m', 'seed')
+    run(seed, 'push', '-q', 'origin', 'main')
+
+    def clone(name):
+        path = str(tmp_path / name)
+        run(str(tmp_path), 'clone', '-q', bare, path)
+        return path
+
+    clone.bare = bare
+    return clone
+
+
+def test_commit_paths_commits_only_the_given_files(remote, monkeypatch):
+    repo = remote('a')
+    monkeypatch.chdir(repo)
+    write(repo, 'data/projections.csv', 'PLAYER,FPTS\nA,2\n')
+    write(repo, 'data/history/new_2026-01-01_10-00.csv.gz', 'x')
+    write(repo, 'scratch.txt', 'not part of this run')
+
+    commit = commit_paths(['data/projections.csv', 'data/history/new_2026-01-01_10-00.csv.gz'], 'Update')
+    assert commit == run(repo, 'rev-parse', 'HEAD')
+    assert run(repo, 'show', '--name-only', '--format=', 'HEAD').splitlines() == [
+        'data/history/new_2026-01-01_10-00.csv.gz', 'data/projections.csv']
+    assert run(repo, 'status', '--porcelain') == '?? scratch.txt'
+
+    # Nothing changed since: no empty commit
+    assert commit_paths(['data/projections.csv'], 'Update again') is None
+    assert run(repo, 'rev-parse', 'HEAD') == commit
+
+
+def test_commit_paths_records_removed_files(remote, monkeypatch):
+    repo = remote('a')
+    monkeypatch.chdir(repo)
+    os.remove(os.path.join(repo, 'data/projections.csv'))
+
+    assert commit_paths(['data/projections.csv'], 'Remove') is not None
+    assert 'data/projections.csv' not in run(repo, 'ls-files').splitlines()
+
+
+def test_push_retries_after_a_concurrent_run_pushed_first(remote, monkeypatch):
+    ours, theirs = remote('ours'), remote('theirs')
+
+    # Another run commits and pushes while this one is scraping
+    write(theirs, 'data/history/manifest.jsonl', '{"ts":"0"}\n{"ts":"theirs"}\n')
+    write(theirs, 'data/projections.csv', 'PLAYER,FPTS\nA,3\n')
+    run(theirs, 'commit', '-q', '-am', 'Their run')
+    run(theirs, 'push', '-q', 'origin', 'main')
+
+    monkeypatch.chdir(ours)
+    write(ours, 'data/history/manifest.jsonl', '{"ts":"0"}\n{"ts":"ours"}\n')
+    write(ours, 'data/projections.csv', 'PLAYER,FPTS\nA,4\n')
+    assert commit_paths(['data/history/manifest.jsonl', 'data/projections.csv'], 'Our run')
+
+    assert push(attempts=3)
+    assert git_publish.pending_commits('origin/main') == 0
+
+    check = remote('check')
+    assert read(check, 'data/history/manifest.jsonl') == '{"ts":"0"}\n{"ts":"theirs"}\n{"ts":"ours"}\n'
+    # This run's copy of the current files wins
+    assert read(check, 'data/projections.csv') == 'PLAYER,FPTS\nA,4\n'
+    assert run(check, 'log', '--format=%s', '-3').splitlines() == ['Our run', 'Their run', 'seed']
+
+
+def test_push_gives_up_after_the_last_attempt(remote, monkeypatch):
+    repo = remote('a')
+    monkeypatch.chdir(repo)
+    write(repo, 'data/projections.csv', 'PLAYER,FPTS\nA,5\n')
+    commit_paths(['data/projections.csv'], 'Update')
+
+    # A hook that rejects every push
+    hook = os.path.join(remote.bare, 'hooks', 'pre-receive')
+    write(remote.bare, 'hooks/pre-receive', '#!/bin/sh\nexit 1\n')
+    os.chmod(hook, 0o755)
+
+    assert not push(attempts=2)
+    assert git_publish.pending_commits('origin/main') == 1
@@ -0,0 +1,80 @@
+import json
+
+from history_delta import DELTA_SUFFIX, apply_delta, make_delta, parse_table, render
+from history_store import HistoryStore
+
+
+HEADER = 'PLAYERID,PLAYER,TEAM,"SALARY, DK",FPTS'
+
+
+def csv_text(rows, newline='\n', trailing=True):
+    text = newline.join([HEADER] + rows)
+    return text + newline if trailing else text
+
+
+def round_trip(before, after):
+    parent, table = parse_table(before), parse_table(after)
+    delta = make_delta(parent, table)
+    assert delta is not None
+    # Deltas are stored as JSON, so the round trip must survive it
+    delta = json.loads(json.dumps(delta))
+    assert render(apply_delta(parent, delta)) == after
+    return delta
+
+
+BASE = [
+    '101,Jayson Tatum,BOS,"10,200",51.2',
+    '102,Jaylen Brown,BOS,"8,900",40.1',
+    '103,"Smith, Jr., Dennis",CHA,"4,100",18.7',
+]
+
+
+def test_changed_cells_round_trip_byte_for_byte():
+    after = [BASE[0].replace('51.2', '52.0'), BASE[1], BASE[2].replace('CHA', 'BKN')]
+    delta = round_trip(csv_text(BASE), csv_text(after))
+    assert delta['changed'] == {'101': {'4': '52.0'}, '103': {'2': 'BKN'}}
+    assert 'order' not in delta
+
+
+def test_added_and_removed_rows_round_trip():
+    after = [BASE[0], BASE[2], '104,Derrick White,BOS,"6,300",30.4']
+    delta = round_trip(csv_text(BASE), csv_text(after))
+    assert delta['removed'] == ['102']
+    assert list(delta['added']) == ['104']
+
+
+def test_reordered_rows_record_their_order():
+    after = [BASE[2], BASE[0], BASE[1]]
+    delta = round_trip(csv_text(BASE), csv_text(after))
+    assert delta['order'] == ['103', '101', '102']
+
+
+def test_newline_style_trailing_newline_and_row_width_round_trip():
+    before = csv_text(BASE, newline='\r\n')
+    after = csv_text([BASE[0] + ',extra', BASE[1], BASE[2]], newline='\r\n', trailing=False)
+    delta = round_trip(before, after)
+    assert (delta['newline'], delta['trailing']) == ('\r\n', False)
+    # A row that changed width is stored whole
+    assert list(delta['changed']['101']) == ['*']
+
+
+def test_blank_and_repeated_keys_stay_addressable():
+    before = csv_text(BASE + [',Unknown,BOS,0,0', '101,Jayson Tatum,BOS,"10,200",51.2'])
+    after = csv_text(BASE + [',Unknown,BOS,0,1.5', '101,Jayson Tatum,BOS,"10,200",49.9'])
+    round_trip(before, after)
+
+
+def test_history_store_reads_delta_chains_back_exactly(tmp_path):
+    store = HistoryStore(str(tmp_path / 'history'), columnar_dir=str(tmp_path / 'columnar'))
+    payloads = [csv_text(BASE + [f'{200 + i},Bench Player {i},BOS,"3,000",5.0' for i in range(40)])]
+    payloads.append(payloads[0].replace('51.2', '50.8'))
+    payloads.append(payloads[1].replace('"8,900",40.1', '"8,900",41.3').replace('CHA', 'BKN'))
+
+    stored = []
+    for i, payload in enumerate(payloads):
+        path, written, _files = store.save('rotogrinders_nba', payload, f'2026-01-01_1{i}-00')
+        assert written
+        stored.append(path)
+
+    assert [p.endswith(DELTA_SUFFIX) for p in stored] == [False, True, True]
+    assert [store.read(p) for p in stored] == payloads
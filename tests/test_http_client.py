@@ -0,0 +1,65 @@
+from http_client import NOT_MODIFIED, ConditionalFetcher
+
+
+class Response:
+    def __init__(self, status_code, text='', headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self.history = []
+
+
+class Session:
+    """Serves one CSV with an ETag, answering 304 when the client sends it"""
+
+    def __init__(self, text, etag='"v1"'):
+        self.text, self.etag = text, etag
+        self.sent = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent.append(dict(headers or {}))
+        if (headers or {}).get('If-None-Match') == self.etag:
+            return Response(304)
+        return Response(200, self.text, {'ETag': self.etag})
+
+
+URL = 'https://example.com/projections.csv'
+CSV = 'PLAYER,FPTS\r\nJayson Tatum,51.2\r\n'
+
+
+def fetcher(tmp_path, session):
+    return ConditionalFetcher(str(tmp_path / 'validators.json'), session)
+
+
+def test_not_modified_when_the_local_copy_matches(tmp_path):
+    current = tmp_path / 'rotogrinders_nba.csv'
+    session = Session(CSV)
+    first = fetcher(tmp_path, session)
+    assert first.get(URL, current_path=str(current))[1] == CSV
+    current.write_bytes(CSV.encode('utf-8'))
+    first.save()
+
+    # The next run loads the saved validators
+    assert fetcher(tmp_path, session).get(URL, current_path=str(current))[1] is NOT_MODIFIED
+    assert session.sent[-1] == {'If-None-Match': '"v1"'}
+
+
+def test_refetches_when_the_published_copy_was_lost(tmp_path):
+    current = tmp_path / 'rotogrinders_nba.csv'
+    current.write_bytes(b'PLAYER,FPTS\r\nJayson Tatum,48.0\r\n')
+    session = Session(CSV)
+    first = fetcher(tmp_path, session)
+    first.get(URL, current_path=str(current))
+    # The run saved validators but its commit never reached the remote,
+    # so the next checkout still has the older file
+    first.save()
+
+    assert fetcher(tmp_path, session).get(URL, current_path=str(current))[1] == CSV
+    assert session.sent[-1] == {}
+
+
+def test_without_a_current_path_validators_are_always_sent(tmp_path):
+    session = Session(CSV)
+    first = fetcher(tmp_path, session)
+    first.get(URL)
+    assert first.get(URL)[1] is NOT_MODIFIED
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from line_movement import diff_frames
+
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=['player', 'team', 'stat', 'value'])
+
+
+def test_same_named_players_on_different_teams_move_separately():
+    previous = frame([
+        ('Sebastian Aho', 'CAR', 'goals', 0.45),
+        ('Sebastian Aho', 'NYI', 'goals', 0.05),
+    ])
+    current = frame([
+        ('Sebastian Aho', 'CAR', 'goals', 0.52),
+        ('Sebastian Aho', 'NYI', 'goals', 0.05),
+    ])
+    assert diff_frames(previous, current) == [['Sebastian Aho', 'CAR', 'goals', 0.45, 0.52]]
+
+
+def test_added_and_dropped_players_keep_their_team():
+    previous = frame([('Jayson Tatum', 'BOS', 'pts', 27.5), ('Jaylen Brown', 'BOS', 'pts', 22.0)])
+    current = frame([('Jayson Tatum', 'BOS', 'pts', 27.5), ('Derrick White', 'BOS', 'pts', 15.1)])
+    assert sorted(diff_frames(previous, current)) == [
+        ['Derrick White', 'BOS', 'pts', None, 15.1],
+        ['Jaylen Brown', 'BOS', 'pts', 22.0, None],
+    ]
+
+
+def test_missing_teams_still_match():
+    previous = frame([('Connor McDavid', None, 'points', 1.6)])
+    current = frame([('Connor McDavid', None, 'points', 1.7)])
+    assert diff_frames(previous, current) == [['Connor McDavid', None, 'points', 1.6, 1.7]]
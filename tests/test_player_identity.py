@@ -0,0 +1,32 @@
+from player_identity import PlayerIdentityIndex
+
+
+def index(tmp_path):
+    return PlayerIdentityIndex(str(tmp_path / 'player_identity.json'))
+
+
+def test_exact_name_on_another_team_is_a_different_player(tmp_path):
+    players = index(tmp_path)
+    wilson = players.resolve('rotogrinders', 'nfl', 'Michael Wilson', 'ARI', 'WR')
+
+    assert players.resolve('stokastic', 'nfl', 'Michael Wilson', 'LAC', 'WR') != wilson
+    assert players.resolve('stokastic', 'nfl', 'Michael Wilson', 'ARI', 'WR') == wilson
+
+
+def test_exact_name_matches_when_either_team_is_unknown(tmp_path):
+    players = index(tmp_path)
+    tatum = players.resolve('rotogrinders', 'nba', 'Jayson Tatum', 'BOS')
+    assert players.resolve('rotowire', 'nba', 'Jayson Tatum') == tatum
+
+    brown = players.resolve('dimers', 'nba', 'Jaylen Brown')
+    assert players.resolve('stokastic', 'nba', 'Jaylen Brown', 'BOS') == brown
+
+
+def test_fuzzy_names_match_within_the_team_but_not_a_teammate_the_source_names(tmp_path):
+    players = index(tmp_path)
+    curry = players.resolve('rotogrinders', 'nba', 'Stephen Curry', 'GSW', 'PG')
+    assert players.resolve('dimers', 'nba', 'Steph Curry', 'GS') == curry
+
+    jalen = players.resolve('rotogrinders', 'nba', 'Jalen Williams', 'OKC')
+    jaylin = players.resolve('rotogrinders', 'nba', 'Jaylin Williams', 'OKC')
+    assert jaylin != jalen
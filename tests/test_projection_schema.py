@@ -0,0 +1,24 @@
+import projection_schema
+from projection_schema import CanonicalCache
+
+
+CSV = 'PLAYER,TEAM,OPP,PTS,REB\nJayson Tatum,BOS,NYK,27.5,8.1\n'
+
+
+def test_cached_tables_are_rebuilt_when_the_schema_changes(tmp_path, monkeypatch):
+    loads = []
+
+    def load():
+        loads.append(1)
+        return CSV
+
+    frame = CanonicalCache(str(tmp_path)).payload_frame('rotogrinders_nba', 'a' * 64, load)
+    assert sorted(frame['stat']) == ['pts', 'reb']
+
+    # A fresh process with the same schema reads the pickle
+    CanonicalCache(str(tmp_path)).payload_frame('rotogrinders_nba', 'a' * 64, load)
+    assert len(loads) == 1
+
+    monkeypatch.setattr(projection_schema, 'SCHEMA_KEY', 'changed0')
+    CanonicalCache(str(tmp_path)).payload_frame('rotogrinders_nba', 'a' * 64, load)
+    assert len(loads) == 2
@@ -0,0 +1,71 @@
+from io import StringIO
+
+from projection_schema import build_canonical
+from rotowire_parser import RotowireReader, load_rotowire, read_rotowire
+
+
+NFL = (
+    '\ufeff,,,Week 16 Game,,,,Fantasy,Passing,,,,,,Rushing,,\n'
+    'Rank,Name,Team,OPP,Fav,Spread,O/U,Points,COMP,ATT,PCT,YDS,TD,INT,ATT,YDS,TD\n'
+    '1,Josh Allen,BUF,CLE,BUF,-10.5,41.0,25.05,18.73,29.14,64.3,219.15,1.85,0.68,6.50,35.36,0.64\n'
+    '\n'
+    '2,Jalen Hurts,PHI,WAS,PHI,-7.0,43.5,24.89,18.52,28.61,64.7,232.58,1.82,0.57,,32.52\n'
+)
+
+NHL = (
+    '\ufeff,,,Overall,,,,,,,PP,,SH,,Defense,\n'
+    'Player Name,Team,Pos,G,A,Pts,+/-,PIM,SOG,GWG,G,A,G,A,Hits,BS\n'
+    'Connor McDavid,EDM,C,0.55,1.05,1.60,0.3,0.4,3.6,0.1,0.18,0.52,0.01,0.00,0.6,0.4\n'
+)
+
+
+def test_group_row_merges_into_qualified_names():
+    header, rows = read_rotowire(NFL)
+    assert header == [
+        'Rank', 'Name', 'Team', 'Game/OPP', 'Game/Fav', 'Game/Spread', 'Game/O/U', 'Fantasy/Points',
+        'Passing/COMP', 'Passing/ATT', 'Passing/PCT', 'Passing/YDS', 'Passing/TD', 'Passing/INT',
+        'Rushing/ATT', 'Rushing/YDS', 'Rushing/TD',
+    ]
+    # Blank lines are skipped and short rows padded to the header width
+    assert [row[1] for row in rows] == ['Josh Allen', 'Jalen Hurts']
+    assert rows[1][-3:] == ['', '32.52', '']
+
+
+def test_repeated_group_columns_stay_distinct():
+    header, _rows = read_rotowire(NHL)
+    assert header[:3] == ['Player Name', 'Team', 'Pos']
+    assert header[10:14] == ['PP/G', 'PP/A', 'SH/G', 'SH/A']
+    assert len(set(header)) == len(header)
+
+
+def test_header_without_group_row_passes_through():
+    header, rows = read_rotowire('\ufeffName,Team,PTS\nJayson Tatum,BOS,27.5\n')
+    assert header == ['Name', 'Team', 'PTS']
+    assert rows == [['Jayson Tatum', 'BOS', '27.5']]
+
+
+def test_streamed_rows_are_typed():
+    reader = RotowireReader(StringIO(NFL))
+    rows = list(reader)
+    assert rows[0][:4] == [1.0, 'Josh Allen', 'BUF', 'CLE']
+    assert rows[1][14] is None
+
+
+def test_load_rotowire_infers_numeric_columns(tmp_path):
+    path = tmp_path / 'rotowire_nfl.csv'
+    path.write_text(NFL, encoding='utf-8')
+    frame = load_rotowire(str(path))
+    assert frame['Passing/YDS'].dtype == 'float64'
+    assert frame['Passing/YDS'].tolist() == [219.15, 232.58]
+
+
+def test_canonical_table_maps_qualified_names():
+    frame = build_canonical('rotowire_nfl', NFL)
+    allen = frame[frame['player'] == 'Josh Allen']
+    values = dict(zip(allen['stat'], allen['value']))
+    assert allen['opp'].unique().tolist() == ['CLE']
+    assert (values['pass_yds'], values['rush_yds']) == (219.15, 35.36)
+
+    nhl = build_canonical('rotowire_nhl', NHL)
+    values = dict(zip(nhl['stat'], nhl['value']))
+    assert (values['goals'], values['pp_goals']) == (0.55, 0.18)
@@ -0,0 +1,40 @@
+import os
+
+import scrape_orchestrator
+from history_store import HistoryStore
+from scrape_orchestrator import ScrapeOrchestrator
+
+
+NBA = 'PLAYER,TEAM,FPTS\nJayson Tatum,BOS,51.2\n'
+NHL = 'Player,Team,FPTS\nConnor McDavid,EDM,24.1\n'
+
+
+def test_current_csvs_are_published_by_their_snapshot_save(tmp_path, monkeypatch):
+    published = []
+    monkeypatch.setattr(scrape_orchestrator, 'publish_file', lambda path, content: published.append(path))
+    data_dir = str(tmp_path / 'data')
+
+    written = ScrapeOrchestrator({}, data_dir=data_dir).write_payloads({
+        'rotogrinders_nba.csv': NBA,
+        'history/rotogrinders_nba_2026-01-01_10-00.csv.gz': NBA,
+        # The NHL skater feed publishes to a current file with a shorter name
+        'stokastic_nhl.csv': NHL,
+        'history/stokastic_nhl_skater_2026-01-01_10-05.csv.gz': NHL,
+    })
+
+    assert published == []
+    for name, content in (('rotogrinders_nba.csv', NBA), ('stokastic_nhl.csv', NHL)):
+        path = os.path.join(data_dir, name)
+        assert path in written
+        with open(path, 'r', encoding='utf-8') as f:
+            assert f.read() == content
+
+    snapshots = HistoryStore(os.path.join(data_dir, 'history')).snapshots()
+    assert [(name, ts) for name, ts, _path in snapshots] == [
+        ('rotogrinders_nba', '2026-01-01_10-00'), ('stokastic_nhl_skater', '2026-01-01_10-05')]
+
+
+def test_current_csv_without_a_snapshot_is_still_published(tmp_path):
+    data_dir = str(tmp_path / 'data')
+    written = ScrapeOrchestrator({}, data_dir=data_dir).write_payloads({'dimers_nba.csv': NBA})
+    assert written == [os.path.join(data_dir, 'dimers_nba.csv')]
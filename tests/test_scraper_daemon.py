@@ -0,0 +1,32 @@
+import argparse
+from datetime import datetime
+
+import pytest
+
+from scraper_daemon import ScraperDaemon, parse_hours
+
+
+def daemon(hours, tmp_path):
+    return ScraperDaemon({}, [], interval_minutes=15, active_hours=hours,
+                         status_file=str(tmp_path / 'status.json'))
+
+
+def test_overnight_hours_wrap_past_midnight(tmp_path):
+    d = daemon(parse_hours('22-2'), tmp_path)
+    assert d.in_active_hours(datetime(2026, 1, 1, 23, 0))
+    assert d.in_active_hours(datetime(2026, 1, 1, 1, 30))
+    assert not d.in_active_hours(datetime(2026, 1, 1, 12, 0))
+
+    assert d.next_run_after(datetime(2026, 1, 1, 2, 50)) == datetime(2026, 1, 1, 22, 0)
+    assert d.next_run_after(datetime(2026, 1, 1, 23, 0)) == datetime(2026, 1, 1, 23, 15)
+
+
+def test_daytime_hours_skip_to_next_morning(tmp_path):
+    d = daemon(parse_hours('13-23'), tmp_path)
+    assert d.next_run_after(datetime(2026, 1, 1, 23, 50)) == datetime(2026, 1, 2, 13, 0)
+
+
+@pytest.mark.parametrize('value', ['13-24', '-1-5', 'noon-5', '5'])
+def test_parse_hours_rejects_bad_ranges(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_hours(value)
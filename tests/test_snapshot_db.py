@@ -0,0 +1,77 @@
+import json
+import os
+
+import pytest
+
+from history_archive import archive_for
+from history_store import HistoryStore
+from snapshot_db import SnapshotDB
+
+
+def write_history(history_dir, count):
+    store = HistoryStore(str(history_dir), columnar_dir=str(history_dir.parent / 'columnar'))
+    for i in range(count):
+        store.save('stokastic_nba', f'Player,Team,FPTS\nPlayer {i},BOS,{20 + i}\n', f'2026-01-0{i + 1}_10-00')
+    return store
+
+
+def ingested(db):
+    return db.conn.execute('SELECT COUNT(*) FROM ingested_files').fetchone()[0]
+
+
+def test_interrupted_backfill_resumes_after_last_committed_batch(tmp_path, monkeypatch):
+    history_dir = tmp_path / 'history'
+    write_history(history_dir, 5)
+    db = SnapshotDB(str(tmp_path / 'snapshots.db'))
+
+    store_payload = SnapshotDB.store_payload
+    calls = []
+
+    def failing_store_payload(self, sha256, header, rows):
+        calls.append(sha256)
+        if len(calls) == 4:
+            raise KeyboardInterrupt
+        store_payload(self, sha256, header, rows)
+
+    monkeypatch.setattr(SnapshotDB, 'store_payload', failing_store_payload)
+    with pytest.raises(KeyboardInterrupt):
+        db.backfill(str(history_dir), workers=1, batch_size=2)
+    db.conn.rollback()
+
+    # The first batch of two payloads was committed with its files
+    assert ingested(db) == 2
+    assert len(db.pending_files(sorted(str(history_dir / f) for f in os.listdir(history_dir)
+                                       if f.endswith('.gz')))) == 3
+
+    monkeypatch.setattr(SnapshotDB, 'store_payload', store_payload)
+    stats = db.backfill(str(history_dir), workers=1, batch_size=2)
+    assert stats['files'] == 3
+    assert ingested(db) == 5
+    db.close()
+
+
+def test_fresh_backfill_ingests_archived_history(tmp_path):
+    history_dir = tmp_path / 'history'
+    write_history(history_dir, 3)
+    archive_for(str(history_dir)).archive(older_than_days=0)
+    assert not [f for f in os.listdir(history_dir) if f.endswith('.gz')]
+
+    db = SnapshotDB(str(tmp_path / 'snapshots.db'))
+    stats = db.backfill(str(history_dir), workers=1)
+    assert stats == {'files': 3, 'new_payloads': 3, 'snapshots': 3}
+    assert db.backfill(str(history_dir), workers=1)['files'] == 0
+    db.close()
+
+
+def test_dimers_columns_get_positional_names(tmp_path):
+    history_dir = tmp_path / 'history'
+    store = HistoryStore(str(history_dir), columnar_dir=str(tmp_path / 'columnar'))
+    store.save('dimers_nfl', 'First Name,Last Name,Team,CMP,YDS,YDS,REC,YDS,1+\n'
+                             'Jahmyr,Gibbs,DET,0,0,77.41,5.07,43.13,66.84%\n', '2026-01-01_10-00')
+
+    db = SnapshotDB(str(tmp_path / 'snapshots.db'))
+    db.backfill(str(history_dir), workers=1)
+    (columns,) = db.conn.execute('SELECT columns FROM payloads').fetchone()
+    assert json.loads(columns)[3:] == ['Passing/CMP', 'Passing/YDS', 'Rushing/YDS', 'Receiving/REC',
+                                       'Receiving/YDS', 'TD/1+']
+    db.close()